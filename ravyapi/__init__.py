@@ -17,4 +17,10 @@ from __future__ import annotations
 
 from ravyapi._about import *
 from ravyapi.api import *
+from ravyapi.cache import *
 from ravyapi.client import *
+from ravyapi.connections import *
+from ravyapi.ratelimits import *
+from ravyapi.retries import *
+from ravyapi.serialization import *
+from ravyapi.tables import *
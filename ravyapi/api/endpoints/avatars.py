@@ -91,7 +91,8 @@ class Avatars(HTTPAwareEndpoint):
                         "threshold": threshold,
                         "method": method,
                     },
-                )
+                ),
+                keep_raw=self._http.keep_raw,
             )
 
         data = aiohttp.FormData()
@@ -105,5 +106,6 @@ class Avatars(HTTPAwareEndpoint):
                     "method": method,
                 },
                 data=data,
-            )
+            ),
+            keep_raw=self._http.keep_raw,
         )
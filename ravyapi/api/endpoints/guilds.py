@@ -19,7 +19,7 @@ __all__: tuple[str, ...] = ("Guilds",)
 
 from ravyapi.api.models import GetGuildResponse
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import with_cache, with_permission_check
 
 
 class Guilds(HTTPAwareEndpoint):
@@ -28,6 +28,7 @@ class Guilds(HTTPAwareEndpoint):
     __slots__: tuple[str, ...] = ()
 
     @with_permission_check("guilds")
+    @with_cache("guilds")
     async def get_guild(self: HTTPAwareEndpoint, guild_id: int) -> GetGuildResponse:
         """Get extensive guild information.
 
@@ -53,5 +54,6 @@ class Guilds(HTTPAwareEndpoint):
         return GetGuildResponse(
             await self._http.get(
                 self._http.paths.guilds(guild_id).route,
-            )
+            ),
+            keep_raw=self._http.keep_raw,
         )
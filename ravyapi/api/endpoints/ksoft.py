@@ -19,7 +19,7 @@ __all__: tuple[str, ...] = ("KSoft",)
 
 from ravyapi.api.models import GetKSoftBanResponse
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import with_cache, with_permission_check
 
 
 class KSoft(HTTPAwareEndpoint):
@@ -28,6 +28,7 @@ class KSoft(HTTPAwareEndpoint):
     __slots__: tuple[str, ...] = ()
 
     @with_permission_check("ksoft.bans")
+    @with_cache("ksoft.bans")
     async def get_ban(self: HTTPAwareEndpoint, user_id: int) -> GetKSoftBanResponse:
         """Get ban status.
 
@@ -53,5 +54,6 @@ class KSoft(HTTPAwareEndpoint):
         return GetKSoftBanResponse(
             await self._http.get(
                 self._http.paths.ksoft.bans(user_id),
-            )
+            ),
+            keep_raw=self._http.keep_raw,
         )
@@ -35,4 +35,7 @@ class Tokens(HTTPAwareEndpoint):
             A model response from `ravyapi.api.endpoints.tokens.Tokens.get_token`.
             Located as `ravyapi.api.models.tokens.GetTokenResponse`.
         """
-        return GetTokenResponse(await self._http.get(self._http.paths.tokens.route))
+        return GetTokenResponse(
+            await self._http.get(self._http.paths.tokens.route),
+            keep_raw=self._http.keep_raw,
+        )
@@ -22,7 +22,7 @@ from typing import Any
 
 from ravyapi.api.models import EditWebsiteRequest, GetWebsiteResponse
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import with_cache, with_permission_check
 
 
 class URLs(HTTPAwareEndpoint):
@@ -31,6 +31,7 @@ class URLs(HTTPAwareEndpoint):
     __slots__: tuple[str, ...] = ()
 
     @with_permission_check("urls.cached")
+    @with_cache("urls")
     async def get_website(
         self: HTTPAwareEndpoint,
         url: str,
@@ -92,7 +93,8 @@ class URLs(HTTPAwareEndpoint):
             params["phisherman_user"] = phisherman_user
 
         return GetWebsiteResponse(
-            await self._http.get(self._http.paths.urls.route, params=params)
+            await self._http.get(self._http.paths.urls.route, params=params),
+            keep_raw=self._http.keep_raw,
         )
 
     @with_permission_check("admin.urls")
@@ -106,6 +108,8 @@ class URLs(HTTPAwareEndpoint):
     ) -> None:
         """Edit website information.
 
+        Cached responses of the website are removed once the new information is set.
+
         Parameters
         ----------
         url : str
@@ -142,10 +146,15 @@ class URLs(HTTPAwareEndpoint):
         if not isinstance(encode, bool):
             raise TypeError('Parameter "encode" must be of type "bool"')
 
-        if encode:
-            message = urllib.parse.quote_plus(message)
-
         await self._http.post(
             f"{self._http.paths.urls.route}/{url}",
-            json=EditWebsiteRequest(is_fraudulent, message).to_json(),
+            json=EditWebsiteRequest(
+                is_fraudulent, urllib.parse.quote_plus(message) if encode else message
+            ).to_json(),
         )
+
+        cache = self._http.cache
+
+        if cache is not None:
+            # the API decides how the message is stored, so it is looked up again
+            cache.invalidate("urls", url)
@@ -17,6 +17,19 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Users",)
 
+import asyncio
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    TypeVar,
+)
+
+from ravyapi.api.errors import HTTPError
 from ravyapi.api.models import (
     BanEntryRequest,
     GetBansResponse,
@@ -24,9 +37,47 @@ from ravyapi.api.models import (
     GetReputationResponse,
     GetUserResponse,
     GetWhitelistsResponse,
+    UserLookup,
 )
+from ravyapi.const import BULK_CONCURRENCY
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import with_permission_check
+from ravyapi.utils import (
+    gather_bounded,
+    has_permissions,
+    iter_bounded,
+    validate_concurrency,
+    with_cache,
+    with_permission_check,
+)
+
+_ResponseT = TypeVar("_ResponseT")
+
+
+def _from_user(
+    response: Callable[..., _ResponseT], *fields: str
+) -> Callable[[HTTPAwareEndpoint, GetUserResponse], _ResponseT]:
+    """Build a function deriving a sub-resource response from a full user response."""
+
+    def derive(endpoint: HTTPAwareEndpoint, user: GetUserResponse) -> _ResponseT:
+        data = user.data
+        return response(
+            {field: data[field] for field in fields}, keep_raw=endpoint._http.keep_raw
+        )
+
+    return derive
+
+
+_PRONOUNS_FROM_USER = _from_user(GetPronounsResponse, "pronouns")
+_BANS_FROM_USER = _from_user(GetBansResponse, "trust", "bans")
+_WHITELISTS_FROM_USER = _from_user(GetWhitelistsResponse, "whitelists", "trust")
+_REPUTATION_FROM_USER = _from_user(GetReputationResponse, "rep", "trust")
+
+_LOOKUPS: dict[str, tuple[str, Callable[[HTTPAwareEndpoint, GetUserResponse], Any]]] = {
+    "pronouns": ("get_pronouns", _PRONOUNS_FROM_USER),
+    "bans": ("get_bans", _BANS_FROM_USER),
+    "whitelists": ("get_whitelists", _WHITELISTS_FROM_USER),
+    "rep": ("get_reputation", _REPUTATION_FROM_USER),
+}
 
 
 class Users(HTTPAwareEndpoint):
@@ -35,6 +86,7 @@ class Users(HTTPAwareEndpoint):
     __slots__: tuple[str, ...] = ()
 
     @with_permission_check("users")
+    @with_cache("users")
     async def get_user(self: HTTPAwareEndpoint, user_id: int) -> GetUserResponse:
         """Get extensive user information.
 
@@ -57,11 +109,16 @@ class Users(HTTPAwareEndpoint):
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetUserResponse(
-            await self._http.get(self._http.paths.users(user_id).route)
+        return await self._http.get_model(
+            self._http.paths.users(user_id).route, GetUserResponse
         )
 
     @with_permission_check("users.pronouns")
+    @with_cache(
+        "users.pronouns",
+        source="users",
+        derive=_PRONOUNS_FROM_USER,
+    )
     async def get_pronouns(
         self: HTTPAwareEndpoint, user_id: int
     ) -> GetPronounsResponse:
@@ -86,11 +143,16 @@ class Users(HTTPAwareEndpoint):
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetPronounsResponse(
-            await self._http.get(self._http.paths.users(user_id).pronouns)
+        return await self._http.get_model(
+            self._http.paths.users(user_id).pronouns, GetPronounsResponse
         )
 
     @with_permission_check("users.bans")
+    @with_cache(
+        "users.bans",
+        source="users",
+        derive=_BANS_FROM_USER,
+    )
     async def get_bans(self: HTTPAwareEndpoint, user_id: int) -> GetBansResponse:
         """Get bans.
 
@@ -113,8 +175,8 @@ class Users(HTTPAwareEndpoint):
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetBansResponse(
-            await self._http.get(self._http.paths.users(user_id).bans)
+        return await self._http.get_model(
+            self._http.paths.users(user_id).bans, GetBansResponse
         )
 
     @with_permission_check("admin.bans")
@@ -129,6 +191,9 @@ class Users(HTTPAwareEndpoint):
     ) -> None:
         """Add ban.
 
+        Cached responses containing the bans or trust of the user are removed once the
+        ban is added.
+
         Parameters
         ----------
         user_id : int
@@ -178,7 +243,18 @@ class Users(HTTPAwareEndpoint):
             json=BanEntryRequest(provider, reason, moderator, reason_key).to_json(),
         )
 
+        cache = self._http.cache
+
+        if cache is not None:
+            for name in ("users", "users.bans", "users.rep", "users.whitelists"):
+                cache.invalidate(name, user_id)
+
     @with_permission_check("users.whitelists")
+    @with_cache(
+        "users.whitelists",
+        source="users",
+        derive=_WHITELISTS_FROM_USER,
+    )
     async def get_whitelists(
         self: HTTPAwareEndpoint, user_id: int
     ) -> GetWhitelistsResponse:
@@ -203,11 +279,16 @@ class Users(HTTPAwareEndpoint):
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetWhitelistsResponse(
-            await self._http.get(self._http.paths.users(user_id).whitelists)
+        return await self._http.get_model(
+            self._http.paths.users(user_id).whitelists, GetWhitelistsResponse
         )
 
     @with_permission_check("users.rep")
+    @with_cache(
+        "users.rep",
+        source="users",
+        derive=_REPUTATION_FROM_USER,
+    )
     async def get_reputation(
         self: HTTPAwareEndpoint, user_id: int
     ) -> GetReputationResponse:
@@ -232,6 +313,259 @@ class Users(HTTPAwareEndpoint):
         if not isinstance(user_id, int):
             raise TypeError('Parameter "user_id" must be of type "int"')
 
-        return GetReputationResponse(
-            await self._http.get(self._http.paths.users(user_id).reputation)
+        return await self._http.get_model(
+            self._http.paths.users(user_id).reputation, GetReputationResponse
         )
+
+    async def lookup(self, user_id: int, want: Collection[str]) -> UserLookup:
+        """Get several sub-resources of a user with as few requests as possible.
+
+        If more than one sub-resource is wanted and the token has the `users`
+        permission, a single `ravyapi.api.endpoints.users.Users.get_user` request is
+        made and every sub-resource is taken from it. Otherwise the sub-resources are
+        looked up concurrently from their own routes, each requiring its own permission.
+
+        Parameters
+        ----------
+        user_id : int
+            User ID of the user to look up.
+        want : Collection[str]
+            The sub-resources to look up, any of `pronouns`, `bans`, `whitelists` and `rep`.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        UserLookup
+            The model with the response of the endpoint of each wanted sub-resource, such
+            as `ravyapi.api.models.users.GetBansResponse` for `bans`, and `None` for the others.
+        """
+        if not isinstance(user_id, int):
+            raise TypeError('Parameter "user_id" must be of type "int"')
+
+        if isinstance(want, str) or not all(isinstance(name, str) for name in want):
+            raise TypeError('Parameter "want" must only contain type "str"')
+
+        if not want:
+            raise ValueError('Parameter "want" must not be empty')
+
+        if not set(want).issubset(_LOOKUPS):
+            raise ValueError(
+                'Parameter "want" must only contain "pronouns", "bans", "whitelists" or "rep"'
+            )
+
+        names = list(dict.fromkeys(want))
+        await self._http.get_permissions()
+        permissions = self._http.permissions
+
+        if (
+            len(names) > 1
+            and permissions is not None
+            and has_permissions("users", permissions)
+        ):
+            user = await self.get_user(user_id)
+            return UserLookup(**{name: _LOOKUPS[name][1](self, user) for name in names})
+
+        responses = await asyncio.gather(
+            *(getattr(self, _LOOKUPS[name][0])(user_id) for name in names)
+        )
+        return UserLookup(**dict(zip(names, responses)))
+
+    async def get_users(
+        self, user_ids: Iterable[int], *, concurrency: int = BULK_CONCURRENCY
+    ) -> dict[int, GetUserResponse | HTTPError]:
+        """Get extensive user information for many users concurrently.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetUserResponse | HTTPError]
+            A mapping of each user ID to its `ravyapi.api.endpoints.users.Users.get_user` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up.
+        """
+        return await self._bulk(self.get_user, user_ids, concurrency)
+
+    async def iter_users(
+        self,
+        user_ids: Iterable[int] | AsyncIterable[int],
+        *,
+        concurrency: int = BULK_CONCURRENCY,
+    ) -> AsyncIterator[tuple[int, GetUserResponse | HTTPError]]:
+        """Stream extensive user information for many users as each lookup completes.
+
+        User IDs are consumed lazily, so at most `concurrency` requests are in flight
+        or waiting to be consumed at once, regardless of how many IDs are passed.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int] | AsyncIterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight or buffered at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Yields
+        ------
+        tuple[int, GetUserResponse | HTTPError]
+            Each user ID paired with its `ravyapi.api.endpoints.users.Users.get_user` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up, in completion order.
+        """
+        validate_concurrency(concurrency)
+
+        async for result in iter_bounded(user_ids, self._get_user_strict, concurrency):
+            yield result
+
+    async def get_pronouns_bulk(
+        self, user_ids: Iterable[int], *, concurrency: int = BULK_CONCURRENCY
+    ) -> dict[int, GetPronounsResponse | HTTPError]:
+        """Get pronouns for many users concurrently.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetPronounsResponse | HTTPError]
+            A mapping of each user ID to its `ravyapi.api.endpoints.users.Users.get_pronouns` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up.
+        """
+        return await self._bulk(self.get_pronouns, user_ids, concurrency)
+
+    async def get_bans_bulk(
+        self, user_ids: Iterable[int], *, concurrency: int = BULK_CONCURRENCY
+    ) -> dict[int, GetBansResponse | HTTPError]:
+        """Get bans for many users concurrently.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetBansResponse | HTTPError]
+            A mapping of each user ID to its `ravyapi.api.endpoints.users.Users.get_bans` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up.
+        """
+        return await self._bulk(self.get_bans, user_ids, concurrency)
+
+    async def get_whitelists_bulk(
+        self, user_ids: Iterable[int], *, concurrency: int = BULK_CONCURRENCY
+    ) -> dict[int, GetWhitelistsResponse | HTTPError]:
+        """Get whitelists for many users concurrently.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetWhitelistsResponse | HTTPError]
+            A mapping of each user ID to its `ravyapi.api.endpoints.users.Users.get_whitelists` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up.
+        """
+        return await self._bulk(self.get_whitelists, user_ids, concurrency)
+
+    async def get_reputation_bulk(
+        self, user_ids: Iterable[int], *, concurrency: int = BULK_CONCURRENCY
+    ) -> dict[int, GetReputationResponse | HTTPError]:
+        """Get reputation for many users concurrently.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            User IDs of the users to look up.
+        concurrency : int
+            The maximum number of requests in flight at once.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+
+        Returns
+        -------
+        dict[int, GetReputationResponse | HTTPError]
+            A mapping of each user ID to its `ravyapi.api.endpoints.users.Users.get_reputation` response,
+            or the `ravyapi.api.errors.HTTPError` raised while looking it up.
+        """
+        return await self._bulk(self.get_reputation, user_ids, concurrency)
+
+    async def _get_user_strict(self, user_id: int) -> GetUserResponse:
+        """Look up a single user of a streamed bulk lookup, validating its ID."""
+        if not isinstance(user_id, int):
+            raise TypeError('Parameter "user_ids" must only contain type "int"')
+
+        return await self.get_user(user_id)
+
+    @staticmethod
+    async def _bulk(
+        function: Callable[[int], Awaitable[_ResponseT]],
+        user_ids: Iterable[int],
+        concurrency: int,
+    ) -> dict[int, _ResponseT | HTTPError]:
+        """Validate the arguments of a bulk lookup and fan it out over `function`."""
+        user_ids = list(user_ids)
+
+        if not all(isinstance(user_id, int) for user_id in user_ids):
+            raise TypeError('Parameter "user_ids" must only contain type "int"')
+
+        validate_concurrency(concurrency)
+
+        return await gather_bounded(user_ids, function, concurrency)
@@ -204,15 +204,27 @@ class TooManyRequestsError(HTTPError):
     ----------
     exc_data : str | dict[str, Any]
         The error data returned by the Ravy API.
+    retry_after : float | None
+        The number of seconds the Ravy API asked to wait before retrying, if given.
     """
 
-    __slots__: tuple[str, ...] = ("_exc_data",)
+    __slots__: tuple[str, ...] = ("_exc_data", "_retry_after")
 
-    def __init__(self, exc_data: str | dict[str, Any]) -> None:
+    def __init__(
+        self, exc_data: str | dict[str, Any], retry_after: float | None = None
+    ) -> None:
         """
         Parameters
         ----------
         exc_data : str | dict[str, Any]
             The error data returned by the Ravy API.
+        retry_after : float | None
+            The number of seconds the Ravy API asked to wait before retrying, if given.
         """
         super().__init__(429, exc_data)
+        self._retry_after: float | None = retry_after
+
+    @property
+    def retry_after(self) -> float | None:
+        """The number of seconds the Ravy API asked to wait before retrying, if given."""
+        return self._retry_after
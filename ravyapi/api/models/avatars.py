@@ -26,7 +26,7 @@ class CheckAvatarResponse:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     matched: bool
         Whether the avatar was matched.
     key: str
@@ -37,8 +37,8 @@ class CheckAvatarResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_matched", "_key", "_similarity")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._matched: bool = data["matched"]
         self._key: str | None = data.get("key")
         self._similarity: float | None = data.get("similarity")
@@ -51,7 +51,18 @@ class CheckAvatarResponse:
 
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            data: dict[str, Any] = {"matched": self.matched}
+
+            if self.key is not None:
+                data["key"] = self.key
+
+            if self.similarity is not None:
+                data["similarity"] = self.similarity
+
+            return data
+
         return self._data
 
     @property
@@ -17,7 +17,11 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("BanEntryRequest", "BanEntryResponse")
 
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ravyapi.api.structs import BanEntryStruct
 
 
 class BanEntryResponse:
@@ -26,7 +30,7 @@ class BanEntryResponse:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     provider: str
         Source for where the user or guild was banned.
     reason: str
@@ -45,11 +49,14 @@ class BanEntryResponse:
         "_moderator",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._provider: str = sys.intern(data["provider"])
         self._reason: str = data["reason"]
-        self._reason_key: str | None = data.get("reason_key")
+        reason_key: str | None = data.get("reason_key")
+        self._reason_key: str | None = (
+            None if reason_key is None else sys.intern(reason_key)
+        )
         self._moderator: int = int(data["moderator"])
 
     def __repr__(self) -> str:
@@ -59,9 +66,45 @@ class BanEntryResponse:
             f"reason_key={self.reason_key!r}, moderator={self.moderator!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: BanEntryStruct) -> BanEntryResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : BanEntryStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        BanEntryResponse
+            The ban entry model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._provider = sys.intern(struct.provider)
+        self._reason = struct.reason
+        self._reason_key = (
+            None if struct.reason_key is None else sys.intern(struct.reason_key)
+        )
+        self._moderator = int(struct.moderator)
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            data: dict[str, Any] = {
+                "provider": self.provider,
+                "reason": self.reason,
+                "moderator": str(self.moderator),
+            }
+
+            if self.reason_key is not None:
+                data["reason_key"] = self.reason_key
+
+            return data
+
         return self._data
 
     @property
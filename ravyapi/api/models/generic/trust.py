@@ -17,7 +17,18 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("Trust",)
 
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Final
+
+if TYPE_CHECKING:
+    from ravyapi.api.structs import TrustStruct
+
+_SHARED_MAX: Final[int] = 256
+"""The maximum number of shared trust models, bounding unexpected labels."""
+
+_SHARED: dict[tuple[int, str], Trust] = {}
 
 
 class Trust:
@@ -26,7 +37,7 @@ class Trust:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     level: int
         From 0-6, higher is better, default is 3.
     label: str
@@ -35,10 +46,10 @@ class Trust:
 
     __slots__: tuple[str, ...] = ("_data", "_level", "_label")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._level: int = data["level"]
-        self._label: str = data["label"]
+        self._label: str = sys.intern(data["label"])
 
     def __repr__(self) -> str:
         return (
@@ -46,9 +57,68 @@ class Trust:
             f"(level={self.level!r}, label={self.label!r})"
         )
 
+    @classmethod
+    def from_data(cls, data: dict[str, Any], *, keep_raw: bool = True) -> Trust:
+        """Get a trust model for raw data, sharing one instance per level and label.
+
+        Trust models are immutable and come from a tiny vocabulary, so models of
+        many responses can share them. Raw data with any other keys is not shared.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The raw data returned from the Ravy API.
+        keep_raw : bool
+            Whether an unshared model keeps the raw data.
+
+        Returns
+        -------
+        Trust
+            A shared trust model, or a new one if the raw data has other keys.
+        """
+        if len(data) != 2:
+            return cls(data, keep_raw=keep_raw)
+
+        key = (data["level"], data["label"])
+        trust = _SHARED.get(key)
+
+        if trust is None:
+            trust = cls(data, keep_raw=False)
+
+            if len(_SHARED) < _SHARED_MAX:
+                _SHARED[key] = trust
+
+        return trust
+
+    @classmethod
+    def from_struct(cls, struct: TrustStruct) -> Trust:
+        """Get a trust model for a decoded struct, sharing one instance per level and label.
+
+        Parameters
+        ----------
+        struct : TrustStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        Trust
+            A shared trust model.
+        """
+        trust = _SHARED.get((struct.level, struct.label))
+
+        if trust is None:
+            trust = cls.from_data(
+                {"level": struct.level, "label": struct.label}, keep_raw=False
+            )
+
+        return trust
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {"level": self.level, "label": self.label}
+
         return self._data
 
     @property
@@ -28,7 +28,7 @@ class GetGuildResponse:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     trust: Trust
         The guild's `ravyapi.api.models.generic.trust.Trust` trust model.
     bans: list[BanEntryResponse]
@@ -37,11 +37,11 @@ class GetGuildResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_trust", "_bans")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._trust: Trust = Trust(data["trust"])
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._trust: Trust = Trust.from_data(data["trust"], keep_raw=keep_raw)
         self._bans: list[BanEntryResponse] = [
-            BanEntryResponse(ban) for ban in data["bans"]
+            BanEntryResponse(ban, keep_raw=keep_raw) for ban in data["bans"]
         ]
 
     def __repr__(self) -> str:
@@ -52,7 +52,13 @@ class GetGuildResponse:
 
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "trust": self.trust.data,
+                "bans": [ban.data for ban in self.bans],
+            }
+
         return self._data
 
     @property
@@ -26,7 +26,7 @@ class GetKSoftBanResponse:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     found: bool
         Whether the user was found in the database.
     user_id : int | None
@@ -57,8 +57,8 @@ class GetKSoftBanResponse:
         "_timestamp",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._found: bool = data["found"]
         user_id: str | None = data.get("id")
         self._user_id: int | None = int(user_id) if user_id else None
@@ -80,7 +80,26 @@ class GetKSoftBanResponse:
 
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                key: value
+                for key, value in (
+                    ("found", self.found),
+                    ("id", None if self.user_id is None else str(self.user_id)),
+                    ("tag", self.tag),
+                    ("reason", self.reason),
+                    ("proof", self.proof),
+                    (
+                        "moderator",
+                        None if self.moderator is None else str(self.moderator),
+                    ),
+                    ("severe", self.severe),
+                    ("timestamp", self.timestamp),
+                )
+                if value is not None
+            }
+
         return self._data
 
     @property
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("GetTokenResponse",)
 
+import sys
 from typing import Any
 
 from typing_extensions import Literal
@@ -28,7 +29,7 @@ class GetTokenResponse:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     user: str
         The user ID associated with the token.
     access: list[str]
@@ -47,10 +48,10 @@ class GetTokenResponse:
         "_token_type",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._user: int = int(data["user"])
-        self._access: list[str] = data["access"]
+        self._access: list[str] = [sys.intern(node) for node in data["access"]]
         self._application: int = int(data["application"])
         self._token_type: Literal["ravy", "ksoft"] = data["type"]
 
@@ -63,7 +64,15 @@ class GetTokenResponse:
 
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "user": str(self.user),
+                "access": self.access,
+                "application": str(self.application),
+                "type": self.token_type,
+            }
+
         return self._data
 
     @property
@@ -26,7 +26,7 @@ class GetWebsiteResponse:
     Attributes
     ----------
     data: dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     is_fraudulent: bool
         Whether the website is fraudulent.
     message: str
@@ -35,8 +35,8 @@ class GetWebsiteResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_is_fraudulent", "_message")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._is_fraudulent: bool = data["isFraudulent"]
         self._message: str = data["message"]
 
@@ -48,7 +48,10 @@ class GetWebsiteResponse:
 
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {"isFraudulent": self.is_fraudulent, "message": self.message}
+
         return self._data
 
     @property
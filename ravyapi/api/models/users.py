@@ -23,21 +23,39 @@ __all__: tuple[str, ...] = (
     "GetWhitelistsResponse",
     "ReputationEntry",
     "SentinelEntry",
+    "UserLookup",
     "WhitelistEntry",
 )
 
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
 
 from ravyapi.api.models.generic import BanEntryResponse, Trust
 
+if TYPE_CHECKING:
+    from ravyapi.api.structs import (
+        GetBansStruct,
+        GetPronounsStruct,
+        GetReputationStruct,
+        GetUserStruct,
+        GetWhitelistsStruct,
+        ReputationEntryStruct,
+        SentinelEntryStruct,
+        WhitelistEntryStruct,
+    )
+
 
 class GetUserResponse:
     """A model response from `ravyapi.api.endpoints.users.Users.get_user`.
 
+    Nested models are only built from the raw data when their attribute is first
+    accessed, and are reused afterwards. If the raw data is not kept they are built
+    right away instead.
+
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     pronouns : str
         The user's pronouns.
     trust : Trust
@@ -62,18 +80,24 @@ class GetUserResponse:
         "_sentinel",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._pronouns: str = data["pronouns"]
-        self._trust: Trust = Trust(data["trust"])
-        self._whitelists: list[WhitelistEntry] = [
-            WhitelistEntry(whitelist) for whitelist in data["whitelists"]
-        ]
-        self._bans: list[BanEntryResponse] = [
-            BanEntryResponse(ban) for ban in data["bans"]
-        ]
-        self._rep: list[ReputationEntry] = [ReputationEntry(rep) for rep in data["rep"]]
-        self._sentinel: SentinelEntry = SentinelEntry(data["sentinel"])
+        self._trust: Trust | None = None
+        self._whitelists: list[WhitelistEntry] | None = None
+        self._bans: list[BanEntryResponse] | None = None
+        self._rep: list[ReputationEntry] | None = None
+        self._sentinel: SentinelEntry | None = None
+
+        if not keep_raw:
+            self._trust = Trust.from_data(data["trust"], keep_raw=False)
+            self._whitelists = [
+                WhitelistEntry(whitelist, keep_raw=False)
+                for whitelist in data["whitelists"]
+            ]
+            self._bans = [BanEntryResponse(ban, keep_raw=False) for ban in data["bans"]]
+            self._rep = [ReputationEntry(rep, keep_raw=False) for rep in data["rep"]]
+            self._sentinel = SentinelEntry(data["sentinel"], keep_raw=False)
 
     def __repr__(self) -> str:
         return (
@@ -83,9 +107,45 @@ class GetUserResponse:
             f"rep={self.rep!r}, sentinel={self.sentinel!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: GetUserStruct) -> GetUserResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : GetUserStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        GetUserResponse
+            The user model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._pronouns = struct.pronouns
+        self._trust = Trust.from_struct(struct.trust)
+        self._whitelists = [
+            WhitelistEntry.from_struct(whitelist) for whitelist in struct.whitelists
+        ]
+        self._bans = [BanEntryResponse.from_struct(ban) for ban in struct.bans]
+        self._rep = [ReputationEntry.from_struct(rep) for rep in struct.rep]
+        self._sentinel = SentinelEntry.from_struct(struct.sentinel)
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "pronouns": self.pronouns,
+                "trust": self.trust.data,
+                "whitelists": [whitelist.data for whitelist in self.whitelists],
+                "bans": [ban.data for ban in self.bans],
+                "rep": [rep.data for rep in self.rep],
+                "sentinel": self.sentinel.data,
+            }
+
         return self._data
 
     @property
@@ -96,26 +156,43 @@ class GetUserResponse:
     @property
     def trust(self) -> Trust:
         """The user's `ravyapi.api.models.generic.trust.Trust` trust model."""
+        if self._trust is None:
+            self._trust = Trust.from_data(self.data["trust"])
+
         return self._trust
 
     @property
     def whitelists(self) -> list[WhitelistEntry]:
         """A list of the user's `ravyapi.api.models.users.WhitelistEntry` whitelist models."""
+        if self._whitelists is None:
+            self._whitelists = [
+                WhitelistEntry(whitelist) for whitelist in self.data["whitelists"]
+            ]
+
         return self._whitelists
 
     @property
     def bans(self) -> list[BanEntryResponse]:
         """A list of the user's `ravyapi.api.models.generic.ban_entry.BanEntryResponse` ban models."""
+        if self._bans is None:
+            self._bans = [BanEntryResponse(ban) for ban in self.data["bans"]]
+
         return self._bans
 
     @property
     def rep(self) -> list[ReputationEntry]:
         """A list of the user's `ravyapi.api.models.users.ReputationEntry` reputation models."""
+        if self._rep is None:
+            self._rep = [ReputationEntry(rep) for rep in self.data["rep"]]
+
         return self._rep
 
     @property
     def sentinel(self) -> SentinelEntry:
         """The user's `ravyapi.api.models.users.SentinelEntry` sentinel model."""
+        if self._sentinel is None:
+            self._sentinel = SentinelEntry(self.data["sentinel"])
+
         return self._sentinel
 
 
@@ -125,15 +202,15 @@ class GetPronounsResponse:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     pronouns : str
         The user's pronouns.
     """
 
     __slots__: tuple[str, ...] = ("_data", "_pronouns")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._pronouns: str = data["pronouns"]
 
     def __repr__(self) -> str:
@@ -142,9 +219,31 @@ class GetPronounsResponse:
             f"(pronouns={self.pronouns!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: GetPronounsStruct) -> GetPronounsResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : GetPronounsStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        GetPronounsResponse
+            The pronouns model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._pronouns = struct.pronouns
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {"pronouns": self.pronouns}
+
         return self._data
 
     @property
@@ -159,7 +258,7 @@ class GetBansResponse:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     trust : Trust
         The user's `ravyapi.api.models.generic.trust.Trust` trust model.
     bans : list[BanEntryResponse]
@@ -168,10 +267,10 @@ class GetBansResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_trust", "_bans")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._trust = Trust(data["trust"])
-        self._bans = [BanEntryResponse(ban) for ban in data["bans"]]
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._trust = Trust.from_data(data["trust"], keep_raw=keep_raw)
+        self._bans = [BanEntryResponse(ban, keep_raw=keep_raw) for ban in data["bans"]]
 
     def __repr__(self) -> str:
         return (
@@ -179,9 +278,35 @@ class GetBansResponse:
             f"(trust={self.trust!r}, bans={self.bans!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: GetBansStruct) -> GetBansResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : GetBansStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        GetBansResponse
+            The bans model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._trust = Trust.from_struct(struct.trust)
+        self._bans = [BanEntryResponse.from_struct(ban) for ban in struct.bans]
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "trust": self.trust.data,
+                "bans": [ban.data for ban in self.bans],
+            }
+
         return self._data
 
     @property
@@ -201,7 +326,7 @@ class GetWhitelistsResponse:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     whitelists : list[WhitelistEntry]
         A list of the user's `ravyapi.api.models.users.WhitelistEntry` whitelist models.
     trust : Trust
@@ -210,12 +335,13 @@ class GetWhitelistsResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_whitelists", "_trust")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._whitelists = [
-            WhitelistEntry(whitelist) for whitelist in data["whitelists"]
+            WhitelistEntry(whitelist, keep_raw=keep_raw)
+            for whitelist in data["whitelists"]
         ]
-        self._trust = Trust(data["trust"])
+        self._trust = Trust.from_data(data["trust"], keep_raw=keep_raw)
 
     def __repr__(self) -> str:
         return (
@@ -223,9 +349,37 @@ class GetWhitelistsResponse:
             f"(whitelists={self.whitelists!r}, trust={self.trust!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: GetWhitelistsStruct) -> GetWhitelistsResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : GetWhitelistsStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        GetWhitelistsResponse
+            The whitelists model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._whitelists = [
+            WhitelistEntry.from_struct(whitelist) for whitelist in struct.whitelists
+        ]
+        self._trust = Trust.from_struct(struct.trust)
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "whitelists": [whitelist.data for whitelist in self.whitelists],
+                "trust": self.trust.data,
+            }
+
         return self._data
 
     @property
@@ -245,7 +399,7 @@ class GetReputationResponse:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     rep : list[ReputationEntry]
         A list of the user's `ravyapi.api.models.users.ReputationEntry` reputation models.
     trust : Trust
@@ -254,10 +408,10 @@ class GetReputationResponse:
 
     __slots__: tuple[str, ...] = ("_data", "_rep", "_trust")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._rep = [ReputationEntry(rep) for rep in data["rep"]]
-        self._trust = Trust(data["trust"])
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._rep = [ReputationEntry(rep, keep_raw=keep_raw) for rep in data["rep"]]
+        self._trust = Trust.from_data(data["trust"], keep_raw=keep_raw)
 
     def __repr__(self) -> str:
         return (
@@ -265,9 +419,35 @@ class GetReputationResponse:
             f"(rep={self.rep!r}, trust={self.trust!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: GetReputationStruct) -> GetReputationResponse:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : GetReputationStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        GetReputationResponse
+            The reputation model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._rep = [ReputationEntry.from_struct(rep) for rep in struct.rep]
+        self._trust = Trust.from_struct(struct.trust)
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {
+                "rep": [rep.data for rep in self.rep],
+                "trust": self.trust.data,
+            }
+
         return self._data
 
     @property
@@ -287,7 +467,7 @@ class WhitelistEntry:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     provider : str
         Source for where the user is whitelisted.
     reason : str
@@ -296,9 +476,9 @@ class WhitelistEntry:
 
     __slots__: tuple[str, ...] = ("_data", "_provider", "_reason")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._provider: str = sys.intern(data["provider"])
         self._reason: str = data["reason"]
 
     def __repr__(self) -> str:
@@ -307,9 +487,32 @@ class WhitelistEntry:
             f"(provider={self.provider!r}, reason={self.reason!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: WhitelistEntryStruct) -> WhitelistEntry:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : WhitelistEntryStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        WhitelistEntry
+            The whitelist entry model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._provider = sys.intern(struct.provider)
+        self._reason = struct.reason
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {"provider": self.provider, "reason": self.reason}
+
         return self._data
 
     @property
@@ -329,7 +532,7 @@ class ReputationEntry:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     provider : str
         Source for the reputation data.
     score : float
@@ -348,9 +551,9 @@ class ReputationEntry:
         "_downvotes",
     )
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
-        self._provider: str = data["provider"]
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
+        self._provider: str = sys.intern(data["provider"])
         self._score: float = data["score"]
         self._upvotes: int | None = data.get("upvotes")
         self._downvotes: int | None = data.get("downvotes")
@@ -362,9 +565,45 @@ class ReputationEntry:
             f"upvotes={self.upvotes!r}, downvotes={self.downvotes!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: ReputationEntryStruct) -> ReputationEntry:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : ReputationEntryStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        ReputationEntry
+            The reputation entry model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._provider = sys.intern(struct.provider)
+        self._score = struct.score
+        self._upvotes = struct.upvotes
+        self._downvotes = struct.downvotes
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            data: dict[str, Any] = {
+                "provider": self.provider,
+                "score": self.score,
+            }
+
+            if self.upvotes is not None:
+                data["upvotes"] = self.upvotes
+
+            if self.downvotes is not None:
+                data["downvotes"] = self.downvotes
+
+            return data
+
         return self._data
 
     @property
@@ -394,19 +633,20 @@ class SentinelEntry:
     Attributes
     ----------
     data : dict[str, Any]
-        The raw data returned from the Ravy API.
+        The raw data returned from the Ravy API, rebuilt from the fields if not kept.
     verified : bool
         Whether this user has linked their account to sentinel.
     internal_id : str
         Internal ID for debug purposes.
     """
 
-    __slots__: tuple[str, ...] = ("_data", "_verified", "_internal_id")
+    __slots__: tuple[str, ...] = ("_data", "_verified", "_id")
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data: dict[str, Any] = data
+    def __init__(self, data: dict[str, Any], *, keep_raw: bool = True) -> None:
+        self._data: dict[str, Any] | None = data if keep_raw else None
         self._verified: bool = data["verified"]
-        self._internal_id: str = str(data["id"])
+        # kept as returned, so the rebuilt data has the original type
+        self._id: int | str = data["id"]
 
     def __repr__(self) -> str:
         return (
@@ -414,9 +654,32 @@ class SentinelEntry:
             f"(verified={self.verified!r}, internal_id={self.internal_id!r})"
         )
 
+    @classmethod
+    def from_struct(cls, struct: SentinelEntryStruct) -> SentinelEntry:
+        """Build a model from a decoded struct, without keeping the raw data.
+
+        Parameters
+        ----------
+        struct : SentinelEntryStruct
+            The struct decoded from the raw data.
+
+        Returns
+        -------
+        SentinelEntry
+            The sentinel entry model.
+        """
+        self = cls.__new__(cls)
+        self._data = None
+        self._verified = struct.verified
+        self._id = struct.id
+        return self
+
     @property
     def data(self) -> dict[str, Any]:
-        """The raw data returned from the Ravy API."""
+        """The raw data returned from the Ravy API, rebuilt from the fields if not kept."""
+        if self._data is None:
+            return {"verified": self.verified, "id": self._id}
+
         return self._data
 
     @property
@@ -427,4 +690,75 @@ class SentinelEntry:
     @property
     def internal_id(self) -> str:
         """Internal ID for debug purposes."""
-        return self._internal_id
+        return str(self._id)
+
+
+class UserLookup:
+    """A model response from `ravyapi.api.endpoints.users.Users.lookup`.
+
+    Sub-resources which were not wanted are `None`.
+
+    Attributes
+    ----------
+    pronouns : GetPronounsResponse | None
+        The user's `ravyapi.api.models.users.GetPronounsResponse` pronouns model.
+    bans : GetBansResponse | None
+        The user's `ravyapi.api.models.users.GetBansResponse` bans model.
+    whitelists : GetWhitelistsResponse | None
+        The user's `ravyapi.api.models.users.GetWhitelistsResponse` whitelists model.
+    rep : GetReputationResponse | None
+        The user's `ravyapi.api.models.users.GetReputationResponse` reputation model.
+    """
+
+    __slots__: tuple[str, ...] = ("_pronouns", "_bans", "_whitelists", "_rep")
+
+    def __init__(
+        self,
+        pronouns: GetPronounsResponse | None = None,
+        bans: GetBansResponse | None = None,
+        whitelists: GetWhitelistsResponse | None = None,
+        rep: GetReputationResponse | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        pronouns : GetPronounsResponse | None
+            The user's pronouns model, if wanted.
+        bans : GetBansResponse | None
+            The user's bans model, if wanted.
+        whitelists : GetWhitelistsResponse | None
+            The user's whitelists model, if wanted.
+        rep : GetReputationResponse | None
+            The user's reputation model, if wanted.
+        """
+        self._pronouns: GetPronounsResponse | None = pronouns
+        self._bans: GetBansResponse | None = bans
+        self._whitelists: GetWhitelistsResponse | None = whitelists
+        self._rep: GetReputationResponse | None = rep
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(pronouns={self.pronouns!r}, bans={self.bans!r}, "
+            f"whitelists={self.whitelists!r}, rep={self.rep!r})"
+        )
+
+    @property
+    def pronouns(self) -> GetPronounsResponse | None:
+        """The user's `ravyapi.api.models.users.GetPronounsResponse` pronouns model."""
+        return self._pronouns
+
+    @property
+    def bans(self) -> GetBansResponse | None:
+        """The user's `ravyapi.api.models.users.GetBansResponse` bans model."""
+        return self._bans
+
+    @property
+    def whitelists(self) -> GetWhitelistsResponse | None:
+        """The user's `ravyapi.api.models.users.GetWhitelistsResponse` whitelists model."""
+        return self._whitelists
+
+    @property
+    def rep(self) -> GetReputationResponse | None:
+        """The user's `ravyapi.api.models.users.GetReputationResponse` reputation model."""
+        return self._rep
@@ -0,0 +1,165 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Structs the `users` endpoint responses are decoded into by a typed `JSONCodec`.
+
+This module requires `msgspec`. The structs mirror the raw data of the models of
+`ravyapi.api.models.users`, which are built from them with `from_struct`.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "BanEntryStruct",
+    "GetBansStruct",
+    "GetPronounsStruct",
+    "GetReputationStruct",
+    "GetUserStruct",
+    "GetWhitelistsStruct",
+    "ReputationEntryStruct",
+    "SentinelEntryStruct",
+    "TrustStruct",
+    "WhitelistEntryStruct",
+    "struct_decoder",
+)
+
+# msgspec evaluates the annotations at runtime, hence `typing` generics on Python 3.8
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+import msgspec
+
+from ravyapi.api.models import (
+    GetBansResponse,
+    GetPronounsResponse,
+    GetReputationResponse,
+    GetUserResponse,
+    GetWhitelistsResponse,
+)
+
+_ModelT = TypeVar("_ModelT")
+
+
+# the structs hold no reference cycles, so the garbage collector can skip them
+class TrustStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.generic.trust.Trust` model."""
+
+    level: int
+    label: str
+
+
+class BanEntryStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.generic.ban_entry.BanEntryResponse` model."""
+
+    provider: str
+    reason: str
+    moderator: Union[int, str]
+    reason_key: Optional[str] = None
+
+
+class WhitelistEntryStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.WhitelistEntry` model."""
+
+    provider: str
+    reason: str
+
+
+class ReputationEntryStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.ReputationEntry` model."""
+
+    provider: str
+    score: float
+    upvotes: Optional[int] = None
+    downvotes: Optional[int] = None
+
+
+class SentinelEntryStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.SentinelEntry` model."""
+
+    verified: bool
+    id: Union[int, str]
+
+
+class GetUserStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.GetUserResponse` model."""
+
+    pronouns: str
+    trust: TrustStruct
+    whitelists: List[WhitelistEntryStruct]
+    bans: List[BanEntryStruct]
+    rep: List[ReputationEntryStruct]
+    sentinel: SentinelEntryStruct
+
+
+class GetPronounsStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.GetPronounsResponse` model."""
+
+    pronouns: str
+
+
+class GetBansStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.GetBansResponse` model."""
+
+    trust: TrustStruct
+    bans: List[BanEntryStruct]
+
+
+class GetWhitelistsStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.GetWhitelistsResponse` model."""
+
+    whitelists: List[WhitelistEntryStruct]
+    trust: TrustStruct
+
+
+class GetReputationStruct(msgspec.Struct, gc=False):
+    """The raw data of a `ravyapi.api.models.users.GetReputationResponse` model."""
+
+    rep: List[ReputationEntryStruct]
+    trust: TrustStruct
+
+
+_STRUCTS: dict[Any, tuple[type[msgspec.Struct], Callable[[Any], Any]]] = {
+    GetUserResponse: (GetUserStruct, GetUserResponse.from_struct),
+    GetPronounsResponse: (GetPronounsStruct, GetPronounsResponse.from_struct),
+    GetBansResponse: (GetBansStruct, GetBansResponse.from_struct),
+    GetWhitelistsResponse: (GetWhitelistsStruct, GetWhitelistsResponse.from_struct),
+    GetReputationResponse: (GetReputationStruct, GetReputationResponse.from_struct),
+}
+
+
+def struct_decoder(model: Callable[..., _ModelT]) -> Callable[[bytes], _ModelT] | None:
+    """Build a function decoding a response body straight into a model.
+
+    Parameters
+    ----------
+    model : Callable[..., _ModelT]
+        The response model to decode into.
+
+    Returns
+    -------
+    Callable[[bytes], _ModelT] | None
+        The function decoding a response body into the model through its struct,
+        or `None` if the model has no struct.
+    """
+    entry = _STRUCTS.get(model)
+
+    if entry is None:
+        return None
+
+    struct, from_struct = entry
+    decode = msgspec.json.Decoder(struct).decode
+
+    def decoder(data: bytes) -> _ModelT:
+        result: _ModelT = from_struct(decode(data))
+        return result
+
+    return decoder
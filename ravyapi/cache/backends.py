@@ -0,0 +1,938 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Storage backends for cached endpoint responses."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "CacheBackend",
+    "CacheEntry",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "TinyLFUBackend",
+)
+
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from typing_extensions import Final, Protocol, runtime_checkable
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.const import CACHE_MAX_ENTRIES
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.cache")
+
+
+class CacheEntry:
+    """A cached response along with its expiry.
+
+    Attributes
+    ----------
+    name : str
+        The name of the endpoint the response was cached for.
+    value : Any
+        The cached model response, or the not found error raised by the lookup.
+    created_at : float
+        The `time.time` the response was cached at.
+    expires_at : float
+        The `time.time` the response expires at.
+    is_negative : bool
+        Whether the entry caches a not found error.
+    """
+
+    __slots__: tuple[str, ...] = ("_name", "_value", "_created_at", "_expires_at")
+
+    def __init__(
+        self, name: str, value: Any, created_at: float, expires_at: float
+    ) -> None:
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint the response was cached for.
+        value : Any
+            The cached model response, or the not found error raised by the lookup.
+        created_at : float
+            The `time.time` the response was cached at.
+        expires_at : float
+            The `time.time` the response expires at.
+        """
+        self._name: str = name
+        self._value: Any = value
+        self._created_at: float = created_at
+        self._expires_at: float = expires_at
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(name={self.name!r}, value={self.value!r}, "
+            f"created_at={self.created_at!r}, expires_at={self.expires_at!r})"
+        )
+
+    def is_expired(self, now: float) -> bool:
+        """Check whether the entry has expired.
+
+        Parameters
+        ----------
+        now : float
+            The current `time.time`.
+
+        Returns
+        -------
+        bool
+            Whether the entry has expired.
+        """
+        return now >= self._expires_at
+
+    @property
+    def name(self) -> str:
+        """The name of the endpoint the response was cached for."""
+        return self._name
+
+    @property
+    def value(self) -> Any:
+        """The cached model response, or the not found error raised by the lookup."""
+        return self._value
+
+    @property
+    def is_negative(self) -> bool:
+        """Whether the entry caches a not found error."""
+        return isinstance(self._value, NotFoundError)
+
+    @property
+    def created_at(self) -> float:
+        """The `time.time` the response was cached at."""
+        return self._created_at
+
+    @property
+    def expires_at(self) -> float:
+        """The `time.time` the response expires at."""
+        return self._expires_at
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """The interface a storage backend of `ravyapi.cache.ResponseCache` implements.
+
+    Backends only store entries; expiry and lookup counters are handled by the cache.
+    """
+
+    def __len__(self) -> int: ...
+
+    @property
+    def evictions(self) -> dict[str, int]:
+        """The number of entries evicted to make room, by endpoint name."""
+        ...
+
+    def items(self) -> Iterable[tuple[str, CacheEntry]]:
+        """Get every stored entry with its key, without marking them as used.
+
+        Returns
+        -------
+        Iterable[tuple[str, CacheEntry]]
+            The key and entry of every stored entry.
+        """
+        ...
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a stored entry, whether or not it has expired.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The stored entry, if any.
+        """
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any entry with the same key.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        entry : CacheEntry
+            The entry to store.
+        """
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove a stored entry if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        """
+        ...
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every stored entry whose key starts with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the keys to remove.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        ...
+
+
+class MemoryBackend:
+    """An in-process backend evicting the least recently used entries once full.
+
+    Attributes
+    ----------
+    max_entries : int
+        The maximum number of stored entries.
+    """
+
+    __slots__: tuple[str, ...] = ("_max_entries", "_entries", "_evictions")
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of stored entries.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(max_entries, int):
+            raise TypeError('Parameter "max_entries" must be of type "int"')
+
+        if max_entries < 1:
+            raise ValueError('Parameter "max_entries" must be greater than 0')
+
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._evictions: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_entries={self.max_entries!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a stored entry, marking it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The stored entry, if any.
+        """
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used one if full.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        entry : CacheEntry
+            The entry to store.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            evicted, evicted_entry = self._entries.popitem(last=False)
+            self._evictions[evicted_entry.name] = (
+                self._evictions.get(evicted_entry.name, 0) + 1
+            )
+            _LOGGER.debug("Evicted least recently used cache entry %s", evicted)
+
+    def delete(self, key: str) -> None:
+        """Remove a stored entry if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        """
+        self._entries.pop(key, None)
+
+    def items(self) -> list[tuple[str, CacheEntry]]:
+        """Get every stored entry with its key, without marking them as used.
+
+        Returns
+        -------
+        list[tuple[str, CacheEntry]]
+            The key and entry of every stored entry.
+        """
+        return list(self._entries.items())
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every stored entry whose key starts with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the keys to remove.
+        """
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        self._entries.clear()
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of stored entries."""
+        return self._max_entries
+
+    @property
+    def evictions(self) -> dict[str, int]:
+        """The number of entries evicted to make room, by endpoint name."""
+        return self._evictions
+
+
+class _FrequencySketch:
+    """A count-min sketch estimating how often keys were accessed recently.
+
+    Counters saturate at 15 and are all halved once the number of recorded accesses
+    reaches the sample size, so old popularity fades out.
+    """
+
+    __slots__: tuple[str, ...] = ("_counters", "_mask", "_additions", "_sample_size")
+
+    _DEPTH: Final[int] = 4
+
+    def __init__(self, max_entries: int) -> None:
+        width = 1 << max(max_entries - 1, 1).bit_length()
+        self._counters: list[bytearray] = [bytearray(width) for _ in range(self._DEPTH)]
+        self._mask: int = width - 1
+        self._additions: int = 0
+        self._sample_size: int = 10 * max_entries
+
+    def frequency(self, key: str) -> int:
+        """Estimate the number of recent accesses of a key."""
+        mask = self._mask
+        return min(
+            row[hash((key, depth)) & mask] for depth, row in enumerate(self._counters)
+        )
+
+    def increment(self, key: str) -> None:
+        """Record an access of a key, aging every counter once the sample is full."""
+        mask = self._mask
+
+        for depth, row in enumerate(self._counters):
+            index = hash((key, depth)) & mask
+
+            if row[index] < 15:
+                row[index] += 1
+
+        self._additions += 1
+
+        if self._additions >= self._sample_size:
+            self._additions //= 2
+
+            for row in self._counters:
+                row[:] = bytes(counter >> 1 for counter in row)
+
+    def clear(self) -> None:
+        """Forget every recorded access."""
+        for row in self._counters:
+            row[:] = bytes(len(row))
+
+        self._additions = 0
+
+
+class TinyLFUBackend:
+    """An in-process backend only keeping entries that are accessed often enough.
+
+    New entries go to a small LRU window. Entries leaving the window are only
+    admitted to the main segmented LRU if they were accessed more often recently
+    than the entry they would evict, as estimated by a count-min sketch (W-TinyLFU).
+    A scan of many one-off keys therefore only churns the window instead of
+    evicting the frequently used entries.
+
+    Attributes
+    ----------
+    max_entries : int
+        The maximum number of stored entries.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_max_entries",
+        "_window",
+        "_probation",
+        "_protected",
+        "_window_max",
+        "_protected_max",
+        "_sketch",
+        "_evictions",
+    )
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of stored entries.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(max_entries, int):
+            raise TypeError('Parameter "max_entries" must be of type "int"')
+
+        if max_entries < 1:
+            raise ValueError('Parameter "max_entries" must be greater than 0')
+
+        self._max_entries: int = max_entries
+        self._window: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._probation: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._protected: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._window_max: int = max(max_entries // 100, 1)
+        self._protected_max: int = (max_entries - self._window_max) * 4 // 5
+        self._sketch: _FrequencySketch = _FrequencySketch(max_entries)
+        self._evictions: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_entries={self.max_entries!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a stored entry, recording the access and marking it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The stored entry, if any.
+        """
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+            return self._window[key]
+
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return self._protected[key]
+
+        entry = self._probation.pop(key, None)
+
+        if entry is not None:
+            self._protected[key] = entry
+
+            if len(self._protected) > self._protected_max:
+                demoted, demoted_entry = self._protected.popitem(last=False)
+                self._probation[demoted] = demoted_entry
+
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least frequently used one if full.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        entry : CacheEntry
+            The entry to store.
+        """
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                segment[key] = entry
+                return
+
+        self._window[key] = entry
+
+        if len(self._window) <= self._window_max:
+            return
+
+        candidate, candidate_entry = self._window.popitem(last=False)
+
+        if len(self) < self._max_entries:
+            self._probation[candidate] = candidate_entry
+            return
+
+        victims = self._probation or self._protected
+        victim = next(iter(victims), None)
+        frequency = self._sketch.frequency
+
+        if victim is not None and frequency(candidate) > frequency(victim):
+            evicted_entry = victims.pop(victim)
+            self._probation[candidate] = candidate_entry
+            _LOGGER.debug("Evicted less frequently used cache entry %s", victim)
+        else:
+            evicted_entry = candidate_entry
+            _LOGGER.debug("Rejected less frequently used cache entry %s", candidate)
+
+        self._evictions[evicted_entry.name] = (
+            self._evictions.get(evicted_entry.name, 0) + 1
+        )
+
+    def delete(self, key: str) -> None:
+        """Remove a stored entry if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        """
+        for segment in (self._window, self._probation, self._protected):
+            segment.pop(key, None)
+
+    def items(self) -> list[tuple[str, CacheEntry]]:
+        """Get every stored entry with its key, without marking them as used.
+
+        Returns
+        -------
+        list[tuple[str, CacheEntry]]
+            The key and entry of every stored entry.
+        """
+        return [
+            *self._window.items(),
+            *self._probation.items(),
+            *self._protected.items(),
+        ]
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every stored entry whose key starts with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the keys to remove.
+        """
+        for segment in (self._window, self._probation, self._protected):
+            for key in [key for key in segment if key.startswith(prefix)]:
+                del segment[key]
+
+    def clear(self) -> None:
+        """Remove every stored entry and forget every recorded access."""
+        for segment in (self._window, self._probation, self._protected):
+            segment.clear()
+
+        self._sketch.clear()
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of stored entries."""
+        return self._max_entries
+
+    @property
+    def evictions(self) -> dict[str, int]:
+        """The number of entries evicted to make room, by endpoint name."""
+        return self._evictions
+
+
+class SQLiteBackend:
+    """A persistent backend storing entries in an SQLite database file.
+
+    Entries survive restarts and can be shared by several processes on the same host.
+    Models are stored as their raw API data and rebuilt when read, so only models of
+    this package, which are all built from their raw data, and not found errors can
+    be stored. Once full, expired entries and then the oldest entries are evicted in
+    a batch, leaving room for the next `max_entries // 20` writes before checking again.
+
+    The database is read and written synchronously on the calling thread, which is
+    the event loop thread for cached endpoint calls. Lookups take tens of
+    microseconds, but while another process holds the write lock they wait for up to
+    `timeout` seconds; a lookup that times out is treated as a miss, and a write or
+    deletion that cannot be made in time is logged and skipped.
+
+    Attributes
+    ----------
+    path : str
+        The path of the database file.
+    max_entries : int
+        The maximum number of stored entries.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_path",
+        "_max_entries",
+        "_connection",
+        "_lock",
+        "_evictions",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int = CACHE_MAX_ENTRIES,
+        *,
+        timeout: float = 0.1,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            The path of the database file, created if it does not exist.
+        max_entries : int
+            The maximum number of stored entries.
+        timeout : float
+            The number of seconds to block waiting for another process to release the
+            database, before giving up on a lookup or write.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError('Parameter "path" must be of type "str"')
+
+        if not isinstance(max_entries, int):
+            raise TypeError('Parameter "max_entries" must be of type "int"')
+
+        if max_entries < 1:
+            raise ValueError('Parameter "max_entries" must be greater than 0')
+
+        if not isinstance(timeout, (int, float)):
+            raise TypeError('Parameter "timeout" must be of type "float"')
+
+        if timeout < 0:
+            raise ValueError('Parameter "timeout" must not be negative')
+
+        self._path: str = os.fspath(path)
+        self._max_entries: int = max_entries
+        self._lock: threading.Lock = threading.Lock()
+        self._evictions: dict[str, int] = {}
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self._path, timeout=timeout, check_same_thread=False
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, name TEXT NOT NULL, model TEXT NOT NULL, "
+                "data TEXT NOT NULL, keep_raw INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created_at "
+                "ON responses (created_at)"
+            )
+
+        # an estimate counting every write, only checked against the table once full
+        self._count: int = 0
+        self._count = len(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(path={self.path!r}, max_entries={self.max_entries!r})"
+        )
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                (count,) = self._connection.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out counting cache entries", exc_info=True)
+            return self._count
+
+        return int(count)
+
+    @staticmethod
+    def _dump_model(value: Any) -> tuple[str, str, bool]:
+        """Serialize a model into its import path, raw JSON data and whether it keeps it."""
+        model: type[object] = value.__class__
+
+        if isinstance(value, NotFoundError):
+            return (
+                f"{model.__module__}:{model.__qualname__}",
+                json.dumps(value.exc_data),
+                True,
+            )
+
+        if not model.__module__.startswith("ravyapi.") or not hasattr(value, "data"):
+            raise TypeError(f'Cannot store value of type "{model.__qualname__}"')
+
+        return (
+            f"{model.__module__}:{model.__qualname__}",
+            json.dumps(value.data),
+            getattr(value, "_data", None) is not None,
+        )
+
+    @staticmethod
+    def _load_model(model: str, data: str, keep_raw: bool) -> Any:
+        """Rebuild a model from its import path and raw JSON data."""
+        module, _, qualname = model.partition(":")
+
+        if not module.startswith("ravyapi."):
+            raise ValueError(f'Cannot load value of type "{model}"')
+
+        factory = getattr(importlib.import_module(module), qualname)
+
+        if issubclass(factory, NotFoundError):
+            return factory(json.loads(data))
+
+        return factory(json.loads(data), keep_raw=keep_raw)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a stored entry, whether or not it has expired.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The stored entry, if any.
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT name, model, data, keep_raw, created_at, expires_at "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out reading cache entry %s", key, exc_info=True)
+            return None
+
+        if row is None:
+            return None
+
+        name, model, data, keep_raw, created_at, expires_at = row
+
+        try:
+            value = self._load_model(model, data, bool(keep_raw))
+        except Exception:
+            _LOGGER.warning("Discarding unreadable cache entry %s", key, exc_info=True)
+            self.delete(key)
+            return None
+
+        return CacheEntry(name, value, created_at, expires_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting expired and then the oldest entries once full.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        entry : CacheEntry
+            The entry to store.
+
+        Raises
+        ------
+        TypeError
+            If the entry value is not a model of this package or a not found error.
+        """
+        model, data, keep_raw = self._dump_model(entry.value)
+
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, name, model, data, "
+                    "keep_raw, created_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.name,
+                        model,
+                        data,
+                        keep_raw,
+                        entry.created_at,
+                        entry.expires_at,
+                    ),
+                )
+                self._count += 1
+
+                if self._count > self._max_entries:
+                    self._evict()
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out storing cache entry %s", key, exc_info=True)
+
+    def _evict(self) -> None:
+        """Evict expired and then the oldest entries if the table is full.
+
+        Must be called with the lock held, within a transaction.
+        """
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        self._count = int(count)
+
+        if self._count <= self._max_entries:
+            return
+
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+        )
+        keep = self._max_entries - self._max_entries // 20
+        evicted = self._connection.execute(
+            "SELECT name, COUNT(*) FROM responses WHERE key IN (SELECT key "
+            "FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?) "
+            "GROUP BY name",
+            (keep,),
+        ).fetchall()
+        self._connection.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+            "ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (keep,),
+        )
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        self._count = int(count)
+
+        for name, evicted_count in evicted:
+            self._evictions[name] = self._evictions.get(name, 0) + evicted_count
+
+        _LOGGER.debug("Evicted cache entries from %s", self._path)
+
+    def delete(self, key: str) -> None:
+        """Remove a stored entry if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ravyapi.cache.ResponseCache.make_key`.
+        """
+        try:
+            with self._lock, self._connection:
+                cursor = self._connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                )
+                self._count = max(self._count - cursor.rowcount, 0)
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out deleting cache entry %s", key, exc_info=True)
+
+    def items(self) -> list[tuple[str, CacheEntry]]:
+        """Get every stored entry with its key, skipping unreadable entries.
+
+        Returns
+        -------
+        list[tuple[str, CacheEntry]]
+            The key and entry of every stored entry.
+        """
+        try:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT key, name, model, data, keep_raw, created_at, expires_at "
+                    "FROM responses"
+                ).fetchall()
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out reading cache entries", exc_info=True)
+            return []
+
+        items: list[tuple[str, CacheEntry]] = []
+
+        for key, name, model, data, keep_raw, created_at, expires_at in rows:
+            try:
+                value = self._load_model(model, data, bool(keep_raw))
+            except Exception:
+                continue
+
+            items.append((key, CacheEntry(name, value, created_at, expires_at)))
+
+        return items
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every stored entry whose key starts with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the keys to remove.
+        """
+        try:
+            with self._lock, self._connection:
+                cursor = self._connection.execute(
+                    "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+                self._count = max(self._count - cursor.rowcount, 0)
+        except sqlite3.OperationalError:
+            _LOGGER.warning(
+                "Timed out deleting cache entries %s*", prefix, exc_info=True
+            )
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        try:
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM responses")
+                self._count = 0
+        except sqlite3.OperationalError:
+            _LOGGER.warning("Timed out clearing cache entries", exc_info=True)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    @property
+    def path(self) -> str:
+        """The path of the database file."""
+        return self._path
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of stored entries."""
+        return self._max_entries
+
+    @property
+    def evictions(self) -> dict[str, int]:
+        """The number of entries evicted to make room, by endpoint name."""
+        return self._evictions
@@ -0,0 +1,767 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An in-memory TTL and LRU cache for endpoint responses."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("CacheReport", "CacheStats", "ResponseCache", "no_admit")
+
+import asyncio
+import contextlib
+import logging
+import sys
+import time
+import urllib.parse
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Mapping, cast
+
+from typing_extensions import Final
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.cache.backends import CacheBackend, CacheEntry, MemoryBackend
+from ravyapi.const import CACHE_MAX_ENTRIES, CACHE_NEGATIVE_TTL, CACHE_TTL
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.cache")
+_ADMIT: Final[ContextVar[bool]] = ContextVar("_ADMIT", default=True)
+
+
+@contextlib.contextmanager
+def no_admit() -> Iterator[None]:
+    """Stop lookups made within the context from adding responses to any cache.
+
+    Cached responses are still served, and background refreshes of them still
+    store the new response. Tasks started within the context, such as the lookups
+    of a bulk lookup, inherit it, so one-off scans leave the cached entries alone.
+    """
+    token = _ADMIT.set(False)
+
+    try:
+        yield
+    finally:
+        _ADMIT.reset(token)
+
+
+class CacheStats:
+    """Counters for the cache lookups of a single endpoint.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that had to make a request.
+    stale_hits : int
+        The number of hits answered with an expired response while it was refreshed.
+    negative_hits : int
+        The number of hits answered by raising a cached not found error.
+    derived_hits : int
+        The number of misses answered from the cached response of another endpoint.
+    hit_rate : float
+        The ratio of hits to lookups, 0 if there were no lookups.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "hits",
+        "misses",
+        "stale_hits",
+        "negative_hits",
+        "derived_hits",
+    )
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale_hits: int = 0
+        self.negative_hits: int = 0
+        self.derived_hits: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(hits={self.hits!r}, misses={self.misses!r}, "
+            f"stale_hits={self.stale_hits!r}, negative_hits={self.negative_hits!r}, "
+            f"derived_hits={self.derived_hits!r})"
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits to lookups, 0 if there were no lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheReport(CacheStats):
+    """A snapshot of the lookup counters and memory use of a single endpoint.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that had to make a request.
+    stale_hits : int
+        The number of hits answered with an expired response while it was refreshed.
+    negative_hits : int
+        The number of hits answered by raising a cached not found error.
+    derived_hits : int
+        The number of misses answered from the cached response of another endpoint.
+    hit_rate : float
+        The ratio of hits to lookups, 0 if there were no lookups.
+    evictions : int
+        The number of entries evicted by the backend to make room.
+    coalesced : int
+        The number of requests that joined an identical request already in flight.
+    entries : int
+        The number of cached entries.
+    bytes : int
+        The estimated memory used by the cached entries, in bytes.
+    median_age : float
+        The median number of seconds since the cached entries were stored.
+    p90_age : float
+        The number of seconds since the cached entries were stored, at the 90th percentile.
+    max_age : float
+        The number of seconds since the oldest cached entry was stored.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "evictions",
+        "coalesced",
+        "entries",
+        "bytes",
+        "median_age",
+        "p90_age",
+        "max_age",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.evictions: int = 0
+        self.coalesced: int = 0
+        self.entries: int = 0
+        self.bytes: int = 0
+        self.median_age: float = 0.0
+        self.p90_age: float = 0.0
+        self.max_age: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(hits={self.hits!r}, misses={self.misses!r}, "
+            f"stale_hits={self.stale_hits!r}, negative_hits={self.negative_hits!r}, "
+            f"derived_hits={self.derived_hits!r}, evictions={self.evictions!r}, "
+            f"coalesced={self.coalesced!r}, entries={self.entries!r}, "
+            f"bytes={self.bytes!r}, median_age={self.median_age!r}, "
+            f"p90_age={self.p90_age!r}, max_age={self.max_age!r})"
+        )
+
+
+def _estimate_size(value: Any, seen: set[int]) -> int:
+    """Estimate the memory used by a value and the objects it references, once each."""
+    if id(value) in seen:
+        return 0
+
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        mapping = cast("Mapping[Any, Any]", value)
+        size += sum(
+            _estimate_size(k, seen) + _estimate_size(v, seen)
+            for k, v in mapping.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        items = cast("Iterable[Any]", value)
+        size += sum(_estimate_size(item, seen) for item in items)
+    elif isinstance(value, NotFoundError):
+        size += _estimate_size(value.exc_data, seen)
+    elif not isinstance(value, (str, bytes, int, float)) and value is not None:
+        for cls in type(value).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if not slot.startswith("__") and hasattr(value, slot):
+                    size += _estimate_size(getattr(value, slot), seen)
+
+    return size
+
+
+class ResponseCache:
+    """An opt-in in-memory cache for the responses of read endpoints.
+
+    Responses are cached per endpoint and arguments, expire after a per-endpoint TTL,
+    and the least recently used entries are evicted once the cache is full.
+    Endpoints with a max staleness serve expired responses for that long while they
+    are refreshed in the background. Lookups of unknown resources raising
+    `ravyapi.api.errors.NotFoundError` are cached separately with a shorter TTL.
+    Endpoints are named after their permission, for example `users`, `users.bans`,
+    `users.pronouns`, `users.rep`, `users.whitelists`, `guilds`, `ksoft.bans` and `urls`.
+
+    Attributes
+    ----------
+    max_entries : int
+        The maximum number of cached responses of the default in-memory backend.
+    ttl : float
+        The default number of seconds a response is cached for.
+    ttls : dict[str, float]
+        The number of seconds a response is cached for, by endpoint name, overriding `ttl`.
+    negative_ttl : float
+        The default number of seconds a not found error is cached for.
+    negative_ttls : dict[str, float]
+        The number of seconds a not found error is cached for, by endpoint name,
+        overriding `negative_ttl`.
+    max_stale : float
+        The default number of seconds an expired response is served for while refreshed.
+    max_stales : dict[str, float]
+        The number of seconds an expired response is served for while refreshed,
+        by endpoint name, overriding `max_stale`.
+    backend : CacheBackend
+        The backend the responses are stored in.
+    stats : dict[str, CacheStats]
+        The lookup counters of each endpoint name.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_max_entries",
+        "_ttl",
+        "_ttls",
+        "_negative_ttl",
+        "_negative_ttls",
+        "_max_stale",
+        "_max_stales",
+        "_backend",
+        "_stats",
+        "_refreshing",
+        "_generations",
+        "_requests",
+    )
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        *,
+        ttl: float = CACHE_TTL,
+        ttls: Mapping[str, float] | None = None,
+        negative_ttl: float = CACHE_NEGATIVE_TTL,
+        negative_ttls: Mapping[str, float] | None = None,
+        max_stale: float = 0.0,
+        max_stales: Mapping[str, float] | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of cached responses of the default in-memory backend.
+        ttl : float
+            The default number of seconds a response is cached for.
+        ttls : Mapping[str, float] | None
+            The number of seconds a response is cached for, by endpoint name,
+            overriding `ttl`. A TTL of 0 disables caching for the endpoint.
+        negative_ttl : float
+            The default number of seconds a not found error is cached for.
+            A TTL of 0 disables caching not found errors.
+        negative_ttls : Mapping[str, float] | None
+            The number of seconds a not found error is cached for, by endpoint name,
+            overriding `negative_ttl`.
+        max_stale : float
+            The default number of seconds an expired response is served for while it
+            is refreshed in the background. A max staleness of 0 disables this.
+        max_stales : Mapping[str, float] | None
+            The number of seconds an expired response is served for while it is
+            refreshed in the background, by endpoint name, overriding `max_stale`.
+        backend : CacheBackend | None
+            The backend to store responses in, such as a `SQLiteBackend` shared by
+            several processes. Defaults to a `MemoryBackend` of `max_entries`.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(max_entries, int):
+            raise TypeError('Parameter "max_entries" must be of type "int"')
+
+        if max_entries < 1:
+            raise ValueError('Parameter "max_entries" must be greater than 0')
+
+        if backend is not None and not isinstance(backend, CacheBackend):
+            raise TypeError('Parameter "backend" must be of type "CacheBackend"')
+
+        ttls = self._validate_seconds("ttl", ttl, ttls)
+        negative_ttls = self._validate_seconds(
+            "negative_ttl", negative_ttl, negative_ttls
+        )
+        max_stales = self._validate_seconds("max_stale", max_stale, max_stales)
+
+        self._max_entries: int = max_entries
+        self._ttl: float = float(ttl)
+        self._ttls: dict[str, float] = ttls
+        self._negative_ttl: float = float(negative_ttl)
+        self._negative_ttls: dict[str, float] = negative_ttls
+        self._max_stale: float = float(max_stale)
+        self._max_stales: dict[str, float] = max_stales
+        self._backend: CacheBackend = (
+            MemoryBackend(max_entries) if backend is None else backend
+        )
+        self._stats: dict[str, CacheStats] = {}
+        self._refreshing: dict[str, asyncio.Future[None]] = {}
+        # only tracked while a request for the resource is in flight
+        self._generations: dict[str, int] = {}
+        self._requests: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_entries={self.max_entries!r}, ttl={self.ttl!r}, ttls={self.ttls!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    @staticmethod
+    def _validate_seconds(
+        parameter: str, default: float, overrides: Mapping[str, float] | None
+    ) -> dict[str, float]:
+        """Validate a default number of seconds and its per-endpoint overrides."""
+        overrides = dict(overrides or {})
+
+        for value in (default, *overrides.values()):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f'Parameter "{parameter}" must be of type "float"')
+
+            if value < 0:
+                raise ValueError(f'Parameter "{parameter}" must not be negative')
+
+        return overrides
+
+    @staticmethod
+    def make_key(name: str, resource: Any, params: Mapping[str, Any]) -> str:
+        """Build the cache key for an endpoint lookup.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        resource : Any
+            The resource looked up, such as a user ID or a URL.
+        params : Mapping[str, Any]
+            Any other arguments of the lookup, `None` values are left out.
+
+        Returns
+        -------
+        str
+            A key normalized so equal lookups always produce the same key.
+        """
+        key = f"{name}:{urllib.parse.quote(str(resource), safe='')}"
+        query = sorted((k, str(v)) for k, v in params.items() if v is not None)
+
+        if query:
+            key += f"?{urllib.parse.urlencode(query)}"
+
+        return key
+
+    def ttl_for(self, name: str) -> float:
+        """Get the number of seconds responses of an endpoint are cached for.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+
+        Returns
+        -------
+        float
+            The TTL of the endpoint, 0 if it is not cached.
+        """
+        return self._ttls.get(name, self._ttl)
+
+    def negative_ttl_for(self, name: str) -> float:
+        """Get the number of seconds not found errors of an endpoint are cached for.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+
+        Returns
+        -------
+        float
+            The negative TTL of the endpoint, 0 if not found errors are not cached.
+        """
+        return self._negative_ttls.get(name, self._negative_ttl)
+
+    def max_stale_for(self, name: str) -> float:
+        """Get the number of seconds expired responses of an endpoint are served for.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+
+        Returns
+        -------
+        float
+            The max staleness of the endpoint, 0 if expired responses are not served.
+        """
+        return self._max_stales.get(name, self._max_stale)
+
+    def _stats_for(self, name: str) -> CacheStats:
+        """Get the lookup counters of an endpoint, creating them if needed."""
+        stats = self._stats.get(name)
+
+        if stats is None:
+            stats = self._stats[name] = CacheStats()
+
+        return stats
+
+    def get(self, name: str, key: str) -> CacheEntry | None:
+        """Look up a cached response, counting the hit or miss.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        key : str
+            The key built by `ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The cached entry if it exists and has not expired, or has expired less
+            than the max staleness of the endpoint ago and should be refreshed.
+        """
+        stats = self._stats_for(name)
+        entry = self._backend.get(key)
+        now = time.time()
+
+        if entry is not None and entry.is_expired(now):
+            max_stale = 0.0 if entry.is_negative else self.max_stale_for(name)
+
+            if now < entry.expires_at + max_stale:
+                stats.stale_hits += 1
+            else:
+                self._backend.delete(key)
+                entry = None
+
+        if entry is None:
+            stats.misses += 1
+            return None
+
+        stats.hits += 1
+
+        if entry.is_negative:
+            stats.negative_hits += 1
+
+        return entry
+
+    def get_source(self, name: str, key: str) -> CacheEntry | None:
+        """Look up a fresh response of another endpoint to answer a miss from.
+
+        Expired responses and not found errors are never used as a source, and only
+        a found source is counted, as a derived hit of the endpoint that missed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint that missed.
+        key : str
+            The key of the source response built by `ResponseCache.make_key`.
+
+        Returns
+        -------
+        CacheEntry | None
+            The cached entry if it exists, has not expired and is not negative.
+        """
+        entry = self._backend.get(key)
+
+        if entry is None or entry.is_negative or entry.is_expired(time.time()):
+            return None
+
+        self._stats_for(name).derived_hits += 1
+        return entry
+
+    def report(self) -> dict[str, CacheReport]:
+        """Build a snapshot of the lookup counters and memory use of each endpoint.
+
+        Every cached entry is walked to count it and estimate its size, so this is
+        meant for occasional monitoring rather than hot paths. Objects shared between
+        entries, such as interned strings, are only counted once.
+
+        Returns
+        -------
+        dict[str, CacheReport]
+            The report of each endpoint name that was looked up or has cached entries.
+        """
+        reports: dict[str, CacheReport] = {}
+
+        for name, stats in self._stats.items():
+            report = reports[name] = CacheReport()
+            report.hits = stats.hits
+            report.misses = stats.misses
+            report.stale_hits = stats.stale_hits
+            report.negative_hits = stats.negative_hits
+            report.derived_hits = stats.derived_hits
+
+        for name, evictions in self._backend.evictions.items():
+            reports.setdefault(name, CacheReport()).evictions = evictions
+
+        ages: dict[str, list[float]] = {}
+        seen: set[int] = set()
+        now = time.time()
+
+        for key, entry in self._backend.items():
+            report = reports.setdefault(entry.name, CacheReport())
+            report.entries += 1
+            report.bytes += _estimate_size(key, seen) + _estimate_size(
+                entry.value, seen
+            )
+            ages.setdefault(entry.name, []).append(now - entry.created_at)
+
+        for name, values in ages.items():
+            values.sort()
+            report = reports[name]
+            report.median_age = (
+                values[(len(values) - 1) // 2] + values[len(values) // 2]
+            ) / 2
+            report.p90_age = values[min(len(values) * 9 // 10, len(values) - 1)]
+            report.max_age = values[-1]
+
+        return reports
+
+    @contextlib.contextmanager
+    def track_request(self, key: str) -> Iterator[int]:
+        """Count the invalidations of the resource of a key during a request.
+
+        A response requested before its resource was invalidated may be outdated, so
+        the generation yielded before the request is passed on to `ResponseCache.set`
+        within the context. Generations are only kept while a request is in flight.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ResponseCache.make_key`.
+
+        Yields
+        ------
+        int
+            The generation of the resource of the key.
+        """
+        resource = key.partition("?")[0]
+        self._requests[resource] = self._requests.get(resource, 0) + 1
+
+        try:
+            yield self._generations.get(resource, 0)
+        finally:
+            self._requests[resource] -= 1
+
+            if not self._requests[resource]:
+                del self._requests[resource]
+                self._generations.pop(resource, None)
+
+    def set(
+        self, name: str, key: str, value: Any, *, generation: int | None = None
+    ) -> None:
+        """Cache a response, leaving eviction to the backend.
+
+        Nothing is cached within `ravyapi.cache.responses.no_admit`, or if the
+        resource was invalidated since the response was requested.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        key : str
+            The key built by `ResponseCache.make_key`.
+        value : Any
+            The model response to cache.
+        generation : int | None
+            The generation of the key yielded by `ResponseCache.track_request`, if any.
+        """
+        ttl = self.ttl_for(name)
+
+        if ttl <= 0 or not _ADMIT.get() or self._outdated(key, generation):
+            return
+
+        now = time.time()
+        self._backend.set(key, CacheEntry(name, value, now, now + ttl))
+
+    def set_not_found(
+        self,
+        name: str,
+        key: str,
+        error: NotFoundError,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """Cache a not found error of a lookup for the negative TTL of its endpoint.
+
+        Only the error data is kept, in a new error without the traceback, context
+        or cause of the raised one, so the frames of the lookup are not kept alive.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        key : str
+            The key built by `ResponseCache.make_key`.
+        error : NotFoundError
+            The error raised by the lookup.
+        generation : int | None
+            The generation of the key yielded by `ResponseCache.track_request`, if any.
+        """
+        ttl = self.negative_ttl_for(name)
+
+        if ttl <= 0 or not _ADMIT.get() or self._outdated(key, generation):
+            return
+
+        now = time.time()
+        self._backend.set(
+            key, CacheEntry(name, NotFoundError(error.exc_data), now, now + ttl)
+        )
+
+    def _outdated(self, key: str, generation: int | None) -> bool:
+        """Check whether the resource of a key was invalidated since `generation`."""
+        return generation is not None and generation != self._generations.get(
+            key.partition("?")[0], 0
+        )
+
+    def refresh(self, name: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a cached response in the background, unless already refreshing.
+
+        Failed refreshes are logged and leave the cached response in place.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        key : str
+            The key built by `ResponseCache.make_key`.
+        fetch : Callable[[], Awaitable[Any]]
+            A function requesting the current model response.
+        """
+        if key in self._refreshing:
+            return
+
+        future = asyncio.ensure_future(self._refresh(name, key, fetch))
+        self._refreshing[key] = future
+        future.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self, name: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Request and cache the current response of a cached lookup."""
+        _LOGGER.debug("Refreshing stale cache entry %s", key)
+        _ADMIT.set(True)  # only affects the task of this refresh
+
+        with self.track_request(key) as generation:
+            try:
+                value = await fetch()
+            except NotFoundError as exc:
+                self.set_not_found(name, key, exc, generation=generation)
+                return
+            except Exception:
+                _LOGGER.warning("Failed to refresh cache entry %s", key, exc_info=True)
+                return
+
+            self.set(name, key, value, generation=generation)
+
+    def cancel_refreshes(self) -> None:
+        """Cancel every pending background refresh."""
+        for future in tuple(self._refreshing.values()):
+            future.cancel()
+
+    def delete(self, key: str) -> None:
+        """Remove a cached response if it exists.
+
+        Parameters
+        ----------
+        key : str
+            The key built by `ResponseCache.make_key`.
+        """
+        self._backend.delete(key)
+
+    def invalidate(self, name: str, resource: Any) -> None:
+        """Remove every cached response of a resource, whatever its other arguments.
+
+        Background refreshes of those responses are cancelled, and the generation of
+        the resource is bumped, so responses requested before the resource changed
+        are not cached.
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint.
+        resource : Any
+            The resource that changed, such as a user ID or a URL.
+        """
+        key = self.make_key(name, resource, {})
+
+        if key in self._requests:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+        self._backend.delete(key)
+        self._backend.delete_prefix(f"{key}?")
+
+        for refreshing, future in tuple(self._refreshing.items()):
+            if refreshing == key or refreshing.startswith(f"{key}?"):
+                future.cancel()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._backend.clear()
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of cached responses."""
+        return self._max_entries
+
+    @property
+    def ttl(self) -> float:
+        """The default number of seconds a response is cached for."""
+        return self._ttl
+
+    @property
+    def ttls(self) -> dict[str, float]:
+        """The number of seconds a response is cached for, by endpoint name, overriding `ttl`."""
+        return self._ttls
+
+    @property
+    def negative_ttl(self) -> float:
+        """The default number of seconds a not found error is cached for."""
+        return self._negative_ttl
+
+    @property
+    def negative_ttls(self) -> dict[str, float]:
+        """The number of seconds a not found error is cached for, by endpoint name."""
+        return self._negative_ttls
+
+    @property
+    def max_stale(self) -> float:
+        """The default number of seconds an expired response is served for while refreshed."""
+        return self._max_stale
+
+    @property
+    def max_stales(self) -> dict[str, float]:
+        """The number of seconds an expired response is served for while refreshed, by endpoint name."""
+        return self._max_stales
+
+    @property
+    def backend(self) -> CacheBackend:
+        """The backend the responses are stored in."""
+        return self._backend
+
+    @property
+    def stats(self) -> dict[str, CacheStats]:
+        """The lookup counters of each endpoint name."""
+        return self._stats
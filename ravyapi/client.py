@@ -18,11 +18,18 @@ from __future__ import annotations
 __all__: tuple[str, ...] = ("Client",)
 
 import logging
+from types import TracebackType
 
 from typing_extensions import Final
 
 from ravyapi.api.endpoints import Avatars, Guilds, KSoft, Tokens, URLs, Users
+from ravyapi.cache import CacheReport, ResponseCache
+from ravyapi.connections import ConnectionSettings
+from ravyapi.const import PERMISSIONS_TTL
 from ravyapi.http import HTTPClient
+from ravyapi.ratelimits import RateLimiter
+from ravyapi.retries import RetryPolicy
+from ravyapi.serialization import JSONCodec
 
 _LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.client")
 
@@ -60,15 +67,49 @@ class Client:
         "_tokens",
     )
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        ratelimiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_settings: ConnectionSettings | None = None,
+        cache: ResponseCache | None = None,
+        permissions_ttl: float = PERMISSIONS_TTL,
+        json_codec: JSONCodec | None = None,
+        keep_raw: bool = True,
+    ) -> None:
         """
         Parameters
         ----------
         token : str
             The token used to authenticate with the API.
+        ratelimiter : RateLimiter | None
+            The `ravyapi.ratelimits.RateLimiter` pacing requests, a default one is used if `None`.
+        retry_policy : RetryPolicy | None
+            The `ravyapi.retries.RetryPolicy` for transient failures, a default one is used if `None`.
+        connection_settings : ConnectionSettings | None
+            The `ravyapi.connections.ConnectionSettings` for the connection pool, defaults are used if `None`.
+        cache : ResponseCache | None
+            The `ravyapi.cache.ResponseCache` for responses of read endpoints, caching is disabled if `None`.
+        permissions_ttl : float
+            The number of seconds before the permissions of the token are refreshed in the background, never if 0.
+        json_codec : JSONCodec | None
+            The `ravyapi.serialization.JSONCodec` for request and response bodies, detected if `None`.
+        keep_raw : bool
+            Whether models keep the raw data returned from the Ravy API, otherwise `data` is rebuilt from their fields on access.
         """
         self._token: str = token
-        self._http: HTTPClient = HTTPClient(self._token)
+        self._http: HTTPClient = HTTPClient(
+            self._token,
+            ratelimiter=ratelimiter,
+            retry_policy=retry_policy,
+            connection_settings=connection_settings,
+            cache=cache,
+            permissions_ttl=permissions_ttl,
+            json_codec=json_codec,
+            keep_raw=keep_raw,
+        )
         self._closed: bool = False
         self._avatars: Avatars = Avatars(self._http)
         self._guilds: Guilds = Guilds(self._http)
@@ -77,6 +118,18 @@ class Client:
         self._urls: URLs = URLs(self._http)
         self._tokens: Tokens = Tokens(self._http)
 
+    async def __aenter__(self) -> Client:
+        await self._http.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """Closes the client, shutting down the underlying HTTP client."""
         await self._http.close()
@@ -84,6 +137,27 @@ class Client:
 
         _LOGGER.info("Client is successfully closed")
 
+    async def fetch_permissions(self) -> None:
+        """Fetch the permissions of the token ahead of the first endpoint call.
+
+        Endpoints fetch the permissions on first use otherwise; awaiting this at
+        startup keeps that request off the path of the first calls.
+        """
+        await self._http.get_permissions()
+
+    def cache_stats(self) -> dict[str, CacheReport]:
+        """Get the hits, misses, evictions, coalesced requests and memory use of each endpoint.
+
+        Every cached entry is walked to estimate its size, so this is meant for
+        occasional monitoring rather than hot paths.
+
+        Returns
+        -------
+        dict[str, CacheReport]
+            A `ravyapi.cache.CacheReport` for each endpoint name, such as `users.bans`.
+        """
+        return self._http.cache_stats()
+
     def set_phisherman_token(self, token: str) -> Client:
         """Sets the phisherman token for the client.
 
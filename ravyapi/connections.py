@@ -0,0 +1,181 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Connection pool settings for the underlying aiohttp session."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("ConnectionSettings",)
+
+import aiohttp
+
+from ravyapi.const import (
+    CONNECTION_DNS_CACHE_TTL,
+    CONNECTION_HAPPY_EYEBALLS_DELAY,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+)
+
+
+class ConnectionSettings:
+    """Settings for the connection pool used to make requests.
+
+    The defaults are tuned for high throughput to a single host: a large pool so
+    concurrent requests do not queue for a connection, long-lived keepalive so
+    connections (and their TLS sessions) are reused, and a long DNS cache.
+
+    Attributes
+    ----------
+    limit : int
+        The maximum number of open connections, 0 for no limit.
+    limit_per_host : int
+        The maximum number of open connections to a single host, 0 for no limit.
+    keepalive_timeout : float
+        The number of seconds an idle connection is kept open for reuse.
+    dns_cache_ttl : int | None
+        The number of seconds DNS lookups are cached for, `None` to cache forever.
+    happy_eyeballs_delay : float | None
+        The number of seconds before racing the next address when connecting,
+        `None` to disable Happy Eyeballs and try addresses sequentially.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_limit",
+        "_limit_per_host",
+        "_keepalive_timeout",
+        "_dns_cache_ttl",
+        "_happy_eyeballs_delay",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = CONNECTION_LIMIT,
+        limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = CONNECTION_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int | None = CONNECTION_DNS_CACHE_TTL,
+        happy_eyeballs_delay: float | None = CONNECTION_HAPPY_EYEBALLS_DELAY,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        limit : int
+            The maximum number of open connections, 0 for no limit.
+        limit_per_host : int
+            The maximum number of open connections to a single host, 0 for no limit.
+        keepalive_timeout : float
+            The number of seconds an idle connection is kept open for reuse.
+        dns_cache_ttl : int | None
+            The number of seconds DNS lookups are cached for, `None` to cache forever.
+        happy_eyeballs_delay : float | None
+            The number of seconds before racing the next address when connecting,
+            `None` to disable Happy Eyeballs and try addresses sequentially.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(limit, int):
+            raise TypeError('Parameter "limit" must be of type "int"')
+
+        if limit < 0:
+            raise ValueError('Parameter "limit" must not be negative')
+
+        if not isinstance(limit_per_host, int):
+            raise TypeError('Parameter "limit_per_host" must be of type "int"')
+
+        if limit_per_host < 0:
+            raise ValueError('Parameter "limit_per_host" must not be negative')
+
+        if not isinstance(keepalive_timeout, (int, float)):
+            raise TypeError('Parameter "keepalive_timeout" must be of type "float"')
+
+        if keepalive_timeout < 0:
+            raise ValueError('Parameter "keepalive_timeout" must not be negative')
+
+        if dns_cache_ttl is not None and not isinstance(dns_cache_ttl, int):
+            raise TypeError('Parameter "dns_cache_ttl" must be of type "int"')
+
+        if dns_cache_ttl is not None and dns_cache_ttl < 0:
+            raise ValueError('Parameter "dns_cache_ttl" must not be negative')
+
+        if happy_eyeballs_delay is not None and not isinstance(
+            happy_eyeballs_delay, (int, float)
+        ):
+            raise TypeError('Parameter "happy_eyeballs_delay" must be of type "float"')
+
+        if happy_eyeballs_delay is not None and happy_eyeballs_delay < 0:
+            raise ValueError('Parameter "happy_eyeballs_delay" must not be negative')
+
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = float(keepalive_timeout)
+        self._dns_cache_ttl: int | None = dns_cache_ttl
+        self._happy_eyeballs_delay: float | None = happy_eyeballs_delay
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(limit={self.limit!r}, limit_per_host={self.limit_per_host!r}, "
+            f"keepalive_timeout={self.keepalive_timeout!r}, "
+            f"dns_cache_ttl={self.dns_cache_ttl!r}, "
+            f"happy_eyeballs_delay={self.happy_eyeballs_delay!r})"
+        )
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """Create a connector with these settings.
+
+        This must be called from within a running event loop.
+
+        Returns
+        -------
+        aiohttp.TCPConnector
+            A new connector for an aiohttp session.
+        """
+        return aiohttp.TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+            happy_eyeballs_delay=self._happy_eyeballs_delay,
+        )
+
+    @property
+    def limit(self) -> int:
+        """The maximum number of open connections, 0 for no limit."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """The maximum number of open connections to a single host, 0 for no limit."""
+        return self._limit_per_host
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """The number of seconds an idle connection is kept open for reuse."""
+        return self._keepalive_timeout
+
+    @property
+    def dns_cache_ttl(self) -> int | None:
+        """The number of seconds DNS lookups are cached for, `None` to cache forever."""
+        return self._dns_cache_ttl
+
+    @property
+    def happy_eyeballs_delay(self) -> float | None:
+        """The number of seconds before racing the next address when connecting."""
+        return self._happy_eyeballs_delay
@@ -41,6 +41,25 @@ __all__: tuple[str, ...] = (
     "RAVY_TOKEN_REGEX",
     "KSOFT_TOKEN_REGEX",
     "USER_AGENT",
+    "BULK_CONCURRENCY",
+    "RATELIMIT_CAPACITY",
+    "RATELIMIT_REFILL_RATE",
+    "RATELIMIT_MAX_RETRIES",
+    "RATELIMIT_RETRY_AFTER",
+    "RETRY_MAX_ATTEMPTS",
+    "RETRY_BASE_DELAY",
+    "RETRY_MAX_DELAY",
+    "RETRY_DEADLINE",
+    "CONNECTION_LIMIT",
+    "CONNECTION_LIMIT_PER_HOST",
+    "CONNECTION_KEEPALIVE_TIMEOUT",
+    "CONNECTION_DNS_CACHE_TTL",
+    "CONNECTION_HAPPY_EYEBALLS_DELAY",
+    "CACHE_MAX_ENTRIES",
+    "CACHE_TTL",
+    "CACHE_NEGATIVE_TTL",
+    "PERMISSIONS_TTL",
+    "PERMISSIONS_RETRY_DELAY",
 )
 
 import platform
@@ -67,3 +86,60 @@ USER_AGENT: Final[str] = (
     f"{platform.system()} {platform.architecture()[0]}"
 )
 """The user agent for requests."""
+
+BULK_CONCURRENCY: Final[int] = 32
+"""The default number of concurrent requests made by bulk lookups."""
+
+RATELIMIT_CAPACITY: Final[int] = 50
+"""The default number of requests a route bucket allows in a burst."""
+
+RATELIMIT_REFILL_RATE: Final[float] = 50.0
+"""The default number of requests per second a route bucket allows."""
+
+RATELIMIT_MAX_RETRIES: Final[int] = 3
+"""The default number of times a request is retried after a 429 response."""
+
+RATELIMIT_RETRY_AFTER: Final[float] = 1.0
+"""The default number of seconds to wait after a 429 response without `Retry-After`."""
+
+RETRY_MAX_ATTEMPTS: Final[int] = 3
+"""The default number of attempts made for an idempotent request."""
+
+RETRY_BASE_DELAY: Final[float] = 0.25
+"""The default backoff delay in seconds before jitter for the first retry."""
+
+RETRY_MAX_DELAY: Final[float] = 8.0
+"""The default maximum backoff delay in seconds before jitter."""
+
+RETRY_DEADLINE: Final[float] = 30.0
+"""The default maximum number of seconds spent on a request including retries."""
+
+CONNECTION_LIMIT: Final[int] = 256
+"""The default maximum number of open connections."""
+
+CONNECTION_LIMIT_PER_HOST: Final[int] = 0
+"""The default maximum number of open connections to a single host, 0 for no limit."""
+
+CONNECTION_KEEPALIVE_TIMEOUT: Final[float] = 60.0
+"""The default number of seconds an idle connection is kept open for reuse."""
+
+CONNECTION_DNS_CACHE_TTL: Final[int] = 300
+"""The default number of seconds DNS lookups are cached for."""
+
+CONNECTION_HAPPY_EYEBALLS_DELAY: Final[float] = 0.25
+"""The default number of seconds before racing the next address when connecting."""
+
+CACHE_MAX_ENTRIES: Final[int] = 10_000
+"""The default maximum number of cached responses."""
+
+CACHE_TTL: Final[float] = 300.0
+"""The default number of seconds a response is cached for."""
+
+CACHE_NEGATIVE_TTL: Final[float] = 30.0
+"""The default number of seconds a not found error is cached for."""
+
+PERMISSIONS_TTL: Final[float] = 3600.0
+"""The default number of seconds before the permissions of a token are refreshed."""
+
+PERMISSIONS_RETRY_DELAY: Final[float] = 5.0
+"""The number of seconds before a failed refresh of the permissions is tried again."""
@@ -17,9 +17,14 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = ("HTTPClient", "HTTPAwareEndpoint")
 
+import asyncio
+import json
 import logging
+import math
 import re
-from typing import Any
+import time
+import urllib.parse
+from typing import Any, Callable, TypeVar
 
 import aiohttp
 from typing_extensions import Final
@@ -34,10 +39,24 @@ from ravyapi.api.errors import (
 )
 from ravyapi.api.models import GetTokenResponse
 from ravyapi.api.paths import Paths
-from ravyapi.const import BASE_URL, KSOFT_TOKEN_REGEX, RAVY_TOKEN_REGEX, USER_AGENT
+from ravyapi.cache import CacheReport, ResponseCache
+from ravyapi.connections import ConnectionSettings
+from ravyapi.const import (
+    BASE_URL,
+    KSOFT_TOKEN_REGEX,
+    PERMISSIONS_RETRY_DELAY,
+    PERMISSIONS_TTL,
+    RAVY_TOKEN_REGEX,
+    USER_AGENT,
+)
+from ravyapi.ratelimits import RateLimiter
+from ravyapi.retries import RetryPolicy
+from ravyapi.serialization import JSONCodec
 
 _LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.http")
 
+_T = TypeVar("_T")
+
 
 class HTTPClient:
     """Internal client using aiohttp to work with networking."""
@@ -48,9 +67,41 @@ class HTTPClient:
         "_phisherman_token",
         "_headers",
         "_session",
+        "_ratelimiter",
+        "_retry_policy",
+        "_connection_settings",
+        "_cache",
+        "_inflight",
+        "_coalesced",
+        "_permissions_fetch",
+        "_permissions_ttl",
+        "_permissions_fetched_at",
+        "_permissions_failed_at",
+        "_json",
+        "_keep_raw",
     )
 
-    def __init__(self, token: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        ratelimiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_settings: ConnectionSettings | None = None,
+        cache: ResponseCache | None = None,
+        permissions_ttl: float = PERMISSIONS_TTL,
+        json_codec: JSONCodec | None = None,
+        keep_raw: bool = True,
+    ) -> None:
+        if not isinstance(permissions_ttl, (int, float)):
+            raise TypeError('Parameter "permissions_ttl" must be of type "float"')
+
+        if permissions_ttl < 0:
+            raise ValueError('Parameter "permissions_ttl" must not be negative')
+
+        if not isinstance(keep_raw, bool):
+            raise TypeError('Parameter "keep_raw" must be of type "bool"')
+
         self._token: str = self._token_sentinel(token)
         self._permissions: list[str] | None = None
         self._phisherman_token: str | None = None
@@ -58,18 +109,40 @@ class HTTPClient:
             "Authorization": token,
             "User-Agent": USER_AGENT,
         }
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers=self._headers
+        self._connection_settings: ConnectionSettings = (
+            ConnectionSettings() if connection_settings is None else connection_settings
+        )
+        self._session: aiohttp.ClientSession | None = None
+        self._cache: ResponseCache | None = cache
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._coalesced: dict[str, int] = {}
+        self._permissions_fetch: asyncio.Future[None] | None = None
+        self._permissions_ttl: float = float(permissions_ttl)
+        self._permissions_fetched_at: float = 0.0
+        self._permissions_failed_at: float = -math.inf
+        self._json: JSONCodec = JSONCodec() if json_codec is None else json_codec
+        self._keep_raw: bool = keep_raw
+        self._ratelimiter: RateLimiter = (
+            RateLimiter() if ratelimiter is None else ratelimiter
+        )
+        self._retry_policy: RetryPolicy = (
+            RetryPolicy() if retry_policy is None else retry_policy
         )
 
     @staticmethod
-    async def _handle_response(response: aiohttp.ClientResponse) -> None:
+    async def _handle_response(
+        response: aiohttp.ClientResponse,
+        *,
+        loads: Callable[[str], Any] = json.loads,
+    ) -> None:
         """Process response errors for requests.
 
         Parameters
         ----------
         response : aiohttp.ClientResponse
             The response to process from the API.
+        loads : Callable[[str], Any]
+            The function decoding JSON error bodies.
 
         Raises
         ------
@@ -81,7 +154,7 @@ class HTTPClient:
             return
 
         try:
-            data: str | dict[str, Any] = await response.json()
+            data: str | dict[str, Any] = await response.json(loads=loads)
             _LOGGER.debug("Response type is of JSON; returning as %s", type(data))
         except aiohttp.ContentTypeError:
             data = await response.text()  # errors are not always JSON
@@ -94,10 +167,11 @@ class HTTPClient:
             401: UnauthorizedError,
             403: ForbiddenError,
             404: NotFoundError,
-            429: TooManyRequestsError,
         }
 
-        if response.status in exception_map:
+        if response.status == 429:
+            raise TooManyRequestsError(data, RateLimiter.retry_after(response.headers))
+        elif response.status in exception_map:
             raise exception_map[response.status](data)
         else:
             raise HTTPError(response.status, data)
@@ -126,23 +200,228 @@ class HTTPClient:
         _LOGGER.debug("Token is successfully validated")
         return token
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the underlying aiohttp client, creating it on first use.
+
+        The session is created lazily so it binds to the running event loop rather
+        than whichever loop (if any) existed when the client was constructed. Creation
+        never yields to the event loop, so concurrent first requests cannot race to
+        create more than one session.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The underlying aiohttp client.
+        """
+        if self._session is None:
+            _LOGGER.debug("Creating underlying aiohttp client")
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=self._connection_settings.create_connector(),
+                json_serialize=self._json.dumps,
+            )
+
+        return self._session
+
+    async def start(self) -> None:
+        """Create the underlying aiohttp client if it was not created yet."""
+        self._get_session()
+
     async def get_permissions(self) -> None:
-        """Get the permissions for the current token."""
+        """Get the permissions for the current token.
+
+        Concurrent callers share a single request, and cancelling one of them does
+        not cancel the request for the others. Once the permissions are older than
+        the permissions TTL, or were invalidated, they are refreshed in the background
+        while callers keep using the current ones.
+        """
         _LOGGER.debug("Getting permissions from token")
 
         if self._permissions is not None:
             _LOGGER.debug("Permissions already set; skipping API call")
+
+            if self._permissions_expired():
+                self._start_permissions_fetch()
+
             return
 
+        await asyncio.shield(self._start_permissions_fetch())
+
+    def invalidate_permissions(self) -> None:
+        """Mark the permissions for the current token to be refreshed on next use."""
+        _LOGGER.debug("Invalidating permissions")
+        self._permissions_fetched_at = -math.inf
+
+    def _permissions_expired(self) -> bool:
+        """Check whether the permissions are due to be refreshed.
+
+        After a failed refresh, another is only made once the retry delay, capped by
+        the permissions TTL, has passed.
+        """
+        retry_delay = PERMISSIONS_RETRY_DELAY
+
+        if self._permissions_ttl > 0:
+            retry_delay = min(retry_delay, self._permissions_ttl)
+
+        if time.monotonic() - self._permissions_failed_at < retry_delay:
+            return False
+
+        if self._permissions_fetched_at == -math.inf:
+            return True
+
+        return (
+            self._permissions_ttl > 0
+            and time.monotonic() - self._permissions_fetched_at >= self._permissions_ttl
+        )
+
+    def _start_permissions_fetch(self) -> asyncio.Future[None]:
+        """Start fetching the permissions unless a fetch is already running."""
+        if self._permissions_fetch is None:
+            self._permissions_fetch = asyncio.ensure_future(self._fetch_permissions())
+            self._permissions_fetch.add_done_callback(self._finish_permissions_fetch)
+        else:
+            _LOGGER.debug("Permissions already being fetched; sharing the request")
+
+        return self._permissions_fetch
+
+    async def _fetch_permissions(self) -> None:
+        """Internal method to request and set the permissions for the current token."""
         self._permissions = GetTokenResponse(
             await self.get(self.paths.tokens.route)
         ).access
+        self._permissions_fetched_at = time.monotonic()
 
         _LOGGER.debug("Permissions are now set: %s", self.permissions)
 
+    def _finish_permissions_fetch(self, task: asyncio.Future[None]) -> None:
+        """Forget a finished permissions fetch so a failed one can be retried."""
+        self._permissions_fetch = None
+
+        if not task.cancelled() and task.exception() is not None:
+            self._permissions_failed_at = time.monotonic()
+            _LOGGER.warning("Failed to fetch permissions: %r", task.exception())
+
+    async def _request(
+        self,
+        method: Callable[..., Any],
+        path: str,
+        decode: Callable[[bytes], _T],
+        *,
+        idempotent: bool = False,
+        **kwargs: Any,
+    ) -> _T:
+        """Internal method to make a rate limited request to the given path.
+
+        Requests are paced by the route bucket of the path. If the API responds with
+        429 the bucket is parked and the request retried once it is released, and
+        idempotent requests are also retried after transient failures according to the
+        retry policy. No retry is made past the deadline of the retry policy.
+
+        Parameters
+        ----------
+        method : Callable[..., Any]
+            The aiohttp session method to make the request with.
+        path : str
+            The path to make the request to.
+        decode : Callable[[bytes], _T]
+            The function decoding the response body.
+        idempotent : bool
+            Whether the request can safely be retried after transient failures.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+
+        Returns
+        -------
+        _T
+            The decoded response from the API.
+        """
+        started = time.monotonic()
+        attempt = 0
+        ratelimited = 0
+        # multipart bodies are consumed by aiohttp and cannot be sent again
+        resendable = not isinstance(kwargs.get("data"), aiohttp.FormData)
+
+        while True:
+            try:
+                return await self._send(method, path, decode, **kwargs)
+            except TooManyRequestsError as exc:
+                # the parked bucket delays the next attempt until it is released
+                self._ratelimiter.park(path, exc.retry_after)
+                ratelimited += 1
+
+                if (
+                    not resendable
+                    or ratelimited > self._ratelimiter.max_retries
+                    or self._past_deadline(started, exc.retry_after or 0.0)
+                ):
+                    raise
+            except (UnauthorizedError, ForbiddenError):
+                # the scopes of the token may have changed since they were fetched
+                if path != self.paths.tokens.route:
+                    self.invalidate_permissions()
+                raise
+            except Exception as exc:
+                if not (idempotent and self._retry_policy.is_transient(exc)):
+                    raise
+
+                delay = self._retry_policy.backoff(attempt)
+                attempt += 1
+
+                if attempt >= self._retry_policy.max_attempts or self._past_deadline(
+                    started, delay
+                ):
+                    raise
+
+                _LOGGER.warning(
+                    "Request to %s failed with %r; retrying in %.3fs", path, exc, delay
+                )
+                await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: Callable[..., Any],
+        path: str,
+        decode: Callable[[bytes], _T],
+        **kwargs: Any,
+    ) -> _T:
+        """Internal method to make a single rate limited attempt of a request.
+
+        Parameters
+        ----------
+        method : Callable[..., Any]
+            The aiohttp session method to make the request with.
+        path : str
+            The path to make the request to.
+        decode : Callable[[bytes], _T]
+            The function decoding the response body.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+
+        Returns
+        -------
+        _T
+            The decoded response from the API.
+        """
+        await self._ratelimiter.acquire(path)
+
+        async with method(BASE_URL + path, **kwargs) as response:
+            self._ratelimiter.update(path, response.headers)
+            await self._handle_response(response, loads=self._json.loads)
+
+            # decoded from bytes, skipping the text decoding of response.json
+            return decode(await response.read())
+
+    def _past_deadline(self, started: float, delay: float) -> bool:
+        """Check whether waiting `delay` more seconds would pass the retry deadline."""
+        deadline = self._retry_policy.deadline
+        return deadline is not None and time.monotonic() - started + delay > deadline
+
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Internal method to make a GET request to the given path.
 
+        Concurrent identical requests, with the same path and query parameters, are
+        coalesced into a single request whose response is shared by every caller.
+
         Parameters
         ----------
         path : str
@@ -155,12 +434,116 @@ class HTTPClient:
         dict[str, Any]
             The JSON response from the API.
         """
-        _LOGGER.debug("Making GET request to %s", path)
-        async with self._session.get(BASE_URL + path, **kwargs) as response:
-            await self._handle_response(response)
+        data: dict[str, Any] = await self._get(path, "", self._json.loads, **kwargs)
+        return data
+
+    async def get_model(self, path: str, model: Callable[..., _T], **kwargs: Any) -> _T:
+        """Internal method to make a GET request to the given path for a model.
+
+        The response is decoded straight into the model if the JSON codec supports
+        it, and otherwise the model is built from the JSON response. Requests are
+        coalesced like with `get`.
+
+        Parameters
+        ----------
+        path : str
+            The path to make the request to.
+        model : Callable[..., _T]
+            The response model to build.
+        **kwargs : Any
+            The keyword arguments to pass to aiohttp.
+
+        Returns
+        -------
+        _T
+            The response model.
+        """
+        decode = self._json.decoder(model)
+
+        if decode is None:
+            return model(await self.get(path, **kwargs), keep_raw=self._keep_raw)
+
+        return await self._get(path, model.__qualname__, decode, **kwargs)
+
+    async def _get(
+        self, path: str, tag: str, decode: Callable[[bytes], _T], **kwargs: Any
+    ) -> _T:
+        """Internal method to make a coalesced GET request decoded by `decode`.
+
+        Only requests with the same `tag` are coalesced, as they decode alike.
+        """
+        key = self._coalesce_key("GET", path, kwargs)
+
+        if key is None:
+            _LOGGER.debug("Making GET request to %s", path)
+            return await self._request(
+                self._get_session().get, path, decode, idempotent=True, **kwargs
+            )
+
+        key += tag
+        task: asyncio.Future[Any] | None = self._inflight.get(key)
+
+        if task is None:
+            _LOGGER.debug("Making GET request to %s", path)
+            task = asyncio.ensure_future(
+                self._request(
+                    self._get_session().get, path, decode, idempotent=True, **kwargs
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        else:
+            _LOGGER.debug("Coalescing GET request to %s with one in flight", path)
+            name = self._endpoint_name(path)
+            self._coalesced[name] = self._coalesced.get(name, 0) + 1
+
+        # shielded so a cancelled caller does not cancel the request for the others
+        result: _T = await asyncio.shield(task)
+        return result
+
+    @staticmethod
+    def _coalesce_key(method: str, path: str, kwargs: dict[str, Any]) -> str | None:
+        """Build the key identical in-flight requests are coalesced by.
+
+        Returns `None` if the request has options other than query parameters, as
+        those are not safe to share a response between.
+        """
+        if any(option != "params" for option in kwargs):
+            return None
+
+        params = sorted(
+            (str(k), str(v)) for k, v in dict(kwargs.get("params") or {}).items()
+        )
+        return f"{method} {path}?{urllib.parse.urlencode(params)}"
+
+    @staticmethod
+    def _endpoint_name(path: str) -> str:
+        """Name the endpoint of a path like the cache does, such as `users.bans`."""
+        return ".".join(part for part in path.split("/") if part and not part.isdigit())
+
+    def _finish_inflight(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a finished in-flight request, retrieving its exception if any."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        if not task.cancelled():
+            task.exception()  # every caller may have been cancelled
+
+    def cache_stats(self) -> dict[str, CacheReport]:
+        """Build a snapshot of the cache use of each endpoint.
+
+        Returns
+        -------
+        dict[str, CacheReport]
+            The `ravyapi.cache.ResponseCache.report` of the cache, if any, with the
+            number of coalesced requests of each endpoint added.
+        """
+        reports = {} if self._cache is None else self._cache.report()
+
+        for name, coalesced in self._coalesced.items():
+            reports.setdefault(name, CacheReport()).coalesced = coalesced
 
-            data: dict[str, Any] = await response.json()
-            return data
+        return reports
 
     async def post(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Internal method to make a POST request to the given path.
@@ -178,11 +561,10 @@ class HTTPClient:
             The JSON response from the API.
         """
         _LOGGER.debug("Making POST request to %s", path)
-        async with self._session.post(BASE_URL + path, **kwargs) as response:
-            await self._handle_response(response)
-
-            data: dict[str, Any] = await response.json()
-            return data
+        data: dict[str, Any] = await self._request(
+            self._get_session().post, path, self._json.loads, **kwargs
+        )
+        return data
 
     def set_phisherman_token(self, token: str) -> None:
         """Set the phisherman token for use in `urls` endpoint routes."""
@@ -191,18 +573,61 @@ class HTTPClient:
     async def close(self) -> None:
         """Close the underlying aiohttp client."""
         _LOGGER.debug("Closing underlying aiohttp client")
-        await self._session.close()
+
+        if self._cache is not None:
+            self._cache.cancel_refreshes()
+
+        if self._permissions_fetch is not None:
+            self._permissions_fetch.cancel()
+
+        if self._session is not None:
+            await self._session.close()
 
     @property
     def headers(self) -> dict[str, str]:
         """The headers set in the aiohttp client for requests."""
         return self._headers
 
+    @property
+    def ratelimiter(self) -> RateLimiter:
+        """The client-side rate limiter pacing requests."""
+        return self._ratelimiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The policy for retrying idempotent requests after transient failures."""
+        return self._retry_policy
+
+    @property
+    def connection_settings(self) -> ConnectionSettings:
+        """The settings for the connection pool used to make requests."""
+        return self._connection_settings
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The cache for responses of read endpoints, `None` if caching is disabled."""
+        return self._cache
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The `ravyapi.serialization.JSONCodec` decoding and encoding bodies."""
+        return self._json
+
+    @property
+    def keep_raw(self) -> bool:
+        """Whether models keep the raw data returned from the Ravy API."""
+        return self._keep_raw
+
     @property
     def paths(self) -> Paths:
         """An instance of `ravyapi.api.paths.Path` for routing."""
         return Paths()
 
+    @property
+    def permissions_ttl(self) -> float:
+        """The number of seconds before the permissions are refreshed, never if 0."""
+        return self._permissions_ttl
+
     @property
     def permissions(self) -> list[str] | None:
         """The current permissions for the token.
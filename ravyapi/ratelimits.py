@@ -0,0 +1,378 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Client-side rate limiting for requests made to the Ravy API."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("RateLimiter", "TokenBucket")
+
+import asyncio
+import logging
+import time
+from typing import Mapping
+
+from typing_extensions import Final
+
+from ravyapi.const import (
+    RATELIMIT_CAPACITY,
+    RATELIMIT_MAX_RETRIES,
+    RATELIMIT_REFILL_RATE,
+    RATELIMIT_RETRY_AFTER,
+)
+
+_LOGGER: Final[logging.Logger] = logging.getLogger("ravyapi.ratelimits")
+
+
+def _parse_float(value: str | None) -> float | None:
+    """Parse a numeric header value, returning `None` if it is missing or malformed."""
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """A token bucket pacing the requests made to a single route bucket.
+
+    Each request takes a token, and tokens are refilled continuously up to the
+    bucket's capacity. When no token is available the request is scheduled for when
+    one will be, so waiters are released in order instead of all at once. A bucket can
+    also be parked until a given time, after which requests resume.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of requests that can be made in a burst.
+    refill_rate : float
+        The number of tokens refilled per second.
+    tokens : float
+        The number of tokens currently available, negative if requests are queued.
+    reset_at : float
+        The `time.monotonic` time the bucket is parked until.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_capacity",
+        "_refill_rate",
+        "_tokens",
+        "_updated_at",
+        "_reset_at",
+    )
+
+    def __init__(self, capacity: int, refill_rate: float) -> None:
+        """
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of requests that can be made in a burst.
+        refill_rate : float
+            The number of tokens refilled per second.
+        """
+        self._capacity: int = capacity
+        self._refill_rate: float = refill_rate
+        self._tokens: float = float(capacity)
+        self._updated_at: float = time.monotonic()
+        self._reset_at: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(capacity={self.capacity!r}, refill_rate={self.refill_rate!r}, "
+            f"tokens={self.tokens!r})"
+        )
+
+    def _refill(self, now: float) -> None:
+        """Refill the tokens earned since the last update."""
+        elapsed = now - self._updated_at
+        self._tokens = min(
+            float(self._capacity), self._tokens + elapsed * self._refill_rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be made in this bucket, then take a token."""
+        now = time.monotonic()
+
+        self._refill(now)
+        self._tokens -= 1
+
+        if self._tokens < 0:
+            delay = -self._tokens / self._refill_rate
+            _LOGGER.debug("Bucket is exhausted; delaying request by %.3fs", delay)
+            await asyncio.sleep(delay)
+
+        while (delay := self._reset_at - time.monotonic()) > 0:
+            _LOGGER.debug("Bucket is parked; delaying request by %.3fs", delay)
+            await asyncio.sleep(delay)
+
+    def park(self, retry_after: float) -> None:
+        """Park the bucket so no requests are made for the given number of seconds.
+
+        Parameters
+        ----------
+        retry_after : float
+            The number of seconds to wait before making another request.
+        """
+        now = time.monotonic()
+
+        self._reset_at = max(self._reset_at, now + retry_after)
+        self._tokens = min(self._tokens, 0.0)
+
+        _LOGGER.debug("Bucket is parked for %.3fs", retry_after)
+
+    def update(self, remaining: float | None, reset_after: float | None) -> None:
+        """Reconcile the bucket with the rate limit state reported by the server.
+
+        Parameters
+        ----------
+        remaining : float | None
+            The number of requests the server reports are remaining, if known.
+        reset_after : float | None
+            The number of seconds until the server's window resets, if known.
+        """
+        if remaining is None:
+            return
+
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, remaining)
+
+        if remaining <= 0 and reset_after is not None:
+            self.park(reset_after)
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of requests that can be made in a burst."""
+        return self._capacity
+
+    @property
+    def refill_rate(self) -> float:
+        """The number of tokens refilled per second."""
+        return self._refill_rate
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available, negative if requests are queued."""
+        return self._tokens
+
+    @property
+    def reset_at(self) -> float:
+        """The `time.monotonic` time the bucket is parked until."""
+        return self._reset_at
+
+
+class RateLimiter:
+    """A client-side rate limiter with a `TokenBucket` for each route bucket.
+
+    Routes are bucketed by their major path, matching the path classes of
+    `ravyapi.api.paths.Paths`, so `/users/1/bans` and `/users/2` share the `users` bucket.
+    Requests are paced proactively, and when the API responds with 429 the bucket is
+    parked until its `Retry-After` time before the request is transparently retried.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of requests that can be made in a burst per bucket.
+    refill_rate : float
+        The number of requests per second allowed per bucket.
+    max_retries : int
+        The maximum number of times a request is retried after a 429 response.
+    buckets : dict[str, TokenBucket]
+        The token buckets created so far, keyed by route bucket.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_capacity",
+        "_refill_rate",
+        "_max_retries",
+        "_buckets",
+    )
+
+    def __init__(
+        self,
+        capacity: int = RATELIMIT_CAPACITY,
+        refill_rate: float = RATELIMIT_REFILL_RATE,
+        *,
+        max_retries: int = RATELIMIT_MAX_RETRIES,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of requests that can be made in a burst per bucket.
+        refill_rate : float
+            The number of requests per second allowed per bucket.
+        max_retries : int
+            The maximum number of times a request is retried after a 429 response.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(capacity, int):
+            raise TypeError('Parameter "capacity" must be of type "int"')
+
+        if capacity < 1:
+            raise ValueError('Parameter "capacity" must be greater than 0')
+
+        if not isinstance(refill_rate, (int, float)):
+            raise TypeError('Parameter "refill_rate" must be of type "float"')
+
+        if refill_rate <= 0:
+            raise ValueError('Parameter "refill_rate" must be greater than 0')
+
+        if not isinstance(max_retries, int):
+            raise TypeError('Parameter "max_retries" must be of type "int"')
+
+        if max_retries < 0:
+            raise ValueError('Parameter "max_retries" must not be negative')
+
+        self._capacity: int = capacity
+        self._refill_rate: float = float(refill_rate)
+        self._max_retries: int = max_retries
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(capacity={self.capacity!r}, refill_rate={self.refill_rate!r}, "
+            f"max_retries={self.max_retries!r})"
+        )
+
+    @staticmethod
+    def bucket_key(path: str) -> str:
+        """Get the route bucket a path belongs to.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, relative to the base URL.
+
+        Returns
+        -------
+        str
+            The major route of the path, such as `users` or `urls`.
+        """
+        return path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+    def get_bucket(self, path: str) -> TokenBucket:
+        """Get the token bucket for a path, creating it if it does not exist yet.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, relative to the base URL.
+
+        Returns
+        -------
+        TokenBucket
+            The token bucket the path belongs to.
+        """
+        key = self.bucket_key(path)
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self._capacity, self._refill_rate)
+
+        return bucket
+
+    async def acquire(self, path: str) -> None:
+        """Wait until a request to the path may be made.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, relative to the base URL.
+        """
+        await self.get_bucket(path).acquire()
+
+    def update(self, path: str, headers: Mapping[str, str]) -> None:
+        """Reconcile the bucket of a path with the rate limit headers of a response.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, relative to the base URL.
+        headers : Mapping[str, str]
+            The headers of the response.
+        """
+        remaining = _parse_float(headers.get("X-RateLimit-Remaining"))
+        reset_after = _parse_float(headers.get("X-RateLimit-Reset-After"))
+
+        if reset_after is None:
+            reset = _parse_float(headers.get("X-RateLimit-Reset"))
+            reset_after = None if reset is None else max(0.0, reset - time.time())
+
+        self.get_bucket(path).update(remaining, reset_after)
+
+    def park(self, path: str, retry_after: float | None) -> None:
+        """Park the bucket of a path after the API responded with 429.
+
+        Parameters
+        ----------
+        path : str
+            The path of the request, relative to the base URL.
+        retry_after : float | None
+            The number of seconds the API asked to wait, if it said so.
+        """
+        if retry_after is None:
+            retry_after = RATELIMIT_RETRY_AFTER
+
+        _LOGGER.warning(
+            "Ratelimited on bucket %r; retrying in %.3fs",
+            self.bucket_key(path),
+            retry_after,
+        )
+        self.get_bucket(path).park(retry_after)
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, str]) -> float | None:
+        """Get the number of seconds a 429 response asked to wait.
+
+        Parameters
+        ----------
+        headers : Mapping[str, str]
+            The headers of the response.
+
+        Returns
+        -------
+        float | None
+            The `Retry-After` seconds, or `None` if the header is missing or malformed.
+        """
+        return _parse_float(headers.get("Retry-After"))
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of requests that can be made in a burst per bucket."""
+        return self._capacity
+
+    @property
+    def refill_rate(self) -> float:
+        """The number of requests per second allowed per bucket."""
+        return self._refill_rate
+
+    @property
+    def max_retries(self) -> int:
+        """The maximum number of times a request is retried after a 429 response."""
+        return self._max_retries
+
+    @property
+    def buckets(self) -> dict[str, TokenBucket]:
+        """The token buckets created so far, keyed by route bucket."""
+        return self._buckets
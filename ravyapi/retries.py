@@ -0,0 +1,185 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retry policies for transient failures of requests made to the Ravy API."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("RetryPolicy",)
+
+import asyncio
+import random
+
+import aiohttp
+
+from ravyapi.api.errors import HTTPError, TooManyRequestsError
+from ravyapi.const import (
+    RETRY_BASE_DELAY,
+    RETRY_DEADLINE,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+)
+
+
+class RetryPolicy:
+    """A policy for retrying idempotent requests after transient failures.
+
+    Connection errors, timeouts and 5xx responses are retried with exponential
+    backoff and full jitter: the delay before retry `n` is a random value between 0
+    and `min(max_delay, base_delay * 2 ** n)`, which keeps many clients from retrying
+    in lockstep. Responses with 429 are retried once their route bucket is released
+    by the `ravyapi.ratelimits.RateLimiter`. No retry is made past the deadline.
+
+    Attributes
+    ----------
+    max_attempts : int
+        The maximum number of attempts made for a request, including the first.
+    base_delay : float
+        The backoff delay in seconds before jitter for the first retry.
+    max_delay : float
+        The maximum backoff delay in seconds before jitter.
+    deadline : float | None
+        The maximum number of seconds spent on a request including retries, if any.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_max_attempts",
+        "_base_delay",
+        "_max_delay",
+        "_deadline",
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        *,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        deadline: float | None = RETRY_DEADLINE,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_attempts : int
+            The maximum number of attempts made for a request, including the first.
+        base_delay : float
+            The backoff delay in seconds before jitter for the first retry.
+        max_delay : float
+            The maximum backoff delay in seconds before jitter.
+        deadline : float | None
+            The maximum number of seconds spent on a request including retries, if any.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ValueError
+            If any parameters are invalid values.
+        """
+        if not isinstance(max_attempts, int):
+            raise TypeError('Parameter "max_attempts" must be of type "int"')
+
+        if max_attempts < 1:
+            raise ValueError('Parameter "max_attempts" must be greater than 0')
+
+        if not isinstance(base_delay, (int, float)):
+            raise TypeError('Parameter "base_delay" must be of type "float"')
+
+        if base_delay < 0:
+            raise ValueError('Parameter "base_delay" must not be negative')
+
+        if not isinstance(max_delay, (int, float)):
+            raise TypeError('Parameter "max_delay" must be of type "float"')
+
+        if max_delay < base_delay:
+            raise ValueError('Parameter "max_delay" must not be less than "base_delay"')
+
+        if deadline is not None and not isinstance(deadline, (int, float)):
+            raise TypeError('Parameter "deadline" must be of type "float"')
+
+        if deadline is not None and deadline <= 0:
+            raise ValueError('Parameter "deadline" must be greater than 0')
+
+        self._max_attempts: int = max_attempts
+        self._base_delay: float = float(base_delay)
+        self._max_delay: float = float(max_delay)
+        self._deadline: float | None = None if deadline is None else float(deadline)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(max_attempts={self.max_attempts!r}, base_delay={self.base_delay!r}, "
+            f"max_delay={self.max_delay!r}, deadline={self.deadline!r})"
+        )
+
+    @staticmethod
+    def is_transient(exc: BaseException) -> bool:
+        """Check whether an exception is a transient failure worth retrying.
+
+        Parameters
+        ----------
+        exc : BaseException
+            The exception raised by the request.
+
+        Returns
+        -------
+        bool
+            Whether the exception is a connection error, a timeout, a 5xx or a 429.
+        """
+        if isinstance(exc, HTTPError):
+            return isinstance(exc, TooManyRequestsError) or exc.status >= 500
+
+        return isinstance(
+            exc,
+            (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+            ),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Get a fully jittered backoff delay for a retry.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the retry, starting from 0.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before the retry.
+        """
+        ceiling = min(self._max_delay, self._base_delay * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    @property
+    def max_attempts(self) -> int:
+        """The maximum number of attempts made for a request, including the first."""
+        return self._max_attempts
+
+    @property
+    def base_delay(self) -> float:
+        """The backoff delay in seconds before jitter for the first retry."""
+        return self._base_delay
+
+    @property
+    def max_delay(self) -> float:
+        """The maximum backoff delay in seconds before jitter."""
+        return self._max_delay
+
+    @property
+    def deadline(self) -> float | None:
+        """The maximum number of seconds spent on a request including retries, if any."""
+        return self._deadline
@@ -0,0 +1,194 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pluggable JSON encoding and decoding of request and response bodies."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("JSONCodec",)
+
+import json
+from types import ModuleType
+from typing import Any, Callable, Optional, TypeVar
+
+_ModelT = TypeVar("_ModelT")
+
+orjson: Optional[ModuleType]
+msgspec: Optional[ModuleType]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONCodec:
+    """The functions used to decode response bodies and encode request bodies.
+
+    By default `orjson` or else `msgspec` is used if installed, both of which decode
+    response bodies straight from bytes in a single pass, and the standard library
+    `json` module otherwise.
+
+    With typed decoding, responses of the `users` endpoint are decoded by `msgspec`
+    straight into the structs of `ravyapi.api.structs` and their models built from
+    those, skipping the intermediate dictionaries. Such models do not keep the raw
+    data, as if `keep_raw` was `False`, and rebuild it from their fields.
+
+    Attributes
+    ----------
+    loads : Callable[[bytes | str], Any]
+        The function decoding a JSON document.
+    dumps : Callable[[Any], str]
+        The function encoding a JSON document.
+    typed : bool
+        Whether supported responses are decoded straight into their models.
+    """
+
+    __slots__: tuple[str, ...] = ("_loads", "_dumps", "_decoders")
+
+    def __init__(
+        self,
+        loads: Callable[[bytes | str], Any] | None = None,
+        dumps: Callable[[Any], str] | None = None,
+        *,
+        typed: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        loads : Callable[[bytes | str], Any] | None
+            The function decoding a JSON document, detected if `None`.
+        dumps : Callable[[Any], str] | None
+            The function encoding a JSON document to a string, detected if `None`.
+        typed : bool
+            Whether supported responses are decoded straight into their models.
+
+        Raises
+        ------
+        TypeError
+            If any parameters are of invalid types.
+        ImportError
+            If typed decoding is enabled and msgspec is not installed.
+        """
+        if loads is not None and not callable(loads):
+            raise TypeError('Parameter "loads" must be callable')
+
+        if dumps is not None and not callable(dumps):
+            raise TypeError('Parameter "dumps" must be callable')
+
+        if not isinstance(typed, bool):
+            raise TypeError('Parameter "typed" must be of type "bool"')
+
+        if typed and msgspec is None:
+            raise ImportError('Typed decoding requires "msgspec"')
+
+        self._loads: Callable[[bytes | str], Any] = (
+            self._default_loads() if loads is None else loads
+        )
+        self._dumps: Callable[[Any], str] = (
+            self._default_dumps() if dumps is None else dumps
+        )
+        self._decoders: dict[Any, Callable[[bytes], Any] | None] | None = (
+            {} if typed else None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+            f"(loads={self.loads!r}, dumps={self.dumps!r}, typed={self.typed!r})"
+        )
+
+    @staticmethod
+    def _default_loads() -> Callable[[bytes | str], Any]:
+        """Get the fastest available function decoding a JSON document."""
+        loads: Callable[[bytes | str], Any]
+
+        if orjson is not None:
+            loads = orjson.loads
+        elif msgspec is not None:
+            # a reusable decoder skips building one for every response
+            loads = msgspec.json.Decoder().decode
+        else:
+            loads = json.loads
+
+        return loads
+
+    @staticmethod
+    def _default_dumps() -> Callable[[Any], str]:
+        """Get the fastest available function encoding a JSON document to a string."""
+        if orjson is not None:
+            dumps = orjson.dumps
+
+            def orjson_dumps(obj: Any) -> str:
+                encoded: bytes = dumps(obj)
+                return encoded.decode()
+
+            return orjson_dumps
+
+        if msgspec is not None:
+            encode = msgspec.json.Encoder().encode
+
+            def msgspec_dumps(obj: Any) -> str:
+                encoded: bytes = encode(obj)
+                return encoded.decode()
+
+            return msgspec_dumps
+
+        return json.dumps
+
+    @property
+    def loads(self) -> Callable[[bytes | str], Any]:
+        """The function decoding a JSON document."""
+        return self._loads
+
+    @property
+    def dumps(self) -> Callable[[Any], str]:
+        """The function encoding a JSON document."""
+        return self._dumps
+
+    @property
+    def typed(self) -> bool:
+        """Whether supported responses are decoded straight into their models."""
+        return self._decoders is not None
+
+    def decoder(
+        self, model: Callable[..., _ModelT]
+    ) -> Callable[[bytes], _ModelT] | None:
+        """Get the function decoding a response body straight into a model.
+
+        Parameters
+        ----------
+        model : Callable[..., _ModelT]
+            The response model to decode into.
+
+        Returns
+        -------
+        Callable[[bytes], _ModelT] | None
+            The function decoding a response body into the model, or `None` if typed
+            decoding is disabled or the model is not supported.
+        """
+        if self._decoders is None:
+            return None
+
+        if model not in self._decoders:
+            from ravyapi.api.structs import struct_decoder
+
+            self._decoders[model] = struct_decoder(model)
+
+        decoder: Callable[[bytes], _ModelT] | None = self._decoders[model]
+        return decoder
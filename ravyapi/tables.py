@@ -0,0 +1,246 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Columnar tables built from many model responses, such as bulk lookup results."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "ban_columns",
+    "ksoft_ban_columns",
+    "reputation_columns",
+    "to_arrow",
+    "to_pandas",
+)
+
+from typing import Any, Mapping, Union
+
+from typing_extensions import TypeAlias
+
+from ravyapi.api.errors import HTTPError
+from ravyapi.api.models import (
+    GetBansResponse,
+    GetGuildResponse,
+    GetKSoftBanResponse,
+    GetReputationResponse,
+    GetUserResponse,
+)
+
+_Columns: TypeAlias = "dict[str, list[Any]]"
+_BansResult: TypeAlias = Union[
+    GetBansResponse, GetGuildResponse, GetUserResponse, HTTPError
+]
+_ReputationResult: TypeAlias = Union[GetReputationResponse, GetUserResponse, HTTPError]
+
+
+def ban_columns(results: Mapping[int, _BansResult]) -> _Columns:
+    """Build a table with a row for every ban entry of many users or guilds.
+
+    Results which are `ravyapi.api.errors.HTTPError` instances are skipped, so the
+    results of bulk lookups such as `ravyapi.api.endpoints.users.Users.get_bans_bulk`
+    can be passed as they are.
+
+    Parameters
+    ----------
+    results : Mapping[int, GetBansResponse | GetGuildResponse | GetUserResponse | HTTPError]
+        The responses by user or guild ID.
+
+    Returns
+    -------
+    dict[str, list[Any]]
+        The columns `user_id`, `provider`, `reason`, `reason_key`, `moderator`,
+        `trust_level` and `trust_label`.
+    """
+    columns: _Columns = {
+        "user_id": [],
+        "provider": [],
+        "reason": [],
+        "reason_key": [],
+        "moderator": [],
+        "trust_level": [],
+        "trust_label": [],
+    }
+    user_ids = columns["user_id"].extend
+    providers = columns["provider"].append
+    reasons = columns["reason"].append
+    reason_keys = columns["reason_key"].append
+    moderators = columns["moderator"].append
+    trust_levels = columns["trust_level"].extend
+    trust_labels = columns["trust_label"].extend
+
+    for user_id, result in results.items():
+        if isinstance(result, HTTPError):
+            continue
+
+        bans = result.bans
+        user_ids((user_id,) * len(bans))
+        trust_levels((result.trust.level,) * len(bans))
+        trust_labels((result.trust.label,) * len(bans))
+
+        for ban in bans:
+            providers(ban.provider)
+            reasons(ban.reason)
+            reason_keys(ban.reason_key)
+            moderators(ban.moderator)
+
+    return columns
+
+
+def reputation_columns(results: Mapping[int, _ReputationResult]) -> _Columns:
+    """Build a table with a row for every reputation entry of many users.
+
+    Results which are `ravyapi.api.errors.HTTPError` instances are skipped.
+
+    Parameters
+    ----------
+    results : Mapping[int, GetReputationResponse | GetUserResponse | HTTPError]
+        The responses by user ID.
+
+    Returns
+    -------
+    dict[str, list[Any]]
+        The columns `user_id`, `provider`, `score`, `upvotes`, `downvotes`,
+        `trust_level` and `trust_label`.
+    """
+    columns: _Columns = {
+        "user_id": [],
+        "provider": [],
+        "score": [],
+        "upvotes": [],
+        "downvotes": [],
+        "trust_level": [],
+        "trust_label": [],
+    }
+    user_ids = columns["user_id"].extend
+    providers = columns["provider"].append
+    scores = columns["score"].append
+    upvotes = columns["upvotes"].append
+    downvotes = columns["downvotes"].append
+    trust_levels = columns["trust_level"].extend
+    trust_labels = columns["trust_label"].extend
+
+    for user_id, result in results.items():
+        if isinstance(result, HTTPError):
+            continue
+
+        entries = result.rep
+        user_ids((user_id,) * len(entries))
+        trust_levels((result.trust.level,) * len(entries))
+        trust_labels((result.trust.label,) * len(entries))
+
+        for entry in entries:
+            providers(entry.provider)
+            scores(entry.score)
+            upvotes(entry.upvotes)
+            downvotes(entry.downvotes)
+
+    return columns
+
+
+def ksoft_ban_columns(
+    results: Mapping[int, GetKSoftBanResponse | HTTPError],
+) -> _Columns:
+    """Build a table with a row for every KSoft ban lookup of many users.
+
+    Results which are `ravyapi.api.errors.HTTPError` instances are skipped.
+
+    Parameters
+    ----------
+    results : Mapping[int, GetKSoftBanResponse | HTTPError]
+        The responses by user ID.
+
+    Returns
+    -------
+    dict[str, list[Any]]
+        The columns `user_id`, `found`, `reason`, `proof`, `moderator`, `severe` and
+        `timestamp`.
+    """
+    columns: _Columns = {
+        "user_id": [],
+        "found": [],
+        "reason": [],
+        "proof": [],
+        "moderator": [],
+        "severe": [],
+        "timestamp": [],
+    }
+
+    for user_id, result in results.items():
+        if isinstance(result, HTTPError):
+            continue
+
+        columns["user_id"].append(user_id)
+        columns["found"].append(result.found)
+        columns["reason"].append(result.reason)
+        columns["proof"].append(result.proof)
+        columns["moderator"].append(result.moderator)
+        columns["severe"].append(result.severe)
+        columns["timestamp"].append(result.timestamp)
+
+    return columns
+
+
+def to_pandas(columns: _Columns) -> Any:
+    """Convert a table to a `pandas.DataFrame`.
+
+    Parameters
+    ----------
+    columns : dict[str, list[Any]]
+        The table built by one of the column functions.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The table as a data frame.
+
+    Raises
+    ------
+    ImportError
+        If pandas is not installed.
+    """
+    try:
+        import pandas  # pyright: ignore[reportMissingImports]
+    except ImportError as exc:
+        raise ImportError('Converting to a DataFrame requires "pandas"') from exc
+
+    # pandas may be installed without type information
+    module: Any = pandas
+    return module.DataFrame(columns)
+
+
+def to_arrow(columns: _Columns) -> Any:
+    """Convert a table to a `pyarrow.Table`.
+
+    Parameters
+    ----------
+    columns : dict[str, list[Any]]
+        The table built by one of the column functions.
+
+    Returns
+    -------
+    pyarrow.Table
+        The table as an Arrow table.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    try:
+        import pyarrow  # pyright: ignore[reportMissingImports]
+    except ImportError as exc:
+        raise ImportError('Converting to an Arrow table requires "pyarrow"') from exc
+
+    # pyarrow may be installed without type information
+    module: Any = pyarrow
+    return module.table(columns)
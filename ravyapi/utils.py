@@ -15,14 +15,37 @@
 
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("with_permission_check",)
+__all__: tuple[str, ...] = (
+    "gather_bounded",
+    "iter_bounded",
+    "with_cache",
+    "with_permission_check",
+)
 
+import asyncio
+import inspect
+import time
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Coroutine,
+    Iterable,
+    TypeVar,
+)
 
 from typing_extensions import Concatenate, ParamSpec, TypeAlias
 
-from ravyapi.api.errors import AccessError
+from ravyapi.api.errors import AccessError, HTTPError, NotFoundError
+
+_KeyT = TypeVar("_KeyT")
+_ResultT = TypeVar("_ResultT")
 
 if TYPE_CHECKING:
     from ravyapi.http import HTTPAwareEndpoint
@@ -36,29 +59,187 @@ if TYPE_CHECKING:
     ]
 
 
-def has_permissions(required: str, permissions: list[str]) -> bool:
+def has_permissions(required: str, permissions: Collection[str]) -> bool:
     """Check whether the required permissions match a list of permissions.
 
+    The required permission matches if it, or any of its parent scopes, is granted.
+
     Parameters
     ----------
     required : str
         The required permissions.
-    permissions : list[str]
-        The list of permissions.
+    permissions : Collection[str]
+        The granted permissions, a set or frozenset is used as is.
 
     Returns
     -------
     bool
         Whether the permissions match.
     """
-    required_list = required.split(".")
+    granted = permissions if isinstance(permissions, AbstractSet) else set(permissions)
+    scope = required
+
+    while scope not in granted:
+        index = scope.rfind(".")
+
+        if index == -1:
+            return False
+
+        scope = scope[:index]
+
+    return True
 
-    while required_list:
-        if ".".join(required_list) in permissions:
-            return True
-        required_list.pop()
 
-    return False
+def validate_concurrency(concurrency: int) -> None:
+    """Validate the concurrency limit passed to a bulk lookup.
+
+    Parameters
+    ----------
+    concurrency : int
+        The maximum number of requests allowed in flight.
+
+    Raises
+    ------
+    TypeError
+        If the concurrency is not of type `int`.
+    ValueError
+        If the concurrency is less than 1.
+    """
+    if not isinstance(concurrency, int):
+        raise TypeError('Parameter "concurrency" must be of type "int"')
+
+    if concurrency < 1:
+        raise ValueError('Parameter "concurrency" must be greater than 0')
+
+
+async def gather_bounded(
+    keys: Iterable[_KeyT],
+    function: Callable[[_KeyT], Awaitable[_ResultT]],
+    concurrency: int,
+) -> dict[_KeyT, _ResultT | HTTPError]:
+    """Run a coroutine function over many keys with at most `concurrency` calls in flight.
+
+    A fixed pool of `concurrency` workers pulls the keys one by one, so only that many
+    calls exist at once however many keys are passed. Any
+    `ravyapi.api.errors.HTTPError` raised for a key is collected in place of its
+    result instead of aborting the batch; other exceptions propagate.
+
+    Parameters
+    ----------
+    keys : Iterable[_KeyT]
+        The keys to call the function with, duplicates are only called once.
+    function : Callable[[_KeyT], Awaitable[_ResultT]]
+        The coroutine function to call for each key.
+    concurrency : int
+        The maximum number of calls in flight at once.
+
+    Returns
+    -------
+    dict[_KeyT, _ResultT | HTTPError]
+        A mapping of each key to its result or the HTTP error it raised, in input order.
+    """
+    unique = list(dict.fromkeys(keys))
+    remaining = iter(unique)
+    results: dict[_KeyT, _ResultT | HTTPError] = {}
+
+    async def worker() -> None:
+        for key in remaining:
+            try:
+                results[key] = await function(key)
+            except HTTPError as exc:
+                results[key] = exc
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(unique)))
+    ]
+
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
+
+    return {key: results[key] for key in unique}
+
+
+async def _aiter_keys(
+    keys: Iterable[_KeyT] | AsyncIterable[_KeyT],
+) -> AsyncIterator[_KeyT]:
+    """Iterate over either a synchronous or an asynchronous iterable of keys."""
+    if isinstance(keys, AsyncIterable):
+        async for key in keys:
+            yield key
+    else:
+        for key in keys:
+            yield key
+
+
+async def iter_bounded(
+    keys: Iterable[_KeyT] | AsyncIterable[_KeyT],
+    function: Callable[[_KeyT], Awaitable[_ResultT]],
+    concurrency: int,
+) -> AsyncIterator[tuple[_KeyT, _ResultT | HTTPError]]:
+    """Lazily run a coroutine function over many keys, yielding results as they complete.
+
+    Keys are only pulled from `keys` when there is room for another call, so at most
+    `concurrency` calls are in flight or waiting to be consumed at any time. Any
+    `ravyapi.api.errors.HTTPError` raised for a key is yielded in place of its result;
+    other exceptions propagate. Pending calls are cancelled if iteration stops early.
+
+    Parameters
+    ----------
+    keys : Iterable[_KeyT] | AsyncIterable[_KeyT]
+        The keys to call the function with.
+    function : Callable[[_KeyT], Awaitable[_ResultT]]
+        The coroutine function to call for each key.
+    concurrency : int
+        The maximum number of calls in flight or buffered at once.
+
+    Yields
+    ------
+    tuple[_KeyT, _ResultT | HTTPError]
+        Each key paired with its result or the HTTP error it raised, in completion order.
+    """
+
+    async def run(key: _KeyT) -> tuple[_KeyT, _ResultT | HTTPError]:
+        try:
+            return key, await function(key)
+        except HTTPError as exc:
+            return key, exc
+
+    iterator = _aiter_keys(keys).__aiter__()
+    pending: set[asyncio.Future[tuple[_KeyT, _ResultT | HTTPError]]] = set()
+    ready: list[asyncio.Future[tuple[_KeyT, _ResultT | HTTPError]]] = []
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    key = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(run(key)))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            ready.extend(done)
+
+            while ready:
+                yield ready.pop().result()
+    finally:
+        for task in ready:
+            if not task.cancelled():
+                task.exception()  # not yielded, as another call failed or we stopped
+
+        for task in pending:
+            task.cancel()
 
 
 def with_permission_check(
@@ -69,6 +250,9 @@ def with_permission_check(
 ]:
     """Decorate an instance method of `ravyapi.http.HTTPAwareEndpoint` to validate the required permissions.
 
+    The decision is remembered for the permissions list it was made for, so it is only
+    made again once the permissions of the client are replaced.
+
     !!! warning
         This is an internal function and should not be used unless you know what you are doing.
 
@@ -85,18 +269,24 @@ def with_permission_check(
     def decorator(
         function: _EndpointF[_EndpointP, _EndpointT, _EndpointR],
     ) -> _EndpointF[_EndpointP, _EndpointT, _EndpointR]:
+        checked: list[Any] = [None, False]  # the permissions checked and the decision
+
         @wraps(function)
         async def wrapper(
             self: HTTPAwareEndpoint, *args: _EndpointP.args, **kwargs: _EndpointP.kwargs
         ) -> _EndpointR:
             await self._http.get_permissions()
+            permissions = self._http.permissions
 
-            if self._http.permissions is None:
+            if permissions is None:
                 raise AssertionError(
                     'Permissions is "None"; were permissions not yet fetched or unexpectedly modified?'
                 )
 
-            if not has_permissions(required, self._http.permissions):
+            if permissions is not checked[0]:
+                checked[:] = permissions, has_permissions(required, permissions)
+
+            if not checked[1]:
                 raise AccessError(required)
 
             return await function(self, *args, **kwargs)
@@ -104,3 +294,94 @@ def with_permission_check(
         return wrapper
 
     return decorator
+
+
+def with_cache(
+    name: str,
+    *,
+    source: str | None = None,
+    derive: Callable[[HTTPAwareEndpoint, Any], Any] | None = None,
+) -> Callable[
+    [_EndpointF[_EndpointP, _EndpointT, _EndpointR]],
+    _EndpointF[_EndpointP, _EndpointT, _EndpointR],
+]:
+    """Decorate an instance method of `ravyapi.http.HTTPAwareEndpoint` to cache its responses.
+
+    Responses are only cached when the underlying `ravyapi.http.HTTPClient` has a
+    `ravyapi.cache.ResponseCache`. The first argument after `self` is the resource
+    looked up, and any other arguments are part of the cache key. Expired responses
+    still served by the cache are refreshed in the background, and cached not found
+    errors are raised again as new `ravyapi.api.errors.NotFoundError` instances.
+    On a miss, an endpoint with a source answers from a fresh cached response of the
+    source endpoint for the same arguments instead of making a request.
+
+    !!! warning
+        This is an internal function and should not be used unless you know what you are doing.
+
+    Parameters
+    ----------
+    name : str
+        The name of the endpoint, used for its TTL and statistics.
+    source : str | None
+        The name of an endpoint whose cached responses contain this one.
+    derive : Callable[[HTTPAwareEndpoint, Any], Any] | None
+        A function building the response of this endpoint from a response of the source.
+
+    Returns
+    -------
+    Callable[[_EndpointF[_EndpointP, _EndpointT]], _EndpointF[_EndpointP, _EndpointT]]
+    """
+
+    def decorator(
+        function: _EndpointF[_EndpointP, _EndpointT, _EndpointR],
+    ) -> _EndpointF[_EndpointP, _EndpointT, _EndpointR]:
+        signature = inspect.signature(function)
+
+        @wraps(function)
+        async def wrapper(
+            self: HTTPAwareEndpoint, *args: _EndpointP.args, **kwargs: _EndpointP.kwargs
+        ) -> _EndpointR:
+            cache = self._http.cache
+
+            if cache is None:
+                return await function(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            _, resource, *params = bound.arguments.items()
+            key = cache.make_key(name, resource[1], dict(params))
+
+            entry = cache.get(name, key)
+
+            if entry is not None:
+                if entry.is_negative:
+                    raise NotFoundError(entry.value.exc_data)
+
+                if entry.is_expired(time.time()):
+                    cache.refresh(name, key, lambda: function(self, *args, **kwargs))
+
+                return entry.value  # type: ignore[no-any-return]
+
+            if source is not None and derive is not None:
+                entry = cache.get_source(
+                    name, cache.make_key(source, resource[1], dict(params))
+                )
+
+                if entry is not None:
+                    return derive(self, entry.value)  # type: ignore[no-any-return]
+
+            # an invalidation during the request means the response may be outdated
+            with cache.track_request(key) as generation:
+                try:
+                    value = await function(self, *args, **kwargs)
+                except NotFoundError as exc:
+                    cache.set_not_found(name, key, exc, generation=generation)
+                    raise
+
+                cache.set(name, key, value, generation=generation)
+
+            return value
+
+        return wrapper
+
+    return decorator
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any, Generator
 from unittest.mock import AsyncMock
 
@@ -10,7 +11,11 @@ from aioresponses import aioresponses
 
 from ravyapi.api.endpoints import Avatars, Guilds, KSoft, Tokens, URLs, Users
 from ravyapi.client import Client
+from ravyapi.connections import ConnectionSettings
 from ravyapi.http import HTTPClient
+from ravyapi.ratelimits import RateLimiter
+from ravyapi.retries import RetryPolicy
+from ravyapi.serialization import JSONCodec
 
 
 @pytest.fixture
@@ -73,6 +78,18 @@ def mock_http_client(valid_ravy_token: str) -> HTTPClient:
         "User-Agent": "Test-Agent",
     }
     client._session = mock_session  # type: ignore
+    client._ratelimiter = RateLimiter()  # type: ignore
+    client._retry_policy = RetryPolicy()  # type: ignore
+    client._connection_settings = ConnectionSettings()  # type: ignore
+    client._cache = None  # type: ignore
+    client._inflight = {}  # type: ignore
+    client._coalesced = {}  # type: ignore
+    client._permissions_fetch = None  # type: ignore
+    client._permissions_ttl = 3600.0  # type: ignore
+    client._permissions_fetched_at = 0.0  # type: ignore
+    client._permissions_failed_at = -math.inf  # type: ignore
+    client._json = JSONCodec()  # type: ignore
+    client._keep_raw = True  # type: ignore
     return client
 
 
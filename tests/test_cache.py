@@ -0,0 +1,696 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for response caching."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.api.models.urls import GetWebsiteResponse
+from ravyapi.cache import (
+    CacheBackend,
+    CacheEntry,
+    CacheReport,
+    CacheStats,
+    MemoryBackend,
+    ResponseCache,
+    SQLiteBackend,
+    TinyLFUBackend,
+    no_admit,
+)
+
+
+class TestResponseCache:
+    """Test cases for the ResponseCache class."""
+
+    def test_response_cache_invalid_parameters(self) -> None:
+        """Test ResponseCache validates its parameters."""
+        with pytest.raises(TypeError):
+            ResponseCache("10")  # type: ignore
+
+        with pytest.raises(ValueError):
+            ResponseCache(0)
+
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=-1)
+
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={"users": -1})
+
+        with pytest.raises(TypeError):
+            ResponseCache(backend={})  # type: ignore
+
+    def test_make_key_is_normalized(self) -> None:
+        """Test make_key ignores argument order and None values."""
+        first = ResponseCache.make_key("urls", "https://a.b/c?d", {"x": 1, "y": None})
+        second = ResponseCache.make_key("urls", "https://a.b/c?d", {"x": 1})
+
+        assert first == second
+        assert ResponseCache.make_key("users", 1, {}) == "users:1"
+        assert ResponseCache.make_key("users", 1, {}) != ResponseCache.make_key(
+            "users.bans", 1, {}
+        )
+
+    def test_get_and_set(self) -> None:
+        """Test a cached response is returned and counted as a hit."""
+        cache = ResponseCache()
+
+        assert cache.get("users", "users:1") is None
+        cache.set("users", "users:1", "value")
+        entry = cache.get("users", "users:1")
+
+        assert entry is not None
+        assert entry.value == "value"
+        assert cache.stats["users"].hits == 1
+        assert cache.stats["users"].misses == 1
+        assert cache.stats["users"].hit_rate == 0.5
+
+    def test_get_source(self) -> None:
+        """Test a fresh source entry is counted as a derived hit of the endpoint."""
+        cache = ResponseCache(ttl=10)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set("users", "users:1", "user")
+            cache.set_not_found("users", "users:2", NotFoundError("Not found"))
+            entry = cache.get_source("users.bans", "users:1")
+
+            assert entry is not None
+            assert entry.value == "user"
+            assert cache.get_source("users.bans", "users:2") is None
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1020.0):
+            assert cache.get_source("users.bans", "users:1") is None
+
+        assert cache.stats["users.bans"].derived_hits == 1
+        assert "users" not in cache.stats
+
+    def test_per_endpoint_ttl(self) -> None:
+        """Test entries expire after the TTL of their endpoint."""
+        cache = ResponseCache(ttl=100, ttls={"urls": 10})
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set("users", "users:1", "user")
+            cache.set("urls", "urls:a", "url")
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1050.0):
+            assert cache.get("users", "users:1") is not None
+            assert cache.get("urls", "urls:a") is None
+
+        assert len(cache) == 1
+
+    def test_zero_ttl_disables_endpoint(self) -> None:
+        """Test a TTL of 0 disables caching for an endpoint."""
+        cache = ResponseCache(ttls={"guilds": 0})
+
+        cache.set("guilds", "guilds:1", "guild")
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache = ResponseCache(2)
+
+        cache.set("users", "users:1", 1)
+        cache.set("users", "users:2", 2)
+        cache.get("users", "users:1")
+        cache.set("users", "users:3", 3)
+
+        assert cache.get("users", "users:1") is not None
+        assert cache.get("users", "users:2") is None
+        assert cache.get("users", "users:3") is not None
+
+    def test_delete_and_clear(self) -> None:
+        """Test entries can be removed."""
+        cache = ResponseCache()
+        cache.set("users", "users:1", 1)
+        cache.set("users", "users:2", 2)
+
+        cache.delete("users:1")
+        assert cache.get("users", "users:1") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalidate(self) -> None:
+        """Test invalidate removes every lookup of a resource and only that resource."""
+        cache = ResponseCache()
+        cache.set("urls", ResponseCache.make_key("urls", "a", {}), 1)
+        cache.set("urls", ResponseCache.make_key("urls", "a", {"author": 1}), 2)
+        cache.set("urls", ResponseCache.make_key("urls", "ab", {}), 3)
+        cache.set("users", ResponseCache.make_key("users", "a", {}), 4)
+
+        cache.invalidate("urls", "a")
+
+        assert cache.get("urls", "urls:a") is None
+        assert cache.get("urls", "urls:a?author=1") is None
+        assert cache.get("urls", "urls:ab") is not None
+        assert cache.get("users", "users:a") is not None
+
+    def test_invalidate_bumps_generation(self) -> None:
+        """Test responses requested before an invalidation are not cached."""
+        cache = ResponseCache()
+
+        with cache.track_request("urls:a?author=1") as generation, cache.track_request(
+            "urls:ab"
+        ) as other:
+            cache.invalidate("urls", "a")
+            cache.set("urls", "urls:a?author=1", 1, generation=generation)
+            cache.set_not_found(
+                "urls", "urls:a", NotFoundError("Not found"), generation=generation
+            )
+            cache.set("urls", "urls:ab", 2, generation=other)
+
+        assert cache.get("urls", "urls:a?author=1") is None
+        assert cache.get("urls", "urls:a") is None
+        assert cache.get("urls", "urls:ab") is not None
+
+    def test_generations_only_kept_during_requests(self) -> None:
+        """Test invalidations leave no generation behind once no request is in flight."""
+        cache = ResponseCache()
+
+        with cache.track_request("users:1"), cache.track_request("users:1"):
+            cache.invalidate("users", 1)
+
+        for user_id in range(100):
+            cache.invalidate("users", user_id)
+
+        assert cache._generations == {}  # type: ignore
+        assert cache._requests == {}  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cancels_refresh(self) -> None:
+        """Test invalidate cancels a pending refresh of the resource."""
+        cache = ResponseCache()
+        cache.refresh("users", "users:1", lambda: asyncio.sleep(10, "user"))
+        future = cache._refreshing["users:1"]
+
+        cache.invalidate("users", 1)
+        await asyncio.sleep(0)
+
+        assert future.cancelled()
+        assert len(cache) == 0
+
+    def test_report(self) -> None:
+        """Test report counts entries, sizes and ages per endpoint."""
+        cache = ResponseCache(2)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set("users", "users:1", {"pronouns": "she/her"})
+            cache.set(
+                "urls",
+                "urls:a",
+                GetWebsiteResponse({"isFraudulent": False, "message": "OK"}),
+            )
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1010.0):
+            cache.set(
+                "urls",
+                "urls:b",
+                GetWebsiteResponse({"isFraudulent": True, "message": "Bad"}),
+            )
+            cache.get("urls", "urls:b")
+            cache.get("urls", "urls:c")
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1030.0):
+            reports = cache.report()
+
+        assert reports["users"].evictions == 1
+        assert reports["users"].entries == 0
+        assert reports["urls"].entries == 2
+        assert reports["urls"].hits == 1
+        assert reports["urls"].misses == 1
+        assert reports["urls"].bytes > 0
+        assert reports["urls"].median_age == 25.0
+        assert reports["urls"].max_age == 30.0
+
+    def test_report_counts_shared_objects_once(self) -> None:
+        """Test report does not count objects shared between entries twice."""
+        cache = ResponseCache()
+        shared = {"message": "x" * 10_000}
+        cache.set("users", "users:1", shared)
+        single = cache.report()["users"].bytes
+
+        cache.set("users", "users:2", shared)
+
+        assert cache.report()["users"].bytes < single * 2
+
+
+class TestCacheStats:
+    """Test cases for the CacheStats class."""
+
+    def test_cache_stats_hit_rate_without_lookups(self) -> None:
+        """Test CacheStats hit rate is 0 without lookups."""
+        assert CacheStats().hit_rate == 0.0
+
+    def test_cache_report_repr(self) -> None:
+        """Test CacheReport repr includes every counter and age."""
+        report = CacheReport()
+        report.derived_hits = 3
+        report.p90_age = 1.5
+
+        repr_str = repr(report)
+
+        for field in (
+            "stale_hits",
+            "negative_hits",
+            "derived_hits=3",
+            "median_age",
+            "p90_age=1.5",
+            "max_age",
+        ):
+            assert field in repr_str
+
+
+class TestSQLiteBackend:
+    """Test cases for the SQLiteBackend class."""
+
+    @staticmethod
+    def _entry(message: str, created_at: float = 0.0) -> CacheEntry:
+        """Create an entry for a website response."""
+        value = GetWebsiteResponse({"isFraudulent": False, "message": message})
+        return CacheEntry("urls", value, created_at, created_at + 1e12)
+
+    def test_sqlite_backend_is_cache_backend(self, tmp_path: Path) -> None:
+        """Test both bundled backends implement the CacheBackend protocol."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+
+        assert isinstance(backend, CacheBackend)
+        assert isinstance(MemoryBackend(), CacheBackend)
+        backend.close()
+
+    def test_sqlite_backend_invalid_parameters(self, tmp_path: Path) -> None:
+        """Test SQLiteBackend validates its parameters."""
+        with pytest.raises(TypeError):
+            SQLiteBackend(1)  # type: ignore
+
+        with pytest.raises(ValueError):
+            SQLiteBackend(tmp_path / "cache.db", 0)
+
+    def test_entries_survive_restarts(self, tmp_path: Path) -> None:
+        """Test entries are rebuilt as models by a new backend on the same file."""
+        first = SQLiteBackend(tmp_path / "cache.db")
+        first.set("urls:a", self._entry("safe"))
+        first.close()
+
+        second = SQLiteBackend(tmp_path / "cache.db")
+        entry = second.get("urls:a")
+
+        assert entry is not None
+        assert isinstance(entry.value, GetWebsiteResponse)
+        assert entry.value.message == "safe"
+        assert entry.name == "urls"
+        assert len(second) == 1
+        second.close()
+
+    def test_response_cache_with_sqlite_backend(self, tmp_path: Path) -> None:
+        """Test ResponseCache stores responses in and expires them from the backend."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        cache = ResponseCache(ttl=10, backend=backend)
+        value = GetWebsiteResponse({"isFraudulent": True, "message": "phishing"})
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set("urls", "urls:a", value)
+            entry = cache.get("urls", "urls:a")
+
+        assert entry is not None
+        assert entry.value.is_fraudulent
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1010.0):
+            assert cache.get("urls", "urls:a") is None
+
+        assert len(backend) == 0
+        backend.close()
+
+    def test_oldest_entries_are_evicted(self, tmp_path: Path) -> None:
+        """Test the oldest entries are evicted once the backend is full."""
+        backend = SQLiteBackend(tmp_path / "cache.db", 2)
+
+        for index in range(3):
+            backend.set(f"urls:{index}", self._entry(str(index), float(index)))
+
+        assert len(backend) == 2
+        assert backend.get("urls:0") is None
+        assert backend.get("urls:2") is not None
+        backend.close()
+
+    def test_delete_and_clear(self, tmp_path: Path) -> None:
+        """Test delete removes one entry and clear removes every entry."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        backend.set("urls:a", self._entry("a"))
+        backend.set("urls:b", self._entry("b"))
+
+        backend.delete("urls:a")
+        assert backend.get("urls:a") is None
+        assert len(backend) == 1
+
+        backend.clear()
+        assert len(backend) == 0
+        backend.close()
+
+    def test_delete_prefix(self, tmp_path: Path) -> None:
+        """Test delete_prefix only removes entries whose key starts with the prefix."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        backend.set("urls:a%2F_b?author=1", self._entry("a"))
+        backend.set("urls:a%2Fcb?author=1", self._entry("b"))
+
+        backend.delete_prefix("urls:a%2F_b?")
+
+        assert backend.get("urls:a%2F_b?author=1") is None
+        assert backend.get("urls:a%2Fcb?author=1") is not None
+        backend.close()
+
+    def test_items_and_evictions(self, tmp_path: Path) -> None:
+        """Test items returns every entry and evictions are counted per endpoint."""
+        backend = SQLiteBackend(tmp_path / "cache.db", 2)
+        backend.set("urls:a", self._entry("a", 1.0))
+        backend.set("urls:b", self._entry("b", 2.0))
+        backend.set("urls:c", self._entry("c", 3.0))
+
+        assert sorted(key for key, _ in backend.items()) == ["urls:b", "urls:c"]
+        assert backend.evictions == {"urls": 1}
+        backend.close()
+
+    def test_keep_raw_round_trip(self, tmp_path: Path) -> None:
+        """Test models stored without raw data are rebuilt without raw data."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        data = {"isFraudulent": False, "message": "OK"}
+        backend.set("urls:a", CacheEntry("urls", GetWebsiteResponse(data), 0.0, 1e12))
+        backend.set(
+            "urls:b",
+            CacheEntry("urls", GetWebsiteResponse(data, keep_raw=False), 0.0, 1e12),
+        )
+
+        kept = backend.get("urls:a")
+        dropped = backend.get("urls:b")
+
+        assert kept is not None and kept.value._data == data  # type: ignore
+        assert dropped is not None and dropped.value._data is None  # type: ignore
+        assert dropped.value.data == data
+        backend.close()
+
+    def test_eviction_is_batched(self, tmp_path: Path) -> None:
+        """Test a full table is trimmed below its limit instead of on every write."""
+        backend = SQLiteBackend(tmp_path / "cache.db", 100)
+
+        for index in range(101):
+            backend.set(f"urls:{index}", self._entry(str(index), float(index)))
+
+        assert len(backend) == 95
+        assert backend.evictions == {"urls": 6}
+        backend.close()
+
+    def test_locked_database_does_not_raise(self, tmp_path: Path) -> None:
+        """Test writes give up after the timeout while another process holds the lock."""
+        backend = SQLiteBackend(tmp_path / "cache.db", timeout=0)
+        other = sqlite3.connect(tmp_path / "cache.db")
+        other.execute("BEGIN EXCLUSIVE")
+
+        backend.set("urls:a", self._entry("a"))
+
+        other.rollback()
+        other.close()
+        assert backend.get("urls:a") is None
+        backend.close()
+
+    def test_locked_database_falls_back(self, tmp_path: Path) -> None:
+        """Test lookups, deletions and invalidations skip the cache while it is locked."""
+        backend = SQLiteBackend(tmp_path / "cache.db", timeout=0)
+        cache = ResponseCache(backend=backend)
+        backend.set("urls:a", self._entry("a", created_at=-1e12))
+        other = sqlite3.connect(tmp_path / "cache.db")
+        other.execute("BEGIN IMMEDIATE")
+
+        assert cache.get("urls", "urls:a") is None
+        cache.invalidate("urls", "a")
+        backend.delete_prefix("urls:")
+        backend.clear()
+        assert len(backend) == 1
+        assert len(backend.items()) == 1
+
+        other.rollback()
+        other.close()
+        assert backend.get("urls:a") is not None
+        backend.close()
+
+    def test_only_package_models_are_stored(self, tmp_path: Path) -> None:
+        """Test values which cannot be rebuilt from raw data are rejected."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+
+        with pytest.raises(TypeError):
+            backend.set("urls:a", CacheEntry("urls", "value", 0.0, 1.0))
+
+        backend.close()
+
+
+class TestTinyLFUBackend:
+    """Test cases for the TinyLFUBackend class."""
+
+    @staticmethod
+    def _entry(value: int) -> CacheEntry:
+        """Create an entry that does not expire."""
+        return CacheEntry("users", value, 0.0, 1e12)
+
+    def test_tiny_lfu_backend_invalid_parameters(self) -> None:
+        """Test TinyLFUBackend validates its parameters."""
+        with pytest.raises(TypeError):
+            TinyLFUBackend("100")  # type: ignore
+
+        with pytest.raises(ValueError):
+            TinyLFUBackend(0)
+
+    def test_tiny_lfu_backend_is_cache_backend(self) -> None:
+        """Test TinyLFUBackend implements the CacheBackend protocol."""
+        assert isinstance(TinyLFUBackend(), CacheBackend)
+
+    def test_scan_keeps_frequent_entries(self) -> None:
+        """Test a scan of one-off keys does not evict frequently used entries."""
+        backend = TinyLFUBackend(200)
+        hot = [f"users:{user_id}" for user_id in range(100)]
+
+        for _ in range(5):
+            for key in hot:
+                if backend.get(key) is None:
+                    backend.set(key, self._entry(1))
+
+        for user_id in range(1000, 11_000):
+            key = f"users:{user_id}"
+
+            if backend.get(key) is None:
+                backend.set(key, self._entry(2))
+
+        assert len(backend) <= 200
+        assert sum(backend.get(key) is not None for key in hot) >= 95
+        assert backend.evictions["users"] >= 9_900
+        assert len(backend.items()) == len(backend)
+
+    def test_lru_scan_evicts_frequent_entries(self) -> None:
+        """Test the same scan flushes the frequently used entries of an LRU."""
+        backend = MemoryBackend(200)
+        hot = [f"users:{user_id}" for user_id in range(100)]
+
+        for key in hot:
+            backend.set(key, self._entry(1))
+
+        for user_id in range(1000, 1200):
+            backend.set(f"users:{user_id}", self._entry(2))
+
+        assert all(backend.get(key) is None for key in hot)
+
+    def test_set_replaces_and_delete(self) -> None:
+        """Test entries are replaced in place and can be removed."""
+        backend = TinyLFUBackend(10)
+        backend.set("urls:a", self._entry(1))
+        backend.set("urls:a", self._entry(2))
+        backend.set("urls:a?author=1", self._entry(3))
+        backend.set("urls:b", self._entry(4))
+
+        entry = backend.get("urls:a")
+        assert entry is not None and entry.value == 2
+
+        backend.delete_prefix("urls:a?")
+        backend.delete("urls:b")
+        assert len(backend) == 1
+
+        backend.clear()
+        assert len(backend) == 0
+
+
+class TestNoAdmit:
+    """Test cases for the no_admit context manager."""
+
+    def test_no_admit(self) -> None:
+        """Test nothing is cached within no_admit but cached entries are served."""
+        cache = ResponseCache()
+        cache.set("users", "users:1", 1)
+
+        with no_admit():
+            cache.set("users", "users:2", 2)
+            cache.set_not_found("users", "users:3", NotFoundError("Not found"))
+            assert cache.get("users", "users:1") is not None
+
+        assert len(cache) == 1
+        cache.set("users", "users:2", 2)
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_admit_inherited_by_tasks(self) -> None:
+        """Test tasks started within no_admit do not cache, but refreshes do."""
+        cache = ResponseCache()
+
+        async def lookup() -> None:
+            cache.set("users", "users:1", 1)
+
+        with no_admit():
+            await asyncio.ensure_future(lookup())
+            cache.refresh("users", "users:2", lambda: asyncio.sleep(0, 2))
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert cache.get("users", "users:1") is None
+        assert cache.get("users", "users:2") is not None
+
+
+class TestStaleWhileRevalidate:
+    """Test cases for serving expired responses while they are refreshed."""
+
+    def test_max_stale_invalid_parameters(self) -> None:
+        """Test ResponseCache validates the max staleness."""
+        with pytest.raises(ValueError):
+            ResponseCache(max_stale=-1)
+
+        with pytest.raises(TypeError):
+            ResponseCache(max_stales={"urls": "1"})  # type: ignore
+
+    def test_stale_entry_served_within_max_staleness(self) -> None:
+        """Test an expired entry is served until its max staleness has passed."""
+        cache = ResponseCache(ttl=10, max_stales={"urls": 60})
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set("urls", "urls:a", "url")
+            cache.set("users", "users:1", "user")
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1030.0):
+            entry = cache.get("urls", "urls:a")
+            assert cache.get("users", "users:1") is None
+
+        assert entry is not None
+        assert entry.is_expired(1030.0)
+        assert cache.stats["urls"].stale_hits == 1
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1070.0):
+            assert cache.get("urls", "urls:a") is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_entry_once(self) -> None:
+        """Test concurrent refreshes of one key request a single response."""
+        cache = ResponseCache(ttl=10)
+        calls: list[int] = []
+
+        async def fetch() -> str:
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "fresh"
+
+        cache.refresh("urls", "urls:a", fetch)
+        cache.refresh("urls", "urls:a", fetch)
+        await asyncio.sleep(0.01)
+
+        entry = cache.get("urls", "urls:a")
+        assert entry is not None
+        assert entry.value == "fresh"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_entry(self) -> None:
+        """Test a failed refresh leaves the cached response in place."""
+        cache = ResponseCache(ttl=10)
+        cache.set("urls", "urls:a", "stale")
+
+        async def fetch() -> str:
+            raise RuntimeError
+
+        cache.refresh("urls", "urls:a", fetch)
+        await asyncio.sleep(0.01)
+
+        entry = cache.get("urls", "urls:a")
+        assert entry is not None
+        assert entry.value == "stale"
+
+
+class TestNegativeCaching:
+    """Test cases for caching not found errors."""
+
+    def test_not_found_cached_for_negative_ttl(self) -> None:
+        """Test not found errors expire after the shorter negative TTL."""
+        cache = ResponseCache(ttl=300, negative_ttl=30, max_stale=600)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            cache.set_not_found("users", "users:1", NotFoundError("Not found"))
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1010.0):
+            entry = cache.get("users", "users:1")
+
+        assert entry is not None
+        assert entry.is_negative
+        assert cache.stats["users"].negative_hits == 1
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1040.0):
+            assert cache.get("users", "users:1") is None
+
+    def test_not_found_cached_without_traceback(self) -> None:
+        """Test a cached not found error does not keep the frames that raised it."""
+        cache = ResponseCache()
+
+        try:
+            try:
+                raise KeyError("context")
+            except KeyError:
+                raise NotFoundError("Not found")
+        except NotFoundError as exc:
+            cache.set_not_found("users", "users:1", exc)
+
+        entry = cache.get("users", "users:1")
+
+        assert entry is not None
+        assert entry.value.exc_data == "Not found"
+        assert entry.value.__traceback__ is None
+        assert entry.value.__context__ is None
+        assert entry.value.__cause__ is None
+
+    def test_zero_negative_ttl_disables_negative_caching(self) -> None:
+        """Test a negative TTL of 0 disables caching not found errors."""
+        cache = ResponseCache(negative_ttls={"guilds": 0})
+        cache.set_not_found("guilds", "guilds:1", NotFoundError("Not found"))
+
+        assert len(cache) == 0
+
+    def test_sqlite_backend_stores_not_found(self, tmp_path: Path) -> None:
+        """Test not found errors are rebuilt by the SQLite backend."""
+        backend = SQLiteBackend(tmp_path / "cache.db")
+        error = NotFoundError({"error": "Not found", "details": "Unknown user"})
+        backend.set("users:1", CacheEntry("users", error, 0.0, 1e12))
+
+        entry = backend.get("users:1")
+
+        assert entry is not None
+        assert entry.is_negative
+        assert entry.value.exc_data == error.exc_data
+        backend.close()
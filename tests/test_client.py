@@ -1,10 +1,13 @@
 """Tests for the client module."""
 
+import math
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from ravyapi.api.endpoints import Avatars, Guilds, KSoft, Tokens, URLs, Users
+from ravyapi.cache import ResponseCache
 from ravyapi.client import Client
 from ravyapi.http import HTTPClient
 
@@ -35,7 +38,9 @@ class TestClient:
 
     def test_client_initialization_ksoft_token(self, valid_ksoft_token: str) -> None:
         """Test Client initialization with valid KSoft token."""
-        with patch("aiohttp.ClientSession") as mock_session:
+        with patch("aiohttp.ClientSession") as mock_session, patch(
+            "aiohttp.TCPConnector"
+        ):
             mock_session.return_value = AsyncMock()
             client = Client(valid_ksoft_token)
             assert client._token == valid_ksoft_token  # type: ignore
@@ -51,6 +56,67 @@ class TestClient:
         mock_client._closed = True  # type: ignore
         assert mock_client._closed is True  # type: ignore
 
+    @pytest.mark.asyncio
+    async def test_client_context_manager(self, valid_ravy_token: str) -> None:
+        """Test Client opens and closes its session as a context manager."""
+        client = Client(valid_ravy_token)
+
+        async with client as entered:
+            assert entered is client
+            session = client._http._session  # type: ignore
+            assert session is not None
+            assert not session.closed
+
+        assert session.closed
+        assert client.closed is True
+
+    @pytest.mark.asyncio
+    async def test_client_cache_stats(self, valid_ravy_token: str) -> None:
+        """Test Client reports the cache use of each endpoint."""
+        cache = ResponseCache(1)
+        client = Client(valid_ravy_token, cache=cache)
+        client._http._permissions = ["users"]  # type: ignore
+        client._http._permissions_fetched_at = math.inf  # type: ignore
+        data: dict[str, Any] = {"trust": {"level": 3, "label": "Neutral"}, "bans": []}
+
+        with patch.object(HTTPClient, "get", AsyncMock(return_value=data)):
+            await client.users.get_bans(1)
+            await client.users.get_bans(1)
+            await client.users.get_bans(2)
+
+        stats = client.cache_stats()
+
+        assert stats["users.bans"].hits == 1
+        assert stats["users.bans"].misses == 2
+        assert stats["users.bans"].evictions == 1
+        assert stats["users.bans"].entries == 1
+        assert stats["users.bans"].bytes > 0
+        assert stats["users.bans"].max_age >= stats["users.bans"].median_age >= 0
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_client_fetch_permissions(self, valid_ravy_token: str) -> None:
+        """Test Client pre-warms the permissions of its token."""
+        client = Client(valid_ravy_token)
+
+        with patch.object(
+            HTTPClient,
+            "get",
+            AsyncMock(
+                return_value={
+                    "user": 1,
+                    "access": ["users"],
+                    "application": 2,
+                    "type": "ravy",
+                }
+            ),
+        ) as mock_get:
+            await client.fetch_permissions()
+
+        mock_get.assert_called_once()
+        assert client._http.permissions == ["users"]  # type: ignore
+
     def test_client_set_phisherman_token(self, mock_client: Client) -> None:
         """Test Client set_phisherman_token method."""
         test_token = "test_phisherman_token"
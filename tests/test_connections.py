@@ -0,0 +1,72 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for connection pool settings."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+
+from ravyapi.connections import ConnectionSettings
+
+
+class TestConnectionSettings:
+    """Test cases for the ConnectionSettings class."""
+
+    def test_connection_settings_defaults(self) -> None:
+        """Test ConnectionSettings defaults are tuned beyond aiohttp's."""
+        settings = ConnectionSettings()
+
+        assert settings.limit > 100
+        assert settings.limit_per_host == 0
+        assert settings.keepalive_timeout > 15
+        assert settings.dns_cache_ttl is not None and settings.dns_cache_ttl > 10
+        assert settings.happy_eyeballs_delay is not None
+
+    def test_connection_settings_invalid_parameters(self) -> None:
+        """Test ConnectionSettings validates its parameters."""
+        with pytest.raises(TypeError):
+            ConnectionSettings(limit="10")  # type: ignore
+
+        with pytest.raises(ValueError):
+            ConnectionSettings(limit=-1)
+
+        with pytest.raises(ValueError):
+            ConnectionSettings(limit_per_host=-1)
+
+        with pytest.raises(ValueError):
+            ConnectionSettings(keepalive_timeout=-1)
+
+        with pytest.raises(TypeError):
+            ConnectionSettings(dns_cache_ttl=1.5)  # type: ignore
+
+        with pytest.raises(ValueError):
+            ConnectionSettings(happy_eyeballs_delay=-1)
+
+    @pytest.mark.asyncio
+    async def test_connection_settings_create_connector(self) -> None:
+        """Test ConnectionSettings creates a connector with its settings."""
+        settings = ConnectionSettings(
+            limit=50, limit_per_host=10, keepalive_timeout=30, dns_cache_ttl=120
+        )
+
+        connector = settings.create_connector()
+
+        try:
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 50
+            assert connector.limit_per_host == 10
+            assert connector.use_dns_cache is True
+        finally:
+            await connector.close()
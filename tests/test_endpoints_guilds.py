@@ -20,6 +20,7 @@ class TestGuilds:
         mock.get = AsyncMock()
         mock.post = AsyncMock()
         mock.get_permissions = AsyncMock()
+        mock.cache = None
         mock.permissions = ["guilds"]
         mock.paths = MagicMock()
         mock.paths.guilds = MagicMock()
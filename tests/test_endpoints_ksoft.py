@@ -20,6 +20,7 @@ class TestKSoft:
         mock.get = AsyncMock()
         mock.post = AsyncMock()
         mock.get_permissions = AsyncMock()
+        mock.cache = None
         mock.permissions = ["ksoft.bans"]
         mock.paths = MagicMock()
         mock.paths.ksoft = MagicMock()
@@ -9,6 +9,7 @@ from aioresponses import aioresponses
 
 from ravyapi.api.endpoints.urls import URLs
 from ravyapi.api.models.urls import GetWebsiteResponse
+from ravyapi.cache import ResponseCache
 
 
 class TestURLs:
@@ -19,6 +20,7 @@ class TestURLs:
         """Create a mock HTTP client."""
         mock = AsyncMock()
         mock.get_permissions = AsyncMock()
+        mock.cache = None
         mock.permissions = ["urls.cached", "admin.urls"]
         mock.phisherman_token = None
         mock.paths = AsyncMock()
@@ -307,3 +309,45 @@ class TestURLs:
             await urls.edit_website(
                 "https://example.com", is_fraudulent=True, message="test"
             )
+
+    @pytest.mark.asyncio
+    async def test_edit_website_invalidates_cached_website(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test edit_website removes cached responses of the website."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.keep_raw = True
+        mock_http_client.get.return_value = {"isFraudulent": False, "message": "OK"}
+        urls = URLs(mock_http_client)
+
+        await urls.get_website("example.com")
+        await urls.get_website("example.com", author=1)
+        await urls.edit_website(
+            "example.com", is_fraudulent=True, message="Phishing site"
+        )
+
+        assert len(mock_http_client.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_edit_website_encoded_message_is_looked_up_again(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test the website is looked up again after editing it with an encoded message."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.keep_raw = True
+        mock_http_client.get.return_value = {"isFraudulent": False, "message": "OK"}
+        urls = URLs(mock_http_client)
+
+        await urls.get_website("example.com")
+        await urls.edit_website(
+            "example.com", is_fraudulent=True, message="Phishing site", encode=True
+        )
+        mock_http_client.get.return_value = {
+            "isFraudulent": True,
+            "message": "Phishing+site",
+        }
+        website = await urls.get_website("example.com")
+
+        assert mock_http_client.get.call_count == 2
+        assert website.is_fraudulent is True
+        assert website.message == "Phishing+site"
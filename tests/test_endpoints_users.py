@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
-from unittest.mock import AsyncMock
+import asyncio
+from typing import Any, AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ravyapi.api.endpoints.users import Users
+from ravyapi.api.errors import NotFoundError
 from ravyapi.api.models.users import (
     GetBansResponse,
     GetPronounsResponse,
     GetReputationResponse,
     GetUserResponse,
     GetWhitelistsResponse,
+    UserLookup,
 )
+from ravyapi.cache import ResponseCache
 
 
 class TestUsers:
@@ -27,6 +31,7 @@ class TestUsers:
 
         mock = AsyncMock()
         mock.get_permissions = AsyncMock()
+        mock.cache = None
         mock.permissions = [
             "users",
             "admin.users",
@@ -40,6 +45,11 @@ class TestUsers:
         mock.paths.users.return_value.route = "/users/123456789"
         mock.post = AsyncMock()
         mock.delete = AsyncMock()
+
+        async def get_model(path: str, model: Callable[..., Any], **kwargs: Any) -> Any:
+            return model(await mock.get(path, **kwargs), keep_raw=mock.keep_raw)
+
+        mock.get_model = AsyncMock(side_effect=get_model)
         return mock
 
     def test_users_initialization(self, mock_http_client: AsyncMock) -> None:
@@ -371,3 +381,472 @@ class TestUsers:
             TypeError, match='Parameter "user_id" must be of type "int"'
         ):
             await users.get_reputation("invalid")  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_get_users_success(self, mock_http_client: AsyncMock) -> None:
+        """Test get_users collects successes and HTTP errors keyed by user ID."""
+        response_data: dict[str, Any] = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+
+        async def get(path: str) -> dict[str, Any]:
+            if path == "/users/2":
+                raise NotFoundError({"error": "Not Found", "details": "Unknown"})
+            return response_data
+
+        def users_path(user_id: int) -> MagicMock:
+            return MagicMock(route=f"/users/{user_id}")
+
+        mock_http_client.paths.users.side_effect = users_path
+        mock_http_client.get.side_effect = get
+        users = Users(mock_http_client)
+
+        result = await users.get_users([1, 2, 3, 1])
+
+        assert list(result) == [1, 2, 3]
+        assert isinstance(result[1], GetUserResponse)
+        assert isinstance(result[2], NotFoundError)
+        assert isinstance(result[3], GetUserResponse)
+        assert mock_http_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_users_respects_concurrency(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test get_users never exceeds the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        async def get(path: str) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"trust": {"level": 3, "label": "Neutral"}, "bans": []}
+
+        mock_http_client.get.side_effect = get
+        users = Users(mock_http_client)
+
+        result = await users.get_bans_bulk(range(20), concurrency=4)
+
+        assert len(result) == 20
+        assert all(isinstance(value, GetBansResponse) for value in result.values())
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_get_users_invalid_user_ids_type(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test get_users with invalid user IDs."""
+        users = Users(mock_http_client)
+
+        with pytest.raises(
+            TypeError, match='Parameter "user_ids" must only contain type "int"'
+        ):
+            await users.get_users([1, "2"])  # type: ignore
+
+        mock_http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_users_invalid_concurrency(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test get_users with invalid concurrency."""
+        users = Users(mock_http_client)
+
+        with pytest.raises(ValueError, match='Parameter "concurrency" must be'):
+            await users.get_users([1], concurrency=0)
+
+        with pytest.raises(TypeError, match='Parameter "concurrency" must be'):
+            await users.get_users([1], concurrency=1.5)  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_iter_users_yields_in_completion_order(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test iter_users yields results as they complete."""
+        response_data: dict[str, Any] = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        delays = {1: 0.03, 2: 0.0, 3: 0.01}
+
+        async def get(path: str) -> dict[str, Any]:
+            user_id = int(path.rsplit("/", 1)[1])
+            await asyncio.sleep(delays[user_id])
+            if user_id == 3:
+                raise NotFoundError("Not found")
+            return response_data
+
+        def users_path(user_id: int) -> MagicMock:
+            return MagicMock(route=f"/users/{user_id}")
+
+        mock_http_client.paths.users.side_effect = users_path
+        mock_http_client.get.side_effect = get
+        users = Users(mock_http_client)
+
+        results = [item async for item in users.iter_users([1, 2, 3])]
+
+        assert [user_id for user_id, _ in results] == [2, 3, 1]
+        assert isinstance(results[0][1], GetUserResponse)
+        assert isinstance(results[1][1], NotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_iter_users_bounds_in_flight_requests(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test iter_users only pulls IDs when there is room for another request."""
+        pulled = 0
+
+        async def user_ids() -> AsyncIterator[int]:
+            nonlocal pulled
+            for user_id in range(1000):
+                pulled += 1
+                yield user_id
+
+        mock_http_client.get.return_value = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        async for _ in users.iter_users(user_ids(), concurrency=5):
+            break
+
+        assert pulled == 5
+        assert mock_http_client.get.call_count <= 5
+
+    @pytest.mark.asyncio
+    async def test_iter_users_invalid_user_ids_type(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test iter_users with invalid user IDs."""
+        users = Users(mock_http_client)
+
+        with pytest.raises(
+            TypeError, match='Parameter "user_ids" must only contain type "int"'
+        ):
+            async for _ in users.iter_users(["invalid"]):  # type: ignore
+                pass
+
+    @pytest.mark.asyncio
+    async def test_lookup_merges_into_get_user(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test lookup makes a single user request for several sub-resources."""
+        mock_http_client.get.return_value = {
+            "trust": {"level": 2, "label": "Suspicious"},
+            "bans": [{"provider": "ravy", "reason": "Spam", "moderator": "1"}],
+            "whitelists": [],
+            "pronouns": "she/her",
+            "rep": [{"provider": "ravy", "score": 0.2}],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        result = await users.lookup(123, {"bans", "rep", "whitelists"})
+
+        mock_http_client.get.assert_called_once_with("/users/123456789")
+        assert isinstance(result, UserLookup)
+        assert result.pronouns is None
+        assert isinstance(result.bans, GetBansResponse)
+        assert isinstance(result.rep, GetReputationResponse)
+        assert isinstance(result.whitelists, GetWhitelistsResponse)
+        assert result.bans.bans[0].provider == "ravy"
+        assert result.rep.rep[0].score == 0.2
+
+    @pytest.mark.asyncio
+    async def test_lookup_without_users_permission(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test lookup falls back to sub-resource routes without the users permission."""
+        mock_http_client.permissions = ["users.pronouns", "users.bans"]
+        mock_http_client.paths.users.return_value.pronouns = "/users/1/pronouns"
+        mock_http_client.paths.users.return_value.bans = "/users/1/bans"
+
+        async def get(path: str) -> dict[str, Any]:
+            if path.endswith("pronouns"):
+                return {"pronouns": "he/him"}
+
+            return {"trust": {"level": 3, "label": "Neutral"}, "bans": []}
+
+        mock_http_client.get.side_effect = get
+        users = Users(mock_http_client)
+
+        result = await users.lookup(1, ["pronouns", "bans"])
+
+        assert mock_http_client.get.call_count == 2
+        assert result.pronouns is not None
+        assert result.pronouns.pronouns == "he/him"
+        assert result.bans is not None
+        assert result.bans.bans == []
+        assert result.rep is None
+
+    @pytest.mark.asyncio
+    async def test_lookup_single_resource(self, mock_http_client: AsyncMock) -> None:
+        """Test lookup of one sub-resource uses its own route."""
+        mock_http_client.paths.users.return_value.pronouns = "/users/1/pronouns"
+        mock_http_client.get.return_value = {"pronouns": "he/him"}
+        users = Users(mock_http_client)
+
+        result = await users.lookup(1, ["pronouns"])
+
+        mock_http_client.get.assert_called_once_with("/users/1/pronouns")
+        assert result.pronouns is not None
+        assert result.pronouns.pronouns == "he/him"
+        assert result.bans is None
+
+    @pytest.mark.asyncio
+    async def test_lookup_invalid_want(self, mock_http_client: AsyncMock) -> None:
+        """Test lookup validates the wanted sub-resources."""
+        users = Users(mock_http_client)
+
+        with pytest.raises(TypeError):
+            await users.lookup(1, "bans")
+
+        with pytest.raises(ValueError):
+            await users.lookup(1, [])
+
+        with pytest.raises(ValueError):
+            await users.lookup(1, ["bans", "sentinel"])
+
+    @pytest.mark.asyncio
+    async def test_get_user_cached(self, mock_http_client: AsyncMock) -> None:
+        """Test get_user answers repeated lookups from the cache."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.get.return_value = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        first = await users.get_user(123)
+        second = await users.get_user(123)
+
+        assert second is first
+        mock_http_client.get.assert_called_once()
+        assert mock_http_client.cache.stats["users"].hits == 1
+        assert mock_http_client.cache.stats["users"].misses == 1
+
+    @pytest.mark.asyncio
+    async def test_get_bans_cached_separately(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test sub-resource lookups are cached under their own endpoint."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.get.return_value = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+        }
+        users = Users(mock_http_client)
+
+        await users.get_bans(123)
+        await users.get_bans(123)
+        await users.get_bans(456)
+
+        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.cache.stats["users.bans"].hits == 1
+
+    @pytest.mark.asyncio
+    async def test_sub_resources_derived_from_cached_user(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test sub-resource lookups are answered from a cached user."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.permissions.append("users.rep")
+        mock_http_client.get.return_value = {
+            "trust": {"level": 2, "label": "Suspicious"},
+            "bans": [{"provider": "ravy", "reason": "Spam", "moderator": "1"}],
+            "whitelists": [],
+            "pronouns": "she/her",
+            "rep": [{"provider": "ravy", "score": 0.2}],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        await users.get_user(123)
+        pronouns = await users.get_pronouns(123)
+        bans = await users.get_bans(123)
+        reputation = await users.get_reputation(123)
+
+        mock_http_client.get.assert_called_once()
+        assert pronouns.pronouns == "she/her"
+        assert bans.trust.level == 2
+        assert bans.bans[0].provider == "ravy"
+        assert reputation.rep[0].score == 0.2
+        assert mock_http_client.cache.stats["users.bans"].derived_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_sub_resources_not_derived_from_expired_user(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test sub-resource lookups make a request once the cached user expired."""
+        mock_http_client.cache = ResponseCache(ttl=10, max_stale=60)
+        mock_http_client.get.return_value = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            await users.get_user(123)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1020.0):
+            await users.get_pronouns(123)
+
+        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.cache.stats["users.pronouns"].derived_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_add_ban_invalidates_cached_user(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test add_ban removes cached responses containing the user's bans."""
+        mock_http_client.cache = ResponseCache()
+        mock_http_client.paths.users.return_value.pronouns = "/users/123/pronouns"
+        mock_http_client.get.return_value = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        users = Users(mock_http_client)
+
+        await users.get_user(123)
+        await users.get_pronouns(456)
+        await users.add_ban(123, provider="ravy", reason="Spam", moderator=1)
+        await users.get_user(123)
+        await users.get_bans(123)
+
+        assert mock_http_client.get.call_count == 3
+        assert mock_http_client.cache.get("users.pronouns", "users.pronouns:456")
+
+    @pytest.mark.asyncio
+    async def test_add_ban_during_get_user_is_not_cached_over(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test a user requested before add_ban is not cached after it."""
+        mock_http_client.cache = ResponseCache()
+        requested = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get(path: str) -> dict[str, Any]:
+            requested.set()
+            await release.wait()
+            return {
+                "trust": {"level": 3, "label": "Neutral"},
+                "bans": [],
+                "whitelists": [],
+                "pronouns": "he/him",
+                "rep": [],
+                "sentinel": {"verified": False, "id": "123"},
+            }
+
+        mock_http_client.get.side_effect = get
+        users = Users(mock_http_client)
+
+        task = asyncio.ensure_future(users.get_user(123))
+        await requested.wait()
+        await users.add_ban(123, provider="ravy", reason="Spam", moderator=1)
+        release.set()
+        await task
+
+        assert mock_http_client.cache.get("users", "users:123") is None
+
+    @pytest.mark.asyncio
+    async def test_get_user_stale_while_revalidate(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test an expired cached user is served while it is refreshed."""
+        mock_http_client.cache = ResponseCache(ttl=10, max_stale=60)
+        data: dict[str, Any] = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        mock_http_client.get.return_value = data
+        users = Users(mock_http_client)
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1000.0):
+            first = await users.get_user(123)
+
+        mock_http_client.get.return_value = {**data, "pronouns": "they/them"}
+
+        with patch("ravyapi.cache.responses.time.time", return_value=1020.0), patch(
+            "ravyapi.utils.time.time", return_value=1020.0
+        ):
+            stale = await users.get_user(123)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            fresh = await users.get_user(123)
+
+        assert stale is first
+        assert fresh.pronouns == "they/them"
+        assert mock_http_client.get.call_count == 2
+        assert mock_http_client.cache.stats["users"].stale_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_get_user_not_found_cached(self, mock_http_client: AsyncMock) -> None:
+        """Test repeated lookups of an unknown user raise from the cache."""
+        mock_http_client.cache = ResponseCache()
+        error = NotFoundError({"error": "Not found", "details": "Unknown user"})
+        mock_http_client.get.side_effect = error
+        users = Users(mock_http_client)
+
+        with pytest.raises(NotFoundError):
+            await users.get_user(123)
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await users.get_user(123)
+
+        assert exc_info.value is not error
+        assert exc_info.value.exc_data == error.exc_data
+        mock_http_client.get.assert_called_once()
+        assert mock_http_client.cache.stats["users"].negative_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_get_user_without_raw_data(self, mock_http_client: AsyncMock) -> None:
+        """Test get_user builds models without raw data when the client drops it."""
+        mock_http_client.keep_raw = False
+        data: dict[str, Any] = {
+            "trust": {"level": 3, "label": "Neutral"},
+            "bans": [],
+            "whitelists": [],
+            "pronouns": "he/him",
+            "rep": [],
+            "sentinel": {"verified": False, "id": "123"},
+        }
+        mock_http_client.get.return_value = data
+        users = Users(mock_http_client)
+
+        result = await users.get_user(123)
+
+        assert result._data is None  # type: ignore
+        assert result.data == data
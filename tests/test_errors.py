@@ -262,4 +262,9 @@ class TestTooManyRequestsError:
         """Test TooManyRequestsError has proper slots."""
         error = TooManyRequestsError("test")
 
-        assert error.__slots__ == ("_exc_data",)
+        assert error.__slots__ == ("_exc_data", "_retry_after")
+
+    def test_too_many_requests_error_retry_after(self) -> None:
+        """Test TooManyRequestsError retry_after property."""
+        assert TooManyRequestsError("test").retry_after is None
+        assert TooManyRequestsError("test", 2.5).retry_after == 2.5
@@ -1,5 +1,11 @@
 """Tests for the HTTP client module."""
 
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,8 +18,10 @@ from ravyapi.api.errors import (
     TooManyRequestsError,
     UnauthorizedError,
 )
+from ravyapi.api.models import GetBansResponse, GetPronounsResponse
 from ravyapi.const import BASE_URL
 from ravyapi.http import HTTPAwareEndpoint, HTTPClient
+from ravyapi.serialization import JSONCodec
 
 
 class TestHTTPClient:
@@ -53,6 +61,41 @@ class TestHTTPClient:
         assert client._token == valid_ksoft_token  # type: ignore
         assert client._permissions is None  # type: ignore
 
+    def test_http_client_initialization_without_event_loop(
+        self, valid_ravy_token: str
+    ) -> None:
+        """Test HTTPClient can be constructed outside a running event loop."""
+        client = HTTPClient(valid_ravy_token)
+
+        assert client._session is None  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_http_client_lazy_session(self, valid_ravy_token: str) -> None:
+        """Test HTTPClient creates its session once, on first use."""
+        client = HTTPClient(valid_ravy_token)
+
+        await client.start()
+        session = client._session  # type: ignore
+        await client.start()
+
+        try:
+            assert session is not None
+            assert client._session is session  # type: ignore
+            assert client._get_session() is session  # type: ignore
+        finally:
+            await client.close()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_close_without_session(self, valid_ravy_token: str) -> None:
+        """Test closing a client that never made a request."""
+        client = HTTPClient(valid_ravy_token)
+
+        await client.close()
+
+        assert client._session is None  # type: ignore
+
     def test_token_sentinel_valid_ravy_token(self, valid_ravy_token: str) -> None:
         """Test token sentinel with valid Ravy token."""
         assert HTTPClient._token_sentinel(valid_ravy_token) == valid_ravy_token  # type: ignore
@@ -164,14 +207,16 @@ class TestHTTPClient:
         """Test GET request."""
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json = AsyncMock(return_value={"data": "test"})
+        mock_response.read = AsyncMock(
+            return_value=json.dumps({"data": "test"}).encode()
+        )
 
         # Create a proper async context manager mock
         mock_context_manager = AsyncMock()
         mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
         mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-        mock_session = mock_http_client._session  # type: ignore
+        mock_session = self._mock_session(mock_http_client)
         mock_session.get = MagicMock(return_value=mock_context_manager)
 
         result = await mock_http_client.get("/test")
@@ -184,14 +229,16 @@ class TestHTTPClient:
         """Test POST request."""
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json = AsyncMock(return_value={"data": "test"})
+        mock_response.read = AsyncMock(
+            return_value=json.dumps({"data": "test"}).encode()
+        )
 
         # Create a proper async context manager mock
         mock_context_manager = AsyncMock()
         mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
         mock_context_manager.__aexit__ = AsyncMock(return_value=None)
 
-        mock_session = mock_http_client._session  # type: ignore
+        mock_session = self._mock_session(mock_http_client)
         mock_session.post = MagicMock(return_value=mock_context_manager)
 
         result = await mock_http_client.post("/test", data={"key": "value"})
@@ -201,6 +248,238 @@ class TestHTTPClient:
             f"{BASE_URL}/test", data={"key": "value"}
         )
 
+    @pytest.mark.asyncio
+    async def test_handle_response_429_retry_after(self) -> None:
+        """Test handle_response reads Retry-After for 429 responses."""
+        mock_response = MagicMock()
+        mock_response.ok = False
+        mock_response.status = 429
+        mock_response.headers = {"Retry-After": "3"}
+        mock_response.json = AsyncMock(return_value={"error": "Too many requests"})
+
+        with pytest.raises(TooManyRequestsError) as exc_info:
+            await HTTPClient._handle_response(mock_response)  # type: ignore
+
+        assert exc_info.value.retry_after == 3.0
+
+    @pytest.mark.asyncio
+    async def test_get_request_retries_after_429(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test GET request is transparently retried after a 429 response."""
+        limited = MagicMock()
+        limited.ok = False
+        limited.status = 429
+        limited.headers = {"Retry-After": "0"}
+        limited.json = AsyncMock(return_value={"error": "Too many requests"})
+
+        success = MagicMock()
+        success.ok = True
+        success.headers = {}
+        success.read = AsyncMock(return_value=json.dumps({"data": "test"}).encode())
+
+        contexts: list[AsyncMock] = []
+        for response in (limited, success):
+            context = AsyncMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            contexts.append(context)
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(side_effect=contexts)
+
+        result = await mock_http_client.get("/test")
+
+        assert result == {"data": "test"}
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_request_raises_after_max_retries(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test GET request raises once the 429 retries are exhausted."""
+        limited = MagicMock()
+        limited.ok = False
+        limited.status = 429
+        limited.headers = {"Retry-After": "0"}
+        limited.json = AsyncMock(return_value={"error": "Too many requests"})
+
+        context = AsyncMock()
+        context.__aenter__ = AsyncMock(return_value=limited)
+        context.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=context)
+
+        with pytest.raises(TooManyRequestsError):
+            await mock_http_client.get("/test")
+
+        assert (
+            mock_session.get.call_count == mock_http_client.ratelimiter.max_retries + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_request_retries_transient_failures(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test GET request is retried after connection errors and 5xx responses."""
+        import aiohttp
+
+        from ravyapi.retries import RetryPolicy
+
+        mock_http_client._retry_policy = RetryPolicy(3, base_delay=0, max_delay=0)  # type: ignore
+
+        failure = MagicMock()
+        failure.ok = False
+        failure.status = 502
+        failure.headers = {}
+        failure.json = AsyncMock(return_value={"error": "Bad Gateway"})
+
+        success = MagicMock()
+        success.ok = True
+        success.headers = {}
+        success.read = AsyncMock(return_value=json.dumps({"data": "test"}).encode())
+
+        contexts: list[AsyncMock] = []
+        for response in (failure, success):
+            context = AsyncMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            contexts.append(context)
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(
+            side_effect=[aiohttp.ServerDisconnectedError(), *contexts]
+        )
+
+        result = await mock_http_client.get("/test")
+
+        assert result == {"data": "test"}
+        assert mock_session.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_request_gives_up_after_max_attempts(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test GET request raises once the retry attempts are exhausted."""
+        import aiohttp
+
+        from ravyapi.retries import RetryPolicy
+
+        mock_http_client._retry_policy = RetryPolicy(2, base_delay=0, max_delay=0)  # type: ignore
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(side_effect=aiohttp.ServerDisconnectedError())
+
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await mock_http_client.get("/test")
+
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_post_request_not_retried(self, mock_http_client: HTTPClient) -> None:
+        """Test POST request is not retried after transient failures."""
+        import aiohttp
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.post = MagicMock(side_effect=aiohttp.ServerDisconnectedError())
+
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await mock_http_client.post("/test", json={})
+
+        mock_session.post.assert_called_once()
+
+    @staticmethod
+    def _mock_session(client: HTTPClient) -> AsyncMock:
+        """Get the mocked session of the client fixture."""
+        session = client._session  # type: ignore
+        assert isinstance(session, AsyncMock)
+        return session
+
+    @staticmethod
+    def _slow_context(response: MagicMock, delay: float = 0.01) -> AsyncMock:
+        """Create a request context manager that takes a while to respond."""
+
+        async def enter() -> MagicMock:
+            await asyncio.sleep(delay)
+            return response
+
+        context = AsyncMock()
+        context.__aenter__ = AsyncMock(side_effect=enter)
+        context.__aexit__ = AsyncMock(return_value=None)
+        return context
+
+    @pytest.mark.asyncio
+    async def test_get_request_coalesces_identical_requests(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test concurrent identical GET requests share a single request."""
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(return_value=json.dumps({"data": "test"}).encode())
+
+        mock_session = self._mock_session(mock_http_client)
+
+        def request(*args: Any, **kwargs: Any) -> AsyncMock:
+            return self._slow_context(response)
+
+        mock_session.get = MagicMock(side_effect=request)
+
+        results = await asyncio.gather(
+            *(mock_http_client.get("/users/1") for _ in range(5)),
+            mock_http_client.get("/users/1", params={"a": 1}),
+        )
+
+        assert all(result is results[0] for result in results[:5])
+        assert mock_session.get.call_count == 2
+        assert mock_http_client._inflight == {}  # type: ignore
+        assert mock_http_client.cache_stats()["users"].coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_get_request_coalesced_errors_propagate(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test every coalesced caller receives the error of the shared request."""
+        response = MagicMock()
+        response.ok = False
+        response.status = 404
+        response.headers = {}
+        response.json = AsyncMock(return_value={"error": "Not found"})
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response))
+
+        results = await asyncio.gather(
+            *(mock_http_client.get("/users/1") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, NotFoundError) for result in results)
+        mock_session.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_request_cancelled_caller_does_not_cancel_others(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test cancelling one coalesced caller leaves the shared request running."""
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(return_value=json.dumps({"data": "test"}).encode())
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response, 0.05))
+
+        first = asyncio.ensure_future(mock_http_client.get("/users/1"))
+        second = asyncio.ensure_future(mock_http_client.get("/users/1"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == {"data": "test"}
+        assert first.cancelled()
+        mock_session.get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_permissions_cached(self, mock_http_client: HTTPClient) -> None:
         """Test get_permissions when permissions are already cached."""
@@ -233,6 +512,265 @@ class TestHTTPClient:
         # Verify the access would be set correctly
         assert response_model.access == ["users", "avatars"]
 
+    @pytest.mark.asyncio
+    async def test_get_permissions_single_flight(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test concurrent permission fetches make a single token request."""
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "user": 12345,
+                    "access": ["users", "avatars"],
+                    "application": 67890,
+                    "type": "ravy",
+                }
+            ).encode()
+        )
+
+        mock_session = self._mock_session(mock_http_client)
+
+        def request(*args: Any, **kwargs: Any) -> AsyncMock:
+            return self._slow_context(response)
+
+        mock_session.get = MagicMock(side_effect=request)
+
+        await asyncio.gather(*(mock_http_client.get_permissions() for _ in range(50)))
+
+        mock_session.get.assert_called_once()
+        assert mock_http_client.permissions == ["users", "avatars"]
+        assert mock_http_client._permissions_fetch is None  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_get_permissions_retried_after_failure(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test a failed permission fetch is not shared with later callers."""
+        failure = MagicMock()
+        failure.ok = False
+        failure.status = 401
+        failure.headers = {}
+        failure.json = AsyncMock(return_value={"error": "Unauthorized"})
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(failure))
+
+        with pytest.raises(UnauthorizedError):
+            await mock_http_client.get_permissions()
+
+        with pytest.raises(UnauthorizedError):
+            await mock_http_client.get_permissions()
+
+        assert mock_session.get.call_count == 2
+
+    def test_http_client_invalid_permissions_ttl(self, valid_ravy_token: str) -> None:
+        """Test HTTPClient validates the permissions TTL."""
+        with pytest.raises(TypeError):
+            HTTPClient(valid_ravy_token, permissions_ttl="1")  # type: ignore
+
+        with pytest.raises(ValueError):
+            HTTPClient(valid_ravy_token, permissions_ttl=-1)
+
+    def test_http_client_invalid_keep_raw(self, valid_ravy_token: str) -> None:
+        """Test HTTPClient validates the keep_raw flag."""
+        with pytest.raises(TypeError):
+            HTTPClient(valid_ravy_token, keep_raw="no")  # type: ignore
+
+    @staticmethod
+    def _token_response(access: list[str]) -> MagicMock:
+        """Create a successful token response granting the given access."""
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "user": 12345,
+                    "access": access,
+                    "application": 67890,
+                    "type": "ravy",
+                }
+            ).encode()
+        )
+        return response
+
+    @pytest.mark.asyncio
+    async def test_get_permissions_refreshed_in_background(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test expired permissions keep being used while they are refreshed."""
+        old = ["users"]
+        mock_http_client._permissions = old  # type: ignore
+        mock_http_client._permissions_ttl = 60.0  # type: ignore
+        mock_http_client._permissions_fetched_at = time.monotonic() - 120  # type: ignore
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(
+            return_value=self._slow_context(self._token_response(["users", "urls"]))
+        )
+
+        await mock_http_client.get_permissions()
+        assert mock_http_client.permissions is old
+
+        await mock_http_client._permissions_fetch  # type: ignore
+        assert mock_http_client.permissions == ["users", "urls"]
+        mock_session.get.assert_called_once()
+
+        await mock_http_client.get_permissions()
+        mock_session.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_permissions_refresh_backs_off(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test calls after a failed permissions refresh do not refetch right away."""
+        mock_http_client._permissions = ["users"]  # type: ignore
+        mock_http_client.invalidate_permissions()
+
+        failure = MagicMock()
+        failure.ok = False
+        failure.status = 401
+        failure.headers = {}
+        failure.json = AsyncMock(return_value={"error": "Unauthorized"})
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(failure))
+
+        await mock_http_client.get_permissions()
+        await asyncio.gather(
+            mock_http_client._permissions_fetch,  # type: ignore
+            return_exceptions=True,
+        )
+        await mock_http_client.get_permissions()
+        await mock_http_client.get_permissions()
+
+        mock_session.get.assert_called_once()
+
+        mock_http_client._permissions_failed_at -= 5.0  # type: ignore
+        assert mock_http_client._permissions_expired()  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_forbidden_invalidates_permissions(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test a 403 response marks the permissions to be refreshed."""
+        mock_http_client._permissions = ["users"]  # type: ignore
+        mock_http_client._permissions_fetched_at = time.monotonic()  # type: ignore
+
+        response = MagicMock()
+        response.ok = False
+        response.status = 403
+        response.headers = {}
+        response.json = AsyncMock(return_value={"error": "Forbidden"})
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response))
+
+        assert not mock_http_client._permissions_expired()  # type: ignore
+
+        with pytest.raises(ForbiddenError):
+            await mock_http_client.get("/users/1")
+
+        assert mock_http_client._permissions_expired()  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_token_route_errors_do_not_invalidate_permissions(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test a failed permissions fetch does not invalidate the permissions."""
+        mock_http_client._permissions_fetched_at = time.monotonic()  # type: ignore
+
+        response = MagicMock()
+        response.ok = False
+        response.status = 401
+        response.headers = {}
+        response.json = AsyncMock(return_value={"error": "Unauthorized"})
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response))
+
+        with pytest.raises(UnauthorizedError):
+            await mock_http_client.get(mock_http_client.paths.tokens.route)
+
+        assert not mock_http_client._permissions_expired()  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_get_request_uses_json_codec(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test response bodies are decoded from bytes by the JSON codec."""
+        loads = MagicMock(return_value={"data": "decoded"})
+        mock_http_client._json = JSONCodec(loads=loads)  # type: ignore
+
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(return_value=b'{"data": "test"}')
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response))
+
+        assert await mock_http_client.get("/test") == {"data": "decoded"}
+        loads.assert_called_once_with(b'{"data": "test"}')
+
+    @pytest.mark.asyncio
+    async def test_get_model_builds_model_from_json(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test get_model builds the model from the JSON response without typing."""
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(return_value=b'{"pronouns": "they/them"}')
+
+        mock_session = self._mock_session(mock_http_client)
+        mock_session.get = MagicMock(return_value=self._slow_context(response))
+
+        result = await mock_http_client.get_model(
+            "/users/1/pronouns", GetPronounsResponse
+        )
+
+        assert result.pronouns == "they/them"
+        assert result.data == {"pronouns": "they/them"}
+
+    @pytest.mark.asyncio
+    async def test_get_model_decodes_into_structs(
+        self, mock_http_client: HTTPClient
+    ) -> None:
+        """Test get_model decodes straight into the model with a typed codec."""
+        pytest.importorskip("msgspec")
+        loads = MagicMock()
+        mock_http_client._json = JSONCodec(loads=loads, typed=True)  # type: ignore
+
+        response = MagicMock()
+        response.ok = True
+        response.headers = {}
+        response.read = AsyncMock(
+            return_value=b'{"trust": {"level": 3, "label": "Neutral"}, "bans": []}'
+        )
+
+        mock_session = self._mock_session(mock_http_client)
+
+        def request(*args: Any, **kwargs: Any) -> AsyncMock:
+            return self._slow_context(response)
+
+        mock_session.get = MagicMock(side_effect=request)
+
+        bans, raw = await asyncio.gather(
+            mock_http_client.get_model("/users/1/bans", GetBansResponse),
+            mock_http_client.get("/users/1/bans"),
+        )
+
+        assert isinstance(bans, GetBansResponse)
+        assert bans.trust.level == 3
+        assert bans.data == {"trust": {"level": 3, "label": "Neutral"}, "bans": []}
+        # the typed and untyped requests decode differently, so are not coalesced
+        assert raw is loads.return_value
+        assert mock_session.get.call_count == 2
+
     def test_set_phisherman_token(self, mock_http_client: HTTPClient) -> None:
         """Test setting phisherman token."""
         test_token = "test_phisherman_token"
@@ -107,6 +107,15 @@ class TestCheckAvatarResponse:
         assert response.data == data
         assert response.data is data  # Should be the same object
 
+    def test_check_avatar_response_without_raw_data(self) -> None:
+        """Test CheckAvatarResponse rebuilds its data when the raw data is not kept."""
+        data = {"matched": False}
+
+        response = CheckAvatarResponse(data, keep_raw=False)
+
+        assert response._data is None  # type: ignore
+        assert response.data == data
+
     def test_check_avatar_response_matched_property(self) -> None:
         """Test CheckAvatarResponse matched property."""
         data = {"matched": True}
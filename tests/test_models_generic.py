@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from ravyapi.api.models.generic.ban_entry import BanEntryRequest, BanEntryResponse
 from ravyapi.api.models.generic.trust import Trust
 
@@ -83,6 +85,31 @@ class TestBanEntryResponse:
         assert response.data is data
         assert isinstance(response.data, dict)
 
+    def test_ban_entry_response_without_raw_data(self):
+        """Test BanEntryResponse rebuilds its data when the raw data is not kept."""
+        data = {
+            "provider": "ravy",
+            "reason": "Test reason",
+            "moderator": "123456789",
+            "reason_key": "test_key",
+        }
+
+        response = BanEntryResponse(data, keep_raw=False)
+
+        assert response._data is None  # type: ignore
+        assert response.moderator == 123456789
+        assert response.data == data
+
+    def test_ban_entry_response_interns_vocabulary(self):
+        """Test BanEntryResponse interns its provider and reason key."""
+        raw = '{"provider": "ravy", "reason": "r", "moderator": "1", "reason_key": "spam"}'
+        first = BanEntryResponse(json.loads(raw))
+        second = BanEntryResponse(json.loads(raw))
+
+        assert first.data["provider"] is not second.data["provider"]
+        assert first.provider is second.provider
+        assert first.reason_key is second.reason_key
+
     def test_ban_entry_response_string_moderator(self):
         """Test BanEntryResponse with string moderator conversion."""
         data = {
@@ -273,6 +300,25 @@ class TestTrust:
         assert trust.data is data
         assert isinstance(trust.data, dict)
 
+    def test_trust_from_data_is_shared(self):
+        """Test Trust.from_data shares one model per level and label."""
+        first = Trust.from_data({"level": 3, "label": "Neutral"})
+        second = Trust.from_data({"level": 3, "label": "Neutral"})
+        other = Trust.from_data({"level": 5, "label": "Trusted"})
+
+        assert first is second
+        assert first is not other
+        assert first.data == {"level": 3, "label": "Neutral"}
+
+    def test_trust_from_data_with_other_keys_is_not_shared(self):
+        """Test Trust.from_data keeps raw data with other keys in its own model."""
+        data = {"level": 3, "label": "Neutral", "reason": "new field"}
+
+        trust = Trust.from_data(data)
+
+        assert trust is not Trust.from_data(dict(data))
+        assert trust.data is data
+
     def test_trust_level_property(self):
         """Test Trust level property."""
         data = {"level": 5, "label": "Trusted"}
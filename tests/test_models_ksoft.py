@@ -121,6 +121,22 @@ class TestGetKSoftBanResponse:
         assert response.data is data
         assert isinstance(response.data, dict)
 
+    def test_get_ksoft_ban_response_without_raw_data(self):
+        """Test GetKSoftBanResponse rebuilds its data when the raw data is not kept."""
+        data = {
+            "found": True,
+            "id": "123456789",
+            "tag": "TestUser#1234",
+            "moderator": "987654321",
+            "severe": False,
+        }
+
+        response = GetKSoftBanResponse(data, keep_raw=False)
+
+        assert response._data is None  # type: ignore
+        assert response.user_id == 123456789
+        assert response.data == data
+
     def test_get_ksoft_ban_response_properties_none_values(self):
         """Test GetKSoftBanResponse properties with None values."""
         data = {
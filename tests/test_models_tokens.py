@@ -55,6 +55,21 @@ class TestGetTokenResponse:
         assert response.token_type == "ksoft"
         assert response.data == data
 
+    def test_get_token_response_without_raw_data(self) -> None:
+        """Test GetTokenResponse rebuilds its data with the API's string IDs."""
+        data = {
+            "user": "123456789",
+            "access": ["users"],
+            "application": "987654321",
+            "type": "ravy",
+        }
+
+        response = GetTokenResponse(data, keep_raw=False)
+
+        assert response._data is None  # type: ignore
+        assert response.user == 123456789
+        assert response.data == data
+
     def test_get_token_response_empty_access(self) -> None:
         """Test GetTokenResponse with empty access list."""
         data: dict[str, str | list[str] | int] = {
@@ -0,0 +1,108 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for users models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ravyapi.api.models.generic.ban_entry import BanEntryResponse
+from ravyapi.api.models.generic.trust import Trust
+from ravyapi.api.models.users import (
+    GetUserResponse,
+    ReputationEntry,
+    SentinelEntry,
+    WhitelistEntry,
+)
+
+
+class TestGetUserResponse:
+    """Test class for GetUserResponse model."""
+
+    @staticmethod
+    def _data() -> dict[str, Any]:
+        """Create the raw data of a user."""
+        return {
+            "pronouns": "they/them",
+            "trust": {"level": 3, "label": "Neutral"},
+            "whitelists": [{"provider": "ravy", "reason": "staff"}],
+            "bans": [
+                {
+                    "provider": "ravy",
+                    "reason": "Test reason",
+                    "moderator": "987654321",
+                    "reason_key": "test_key",
+                }
+            ],
+            "rep": [{"provider": "ravy", "score": 0.5}],
+            "sentinel": {"verified": True, "id": 123},
+        }
+
+    def test_get_user_response_initialization(self):
+        """Test GetUserResponse initialization."""
+        data = self._data()
+
+        response = GetUserResponse(data)
+
+        assert response.data is data
+        assert response.pronouns == "they/them"
+        assert isinstance(response.trust, Trust)
+        assert response.trust.level == 3
+        assert isinstance(response.whitelists[0], WhitelistEntry)
+        assert isinstance(response.bans[0], BanEntryResponse)
+        assert response.bans[0].moderator == 987654321
+        assert isinstance(response.rep[0], ReputationEntry)
+        assert isinstance(response.sentinel, SentinelEntry)
+        assert response.sentinel.internal_id == "123"
+
+    def test_get_user_response_nested_models_are_lazy(self):
+        """Test nested models are only built when first accessed."""
+        data = self._data()
+        data["bans"] = [{"invalid": True}]
+
+        response = GetUserResponse(data)
+
+        assert response.trust.label == "Neutral"
+        assert response._bans is None  # type: ignore
+
+    def test_get_user_response_nested_models_are_reused(self):
+        """Test nested models are built once and reused afterwards."""
+        response = GetUserResponse(self._data())
+
+        assert response.trust is response.trust
+        assert response.bans is response.bans
+        assert response.rep is response.rep
+        assert response.whitelists is response.whitelists
+        assert response.sentinel is response.sentinel
+
+    def test_get_user_response_without_raw_data(self):
+        """Test GetUserResponse builds nested models and rebuilds its data when not kept."""
+        data = self._data()
+
+        response = GetUserResponse(data, keep_raw=False)
+
+        assert response._data is None  # type: ignore
+        assert response._bans is not None  # type: ignore
+        assert response.trust._data is None  # type: ignore
+        assert response.bans[0]._data is None  # type: ignore
+        assert response.data == data
+
+    def test_get_user_response_repr(self):
+        """Test GetUserResponse repr."""
+        response = GetUserResponse(self._data())
+
+        repr_str = repr(response)
+        assert "GetUserResponse" in repr_str
+        assert "pronouns='they/them'" in repr_str
+        assert "Trust" in repr_str
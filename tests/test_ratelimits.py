@@ -0,0 +1,166 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for client-side rate limiting."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ravyapi.ratelimits import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for the TokenBucket class."""
+
+    def test_token_bucket_initialization(self) -> None:
+        """Test TokenBucket starts full."""
+        bucket = TokenBucket(5, 10.0)
+
+        assert bucket.capacity == 5
+        assert bucket.refill_rate == 10.0
+        assert bucket.tokens == 5.0
+        assert bucket.reset_at == 0.0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_acquire_burst(self) -> None:
+        """Test TokenBucket allows a burst up to its capacity without waiting."""
+        bucket = TokenBucket(3, 1.0)
+        start = time.monotonic()
+
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.1
+        assert bucket.tokens < 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_acquire_paces_when_exhausted(self) -> None:
+        """Test TokenBucket delays requests once exhausted."""
+        bucket = TokenBucket(1, 20.0)
+        start = time.monotonic()
+
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_park(self) -> None:
+        """Test TokenBucket waits until a parked bucket resets."""
+        bucket = TokenBucket(10, 100.0)
+        bucket.park(0.05)
+        start = time.monotonic()
+
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.04
+        assert bucket.reset_at > 0
+
+    def test_token_bucket_update_parks_when_exhausted(self) -> None:
+        """Test TokenBucket parks when the server reports no remaining requests."""
+        bucket = TokenBucket(10, 1.0)
+
+        bucket.update(0, 5.0)
+
+        assert bucket.tokens <= 0
+        assert bucket.reset_at > time.monotonic()
+
+    def test_token_bucket_update_without_headers(self) -> None:
+        """Test TokenBucket ignores updates without rate limit information."""
+        bucket = TokenBucket(10, 1.0)
+
+        bucket.update(None, None)
+
+        assert bucket.tokens == 10.0
+        assert bucket.reset_at == 0.0
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+
+    def test_rate_limiter_defaults(self) -> None:
+        """Test RateLimiter default configuration."""
+        limiter = RateLimiter()
+
+        assert limiter.capacity > 0
+        assert limiter.refill_rate > 0
+        assert limiter.max_retries >= 0
+        assert limiter.buckets == {}
+
+    def test_rate_limiter_invalid_parameters(self) -> None:
+        """Test RateLimiter validates its parameters."""
+        with pytest.raises(TypeError):
+            RateLimiter(capacity="10")  # type: ignore
+
+        with pytest.raises(ValueError):
+            RateLimiter(capacity=0)
+
+        with pytest.raises(ValueError):
+            RateLimiter(refill_rate=0)
+
+        with pytest.raises(ValueError):
+            RateLimiter(max_retries=-1)
+
+    def test_rate_limiter_bucket_key(self) -> None:
+        """Test RateLimiter buckets paths by their major route."""
+        assert RateLimiter.bucket_key("/users/123/bans") == "users"
+        assert RateLimiter.bucket_key("/users/123") == "users"
+        assert RateLimiter.bucket_key("/ksoft/bans/123") == "ksoft"
+        assert RateLimiter.bucket_key("/urls") == "urls"
+        assert RateLimiter.bucket_key("/tokens/@current") == "tokens"
+
+    def test_rate_limiter_shares_buckets(self) -> None:
+        """Test RateLimiter shares a bucket between paths of the same route."""
+        limiter = RateLimiter()
+
+        assert limiter.get_bucket("/users/1") is limiter.get_bucket("/users/2/rep")
+        assert limiter.get_bucket("/users/1") is not limiter.get_bucket("/guilds/1")
+
+    def test_rate_limiter_update_from_headers(self) -> None:
+        """Test RateLimiter reads rate limit headers."""
+        limiter = RateLimiter()
+
+        limiter.update(
+            "/users/1",
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2.5"},
+        )
+
+        assert limiter.get_bucket("/users/1").reset_at > time.monotonic() + 2
+
+    def test_rate_limiter_update_from_reset_timestamp(self) -> None:
+        """Test RateLimiter reads an absolute reset timestamp."""
+        limiter = RateLimiter()
+
+        limiter.update(
+            "/users/1",
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 3)},
+        )
+
+        assert limiter.get_bucket("/users/1").reset_at > time.monotonic() + 2
+
+    def test_rate_limiter_park_default_retry_after(self) -> None:
+        """Test RateLimiter parks for a default time without Retry-After."""
+        limiter = RateLimiter()
+
+        limiter.park("/urls", None)
+
+        assert limiter.get_bucket("/urls").reset_at > time.monotonic()
+
+    def test_rate_limiter_retry_after(self) -> None:
+        """Test RateLimiter parses the Retry-After header."""
+        assert RateLimiter.retry_after({"Retry-After": "1.5"}) == 1.5
+        assert RateLimiter.retry_after({"Retry-After": "soon"}) is None
+        assert RateLimiter.retry_after({}) is None
@@ -0,0 +1,97 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for retry policies."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from ravyapi.api.errors import (
+    BadRequestError,
+    HTTPError,
+    NotFoundError,
+    TooManyRequestsError,
+)
+from ravyapi.retries import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test cases for the RetryPolicy class."""
+
+    def test_retry_policy_defaults(self) -> None:
+        """Test RetryPolicy default configuration."""
+        policy = RetryPolicy()
+
+        assert policy.max_attempts >= 1
+        assert 0 <= policy.base_delay <= policy.max_delay
+        assert policy.deadline is not None
+
+    def test_retry_policy_invalid_parameters(self) -> None:
+        """Test RetryPolicy validates its parameters."""
+        with pytest.raises(TypeError):
+            RetryPolicy("3")  # type: ignore
+
+        with pytest.raises(ValueError):
+            RetryPolicy(0)
+
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=-1)
+
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=2, max_delay=1)
+
+        with pytest.raises(ValueError):
+            RetryPolicy(deadline=0)
+
+    def test_retry_policy_no_deadline(self) -> None:
+        """Test RetryPolicy allows disabling the deadline."""
+        assert RetryPolicy(deadline=None).deadline is None
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            aiohttp.ServerDisconnectedError(),
+            aiohttp.ClientOSError(104, "Connection reset by peer"),
+            asyncio.TimeoutError(),
+            HTTPError(500, "Internal Server Error"),
+            HTTPError(503, "Service Unavailable"),
+            TooManyRequestsError("Too Many Requests"),
+        ],
+    )
+    def test_retry_policy_transient(self, exc: BaseException) -> None:
+        """Test RetryPolicy treats transient failures as retryable."""
+        assert RetryPolicy.is_transient(exc) is True
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            BadRequestError("Bad Request"),
+            NotFoundError("Not Found"),
+            ValueError("Invalid"),
+        ],
+    )
+    def test_retry_policy_not_transient(self, exc: BaseException) -> None:
+        """Test RetryPolicy does not retry permanent failures."""
+        assert RetryPolicy.is_transient(exc) is False
+
+    def test_retry_policy_backoff_full_jitter(self) -> None:
+        """Test RetryPolicy backoff is jittered below an exponential ceiling."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+
+        for attempt, ceiling in enumerate((1.0, 2.0, 4.0, 4.0)):
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
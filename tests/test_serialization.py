@@ -0,0 +1,127 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for pluggable JSON encoding and decoding."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from ravyapi.api.models import GetGuildResponse, GetUserResponse
+from ravyapi.serialization import JSONCodec
+
+
+class TestJSONCodec:
+    """Test cases for the JSONCodec class."""
+
+    def test_json_codec_invalid_parameters(self) -> None:
+        """Test JSONCodec validates its parameters."""
+        with pytest.raises(TypeError):
+            JSONCodec(loads="loads")  # type: ignore
+
+        with pytest.raises(TypeError):
+            JSONCodec(dumps=1)  # type: ignore
+
+        with pytest.raises(TypeError):
+            JSONCodec(typed=1)  # type: ignore
+
+    def test_json_codec_custom_functions(self) -> None:
+        """Test JSONCodec uses the functions it is given."""
+        codec = JSONCodec(json.loads, json.dumps)
+
+        assert codec.loads is json.loads
+        assert codec.dumps is json.dumps
+
+    def test_json_codec_falls_back_to_stdlib(self) -> None:
+        """Test JSONCodec uses the standard library without orjson."""
+        with patch("ravyapi.serialization.orjson", None), patch(
+            "ravyapi.serialization.msgspec", None
+        ):
+            codec = JSONCodec()
+
+        assert codec.loads is json.loads
+        assert codec.dumps is json.dumps
+
+    def test_json_codec_detected_functions_round_trip(self) -> None:
+        """Test the detected functions decode bytes and encode to strings."""
+        codec = JSONCodec()
+        data = {"isFraudulent": False, "message": "Ünïcode"}
+
+        encoded = codec.dumps(data)
+
+        assert isinstance(encoded, str)
+        assert codec.loads(encoded.encode()) == data
+        assert codec.loads(encoded) == data
+
+    def test_json_codec_uses_msgspec_without_orjson(self) -> None:
+        """Test JSONCodec decodes with a reusable msgspec decoder without orjson."""
+        msgspec = pytest.importorskip("msgspec")
+
+        with patch("ravyapi.serialization.orjson", None):
+            codec = JSONCodec()
+
+        assert isinstance(codec.loads.__self__, msgspec.json.Decoder)  # type: ignore
+        assert codec.loads(b'{"pronouns": "they/them"}') == {"pronouns": "they/them"}
+        assert codec.dumps({"message": "ok"}) == '{"message":"ok"}'
+
+    def test_json_codec_typed_requires_msgspec(self) -> None:
+        """Test typed decoding is refused without msgspec."""
+        with patch("ravyapi.serialization.msgspec", None):
+            with pytest.raises(ImportError):
+                JSONCodec(typed=True)
+
+    def test_json_codec_untyped_has_no_decoders(self) -> None:
+        """Test JSONCodec has no model decoders unless typed."""
+        codec = JSONCodec()
+
+        assert not codec.typed
+        assert codec.decoder(GetUserResponse) is None
+
+    def test_json_codec_typed_decodes_into_models(self) -> None:
+        """Test a typed JSONCodec decodes user responses straight into models."""
+        pytest.importorskip("msgspec")
+        codec = JSONCodec(typed=True)
+        data: dict[str, Any] = {
+            "pronouns": "they/them",
+            "trust": {"level": 4, "label": "Trusted"},
+            "whitelists": [{"provider": "ravy", "reason": "STAFF"}],
+            "bans": [
+                {
+                    "provider": "ravy",
+                    "reason": "Spam",
+                    "reason_key": "spam",
+                    "moderator": "123",
+                }
+            ],
+            "rep": [{"provider": "ravy", "score": 0.5, "upvotes": 2}],
+            "sentinel": {"verified": True, "id": "abc", "isSentinel": False},
+        }
+
+        decoder = codec.decoder(GetUserResponse)
+        assert decoder is not None
+        assert codec.decoder(GetUserResponse) is decoder
+        assert codec.decoder(GetGuildResponse) is None
+
+        user = decoder(json.dumps(data).encode())
+
+        assert codec.typed
+        assert isinstance(user, GetUserResponse)
+        assert user.bans[0].moderator == 123
+        assert user.rep[0].downvotes is None
+        assert user.sentinel.internal_id == "abc"
+        del data["sentinel"]["isSentinel"]
+        assert user.data == data
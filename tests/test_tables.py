@@ -0,0 +1,134 @@
+# Copyright 2022-Present GoogolGenius
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for columnar tables of model responses."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ravyapi.api.errors import NotFoundError
+from ravyapi.api.models import (
+    GetBansResponse,
+    GetKSoftBanResponse,
+    GetReputationResponse,
+    GetUserResponse,
+)
+from ravyapi.tables import (
+    ban_columns,
+    ksoft_ban_columns,
+    reputation_columns,
+    to_arrow,
+    to_pandas,
+)
+
+BAN = {"provider": "ravy", "reason": "Spam", "moderator": "1", "reason_key": "spam"}
+TRUST = {"level": 2, "label": "Suspicious"}
+
+
+class TestColumns:
+    """Test cases for the column functions."""
+
+    def test_ban_columns(self) -> None:
+        """Test ban_columns has a row per ban and skips errors."""
+        user = GetUserResponse(
+            {
+                "pronouns": "",
+                "trust": TRUST,
+                "whitelists": [],
+                "bans": [BAN],
+                "rep": [],
+                "sentinel": {"verified": False, "id": "1"},
+            }
+        )
+        results = {
+            1: GetBansResponse(
+                {"trust": TRUST, "bans": [BAN, {**BAN, "provider": "x"}]}
+            ),
+            2: NotFoundError("Not found"),
+            3: user,
+            4: GetBansResponse({"trust": {"level": 3, "label": "Neutral"}, "bans": []}),
+        }
+
+        columns = ban_columns(results)
+
+        assert columns["user_id"] == [1, 1, 3]
+        assert columns["provider"] == ["ravy", "x", "ravy"]
+        assert columns["reason_key"] == ["spam", "spam", "spam"]
+        assert columns["moderator"] == [1, 1, 1]
+        assert columns["trust_level"] == [2, 2, 2]
+        assert columns["trust_label"] == ["Suspicious"] * 3
+
+    def test_reputation_columns(self) -> None:
+        """Test reputation_columns has a row per reputation entry."""
+        results = {
+            1: GetReputationResponse(
+                {
+                    "trust": TRUST,
+                    "rep": [
+                        {"provider": "a", "score": 0.5, "upvotes": 2},
+                        {"provider": "b", "score": 0.1},
+                    ],
+                }
+            ),
+            2: NotFoundError("Not found"),
+        }
+
+        columns = reputation_columns(results)
+
+        assert columns["user_id"] == [1, 1]
+        assert columns["score"] == [0.5, 0.1]
+        assert columns["upvotes"] == [2, None]
+        assert columns["trust_level"] == [2, 2]
+
+    def test_ksoft_ban_columns(self) -> None:
+        """Test ksoft_ban_columns has a row per lookup."""
+        results = {
+            1: GetKSoftBanResponse({"found": True, "id": "1", "reason": "Raid"}),
+            2: GetKSoftBanResponse({"found": False}),
+            3: NotFoundError("Not found"),
+        }
+
+        columns = ksoft_ban_columns(results)
+
+        assert columns["user_id"] == [1, 2]
+        assert columns["found"] == [True, False]
+        assert columns["reason"] == ["Raid", None]
+
+
+class TestConversions:
+    """Test cases for converting tables to data frame libraries."""
+
+    def test_to_pandas(self) -> None:
+        """Test to_pandas builds a DataFrame from the columns."""
+        pandas = MagicMock()
+
+        with patch.dict(sys.modules, {"pandas": pandas}):
+            to_pandas({"user_id": [1]})
+
+        pandas.DataFrame.assert_called_once_with({"user_id": [1]})
+
+    def test_to_pandas_without_pandas(self) -> None:
+        """Test to_pandas raises ImportError without pandas."""
+        with patch.dict(sys.modules, {"pandas": None}):
+            with pytest.raises(ImportError, match="pandas"):
+                to_pandas({"user_id": [1]})
+
+    def test_to_arrow_without_pyarrow(self) -> None:
+        """Test to_arrow raises ImportError without pyarrow."""
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pyarrow"):
+                to_arrow({"user_id": [1]})
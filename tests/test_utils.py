@@ -15,13 +15,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import gc
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from ravyapi.api.errors import AccessError
+from ravyapi.api.errors import AccessError, NotFoundError
 from ravyapi.http import HTTPAwareEndpoint
-from ravyapi.utils import has_permissions, with_permission_check
+from ravyapi.utils import (
+    gather_bounded,
+    has_permissions,
+    iter_bounded,
+    with_permission_check,
+)
 
 
 class TestHasPermissions:
@@ -97,6 +105,84 @@ class TestHasPermissions:
 
         assert has_permissions(required, permissions) is False
 
+    def test_has_permissions_accepts_sets(self) -> None:
+        """Test has_permissions matches parent scopes in a frozenset."""
+        permissions = frozenset({"users", "avatars.check"})
+
+        assert has_permissions("users.bans.read", permissions) is True
+        assert has_permissions("avatars", permissions) is False
+        assert has_permissions("avatars.check.deep", permissions) is True
+
+
+class TestGatherBounded:
+    """Test cases for the gather_bounded function."""
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_collects_http_errors(self) -> None:
+        """Test gather_bounded stores HTTP errors in place of results."""
+
+        async def function(key: int) -> int:
+            if key % 2:
+                raise NotFoundError("Not found")
+            return key * 10
+
+        result = await gather_bounded([0, 1, 2], function, 2)
+
+        assert result[0] == 0
+        assert isinstance(result[1], NotFoundError)
+        assert result[2] == 20
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_propagates_other_errors(self) -> None:
+        """Test gather_bounded propagates non-HTTP exceptions."""
+
+        async def function(key: int) -> int:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await gather_bounded([0, 1], function, 1)
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_only_creates_concurrency_tasks(self) -> None:
+        """Test gather_bounded runs a fixed pool of tasks however many keys are passed."""
+        started = asyncio.all_tasks()
+        peak = 0
+
+        async def function(key: int) -> int:
+            nonlocal peak
+            peak = max(peak, len(asyncio.all_tasks() - started))
+            await asyncio.sleep(0)
+            return key
+
+        result = await gather_bounded(range(1000), function, 4)
+
+        assert list(result) == list(range(1000))
+        assert peak == 4
+
+
+class TestIterBounded:
+    """Test cases for the iter_bounded function."""
+
+    @pytest.mark.asyncio
+    async def test_iter_bounded_retrieves_exceptions_of_finished_calls(self) -> None:
+        """Test every finished call has its exception retrieved when one fails."""
+        unretrieved: list[dict[str, Any]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+
+        async def function(key: int) -> int:
+            raise RuntimeError(key)
+
+        with pytest.raises(RuntimeError):
+            async for _ in iter_bounded([0, 1, 2], function, 3):
+                pass
+
+        await asyncio.sleep(0)
+        gc.collect()
+        loop.set_exception_handler(None)
+
+        assert unretrieved == []
+
 
 class TestWithPermissionCheck:
     """Test cases for the with_permission_check decorator."""
@@ -244,3 +330,31 @@ class TestWithPermissionCheck:
             await test_method(mock_endpoint)
 
         mock_http.get_permissions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_with_permission_check_rechecks_replaced_permissions(self) -> None:
+        """Test the remembered decision is only reused for the same permissions."""
+        mock_http = MagicMock()
+        mock_http.get_permissions = AsyncMock()
+        mock_http.permissions = ["users.read"]
+
+        mock_endpoint = MagicMock(spec=HTTPAwareEndpoint)
+        mock_endpoint._http = mock_http
+
+        @with_permission_check("users.read")
+        async def test_method(self: HTTPAwareEndpoint) -> str:
+            return "success"
+
+        with patch(
+            "ravyapi.utils.has_permissions", wraps=has_permissions
+        ) as mock_has_permissions:
+            assert await test_method(mock_endpoint) == "success"
+            assert await test_method(mock_endpoint) == "success"
+            assert mock_has_permissions.call_count == 1
+
+            mock_http.permissions = ["avatars"]
+
+            with pytest.raises(AccessError):
+                await test_method(mock_endpoint)
+
+            assert mock_has_permissions.call_count == 2